@@ -0,0 +1,32 @@
+"""add blade aero surface table
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, Sequence[str], None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'bladeaerosurface',
+        sa.Column('design_key', sa.String(), nullable=False),
+        sa.Column('tsr', sa.LargeBinary(), nullable=False),
+        sa.Column('pitch_deg', sa.LargeBinary(), nullable=False),
+        sa.Column('cp', sa.LargeBinary(), nullable=False),
+        sa.Column('ct', sa.LargeBinary(), nullable=False),
+        sa.Column('build_s', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('design_key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('bladeaerosurface')
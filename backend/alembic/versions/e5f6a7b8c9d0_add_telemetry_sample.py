@@ -0,0 +1,38 @@
+"""add telemetry sample table
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'telemetrysample',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('turbine_id', sa.Integer(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.Column('output_mw', sa.Float(), nullable=False),
+        sa.Column('wind_speed_mps', sa.Float(), nullable=True),
+        sa.Column('wind_direction_deg', sa.Float(), nullable=True),
+        sa.Column('rotor_rpm', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['turbine_id'], ['turbine.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    with op.batch_alter_table('telemetrysample', schema=None) as batch_op:
+        batch_op.create_index('ix_telemetrysample_turbine_id_timestamp', ['turbine_id', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('telemetrysample', schema=None) as batch_op:
+        batch_op.drop_index('ix_telemetrysample_turbine_id_timestamp')
+    op.drop_table('telemetrysample')
@@ -1,4 +1,5 @@
 import os
+from dataclasses import dataclass, replace
 
 
 def _get_database_url() -> str:
@@ -12,4 +13,132 @@ def _get_database_url() -> str:
     return url
 
 
+def _get_async_database_url(url: str) -> str:
+    # Same database through an asyncio driver: aiosqlite for SQLite, asyncpg for PostgreSQL.
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql+psycopg2://"):
+        return url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    return url
+
+
 DATABASE_URL = _get_database_url()
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _get_async_database_url(DATABASE_URL)
+
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """Connection-pool and driver tuning applied to both the sync and async engine.
+
+    The sqlite_* settings are ignored for other dialects; the pool settings
+    are ignored for in-memory SQLite, which uses a single shared connection.
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout_s: float = 30.0
+    pool_recycle_s: int = -1
+    pool_pre_ping: bool = True
+    # Compiled-statement cache entries per engine (SQLAlchemy query_cache_size).
+    statement_cache_size: int = 500
+    sqlite_wal: bool = True
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_busy_timeout_ms: int = 5000
+    # Debugging only: log every statement, and/or its execution time.
+    echo: bool = False
+    log_timing: bool = False
+    # With log_timing, only statements slower than this are logged.
+    slow_statement_ms: float = 0.0
+
+
+ENGINE_PROFILES = {
+    "default": EngineProfile(),
+    # SQLite's own defaults: rollback journal, fsync on every commit, no mmap.
+    "durable": EngineProfile(sqlite_wal=False, sqlite_synchronous="FULL", sqlite_mmap_size=0),
+    "debug": EngineProfile(echo=True, log_timing=True),
+}
+
+
+def _get_engine_profile() -> EngineProfile:
+    name = os.getenv("DB_PROFILE", "default")
+    if name not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown DB_PROFILE {name!r}; expected one of {sorted(ENGINE_PROFILES)}")
+    base = ENGINE_PROFILES[name]
+    overrides: dict = {}
+    for field, env, cast in (
+        ("pool_size", "DB_POOL_SIZE", int),
+        ("max_overflow", "DB_MAX_OVERFLOW", int),
+        ("pool_timeout_s", "DB_POOL_TIMEOUT_S", float),
+        ("pool_recycle_s", "DB_POOL_RECYCLE_S", int),
+        ("statement_cache_size", "DB_STATEMENT_CACHE_SIZE", int),
+        ("sqlite_synchronous", "DB_SQLITE_SYNCHRONOUS", str.upper),
+        ("sqlite_mmap_size", "DB_SQLITE_MMAP_SIZE", int),
+        ("sqlite_busy_timeout_ms", "DB_SQLITE_BUSY_TIMEOUT_MS", int),
+        ("slow_statement_ms", "DB_SLOW_STATEMENT_MS", float),
+    ):
+        value = os.getenv(env)
+        if value is not None:
+            overrides[field] = cast(value)
+    for field, env in (
+        ("pool_pre_ping", "DB_POOL_PRE_PING"),
+        ("sqlite_wal", "DB_SQLITE_WAL"),
+        ("echo", "DB_ECHO"),
+        ("log_timing", "DB_LOG_TIMING"),
+    ):
+        overrides[field] = _env_bool(env, getattr(base, field))
+    return replace(base, **overrides)
+
+
+ENGINE_PROFILE = _get_engine_profile()
+
+# Serve requests through the async engine. The sync engine is always created
+# for Alembic, startup seeding and background writers.
+DB_ASYNC = _env_bool("DB_ASYNC", False)
+
+# Worker processes for CPU-bound farm computations (AEP sweeps etc.).
+# 1 runs everything in-process.
+PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", str(os.cpu_count() or 1)))
+
+# Write-behind buffer for PATCH /api/turbines/{id}/output: dirty values are
+# flushed every OUTPUT_FLUSH_INTERVAL_S seconds, or as soon as
+# OUTPUT_FLUSH_MAX_PENDING turbines are dirty.
+OUTPUT_FLUSH_INTERVAL_S = float(os.getenv("OUTPUT_FLUSH_INTERVAL_S", "1.0"))
+OUTPUT_FLUSH_MAX_PENDING = int(os.getenv("OUTPUT_FLUSH_MAX_PENDING", "1000"))
+
+# Read-through cache for Turbine and component rows (see services/entity_cache.py).
+ENTITY_CACHE_ENABLED = os.getenv("ENTITY_CACHE_ENABLED", "1").lower() not in ("0", "false", "no")
+ENTITY_CACHE_TTL_S = float(os.getenv("ENTITY_CACHE_TTL_S", "300"))
+ENTITY_CACHE_MAXSIZE = int(os.getenv("ENTITY_CACHE_MAXSIZE", "10000"))
+
+# BEM Cp/Ct surfaces (see services/bem.py). They are keyed by blade design and
+# never go stale, so there is no TTL.
+AERO_SURFACE_CACHE_MAXSIZE = int(os.getenv("AERO_SURFACE_CACHE_MAXSIZE", "256"))
+
+# In-memory grid index over turbine positions (see services/spatial.py).
+# Cells are SPATIAL_CELL_DEG degrees on a side; the index is rebuilt from the
+# database after SPATIAL_INDEX_TTL_S to pick up writes made by other workers.
+SPATIAL_CELL_DEG = float(os.getenv("SPATIAL_CELL_DEG", "0.05"))
+SPATIAL_INDEX_TTL_S = float(os.getenv("SPATIAL_INDEX_TTL_S", "300"))
+
+# Background layout optimisation jobs (see services/layout.py). Jobs live in
+# the process that started them; the most recent LAYOUT_JOB_HISTORY finished
+# jobs are kept for polling. At shutdown running jobs are cancelled and given
+# LAYOUT_SHUTDOWN_TIMEOUT_S to finish their current batch before the process
+# pool is shut down.
+LAYOUT_MAX_RUNNING_JOBS = int(os.getenv("LAYOUT_MAX_RUNNING_JOBS", "2"))
+LAYOUT_JOB_HISTORY = int(os.getenv("LAYOUT_JOB_HISTORY", "20"))
+LAYOUT_SHUTDOWN_TIMEOUT_S = float(os.getenv("LAYOUT_SHUTDOWN_TIMEOUT_S", "30"))
+
+# Debug-only per-request SQL profiler (see app/profiler.py).
+SQL_PROFILER = _env_bool("SQL_PROFILER", False)
+SQL_PROFILER_HISTORY = int(os.getenv("SQL_PROFILER_HISTORY", "50"))
+SQL_PROFILER_REPEAT_THRESHOLD = int(os.getenv("SQL_PROFILER_REPEAT_THRESHOLD", "3"))
@@ -1,10 +1,124 @@
-from typing import Generator
+import logging
+import threading
+import time
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, List, TypeVar, Union
 
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.config import DATABASE_URL
+from app.config import ASYNC_DATABASE_URL, DATABASE_URL, DB_ASYNC, ENGINE_PROFILE, EngineProfile
 
-engine = create_engine(DATABASE_URL, echo=True)
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    u = make_url(url)
+    return u.get_backend_name() == "sqlite" and u.database in (None, "", ":memory:")
+
+
+def engine_options(url: str, profile: EngineProfile) -> dict:
+    """``create_engine`` keyword arguments for ``profile``."""
+    options: dict = {
+        "echo": profile.echo,
+        "pool_pre_ping": profile.pool_pre_ping,
+        "query_cache_size": profile.statement_cache_size,
+    }
+    if not _is_memory_sqlite(url):
+        options.update(
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout_s,
+            pool_recycle=profile.pool_recycle_s,
+        )
+    return options
+
+
+def _install_sqlite_pragmas(engine: Engine, profile: EngineProfile) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if profile.sqlite_wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={profile.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA mmap_size={int(profile.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(profile.sqlite_busy_timeout_ms)}")
+        cursor.close()
+
+
+# Called after every statement as listener(statement, elapsed_s, executemany).
+StatementListener = Callable[[str, float, bool], None]
+_statement_listeners: Dict[Engine, List[StatementListener]] = {}
+_listeners_lock = threading.Lock()
+
+
+def on_statement(engine: Engine, listener: StatementListener) -> None:
+    """Subscribe ``listener`` to the statements run on ``engine`` (idempotent per listener).
+
+    The engine gets one pair of cursor hooks and one timer, whatever the
+    number of subscribers (slow-statement log, metrics, SQL profiler).
+    """
+    with _listeners_lock:
+        listeners = _statement_listeners.get(engine)
+        if listeners is None:
+            listeners = _statement_listeners[engine] = []
+            _install_statement_hooks(engine, listeners)
+        if listener not in listeners:
+            listeners.append(listener)
+
+
+def _install_statement_hooks(engine: Engine, listeners: List[StatementListener]) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        for listener in listeners:
+            listener(statement, elapsed, executemany)
+
+
+def _install_statement_timing(engine: Engine, profile: EngineProfile) -> None:
+    # Like ``echo``, make sure the output is visible without extra logging setup.
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+
+    def _log_slow(statement: str, elapsed: float, executemany: bool) -> None:
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms >= profile.slow_statement_ms:
+            logger.info("%.2f ms  %s", elapsed_ms, " ".join(statement.split()))
+
+    on_statement(engine, _log_slow)
+
+
+def configure_engine(engine: Engine, profile: EngineProfile) -> Engine:
+    """Attach the profile's connect-time pragmas and timing hooks to a sync engine."""
+    if engine.dialect.name == "sqlite":
+        _install_sqlite_pragmas(engine, profile)
+    if profile.log_timing:
+        _install_statement_timing(engine, profile)
+    return engine
+
+
+def make_engine(url: str = DATABASE_URL, profile: EngineProfile = ENGINE_PROFILE) -> Engine:
+    return configure_engine(create_engine(url, **engine_options(url, profile)), profile)
+
+
+def make_async_engine(url: str = ASYNC_DATABASE_URL, profile: EngineProfile = ENGINE_PROFILE) -> AsyncEngine:
+    async_engine = create_async_engine(url, **engine_options(url, profile))
+    configure_engine(async_engine.sync_engine, profile)
+    return async_engine
+
+
+engine = make_engine()
+async_engine = make_async_engine() if DB_ASYNC else None
 
 
 def create_db_and_tables():
@@ -14,3 +128,34 @@ def create_db_and_tables():
 def get_session() -> Generator[Session, None, None]:
     with Session(engine) as session:
         yield session
+
+
+class Database:
+    """Request-scoped handle for running service functions from ``async def`` routes.
+
+    Service functions take a sync ``Session`` as their first argument. With
+    DB_ASYNC they run through ``AsyncSession.run_sync``, so every statement is
+    awaited on the event loop via aiosqlite/asyncpg; otherwise they run in the
+    threadpool against the sync engine.
+    """
+
+    def __init__(self, session: Union[Session, AsyncSession]):
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if isinstance(self.session, AsyncSession):
+            return await self.session.run_sync(fn, *args, **kwargs)
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+
+async def get_db() -> AsyncGenerator[Database, None]:
+    if async_engine is not None:
+        # Rows must stay readable after commit without an implicit (sync) refresh.
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield Database(session)
+    else:
+        session = Session(engine)
+        try:
+            yield Database(session)
+        finally:
+            await run_in_threadpool(session.close)
@@ -0,0 +1,220 @@
+"""Process-local request and database metrics in the Prometheus text format.
+
+A small self-contained implementation (counters, gauges and histograms with
+labels) so the API does not need ``prometheus_client``. ``MetricsMiddleware``
+records per-route latency, status codes, response sizes and in-flight
+requests; ``instrument_engine`` subscribes to each engine's statement timer
+(``database.on_statement``) so every request also reports how many
+statements it ran and how long they took.
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.engine import Engine
+
+from app import database
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Exposition lines for every label set; called with the lock held."""
+
+    def render(self) -> str:
+        with self._lock:
+            samples = self._samples()
+        header = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        return "\n".join(header + samples)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_labels(self.labelnames, k)} {_number(v)}" for k, v in sorted(self._values.items())]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            counts = state[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total, n) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, c in zip(self.buckets, counts):
+                cumulative += c
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {n}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route template and status code.", ("method", "route", "status")))
+http_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency, including streaming the body.", ("method", "route")))
+http_response_size = registry.register(Histogram(
+    "http_response_size_bytes", "HTTP response body size.", ("method", "route"), SIZE_BUCKETS))
+http_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ("method",)))
+request_queries = registry.register(Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request.", ("method", "route"), QUERY_COUNT_BUCKETS))
+request_query_time = registry.register(Histogram(
+    "http_request_db_duration_seconds", "Time spent executing SQL per HTTP request.", ("method", "route")))
+db_queries = registry.register(Counter(
+    "db_queries_total", "SQL statements executed (executemany counts once).", ("engine",)))
+db_query_time = registry.register(Histogram(
+    "db_query_duration_seconds", "Execution time of single SQL statements.", ("engine",)))
+
+
+class QueryStats:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+# Set by the middleware for the duration of a request. Threadpool calls and
+# AsyncSession.run_sync both run with a copy of the request's context, so
+# they see (and mutate) the same QueryStats object.
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+_instrumented: set[int] = set()
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Count and time every statement on ``engine`` (a sync engine or ``AsyncEngine.sync_engine``; idempotent)."""
+    if id(engine) in _instrumented:
+        return
+    _instrumented.add(id(engine))
+
+    def _observe(statement: str, elapsed: float, executemany: bool) -> None:
+        db_queries.inc(name)
+        db_query_time.observe(elapsed, name)
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+
+    database.on_statement(engine, _observe)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, so streamed bodies are measured to their last chunk."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        status, size = 500, 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        http_in_flight.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_in_flight.dec(method)
+            current_query_stats.reset(token)
+            # The route template, not the raw path, keeps label cardinality bounded.
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            http_requests.inc(method, route, str(status))
+            http_duration.observe(elapsed, method, route)
+            http_response_size.observe(size, method, route)
+            request_queries.observe(stats.count, method, route)
+            request_query_time.observe(stats.seconds, method, route)
@@ -3,5 +3,8 @@ from app.models.parameter import TurbineParameter
 from app.models.gearbox import Gearbox
 from app.models.generator import Generator
 from app.models.blade import Blade
+from app.models.telemetry import TelemetrySample
+from app.models.app_meta import AppMeta
+from app.models.blade_aero_surface import BladeAeroSurface
 
-__all__ = ["Turbine", "TurbineParameter", "Gearbox", "Generator", "Blade"]
+__all__ = ["Turbine", "TurbineParameter", "Gearbox", "Generator", "Blade", "TelemetrySample", "AppMeta", "BladeAeroSurface"]
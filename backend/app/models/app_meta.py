@@ -0,0 +1,8 @@
+from sqlmodel import Field, SQLModel
+
+
+class AppMeta(SQLModel, table=True):
+    """Key/value markers the application keeps about its own database (e.g. seed version)."""
+
+    key: str = Field(primary_key=True)
+    value: str
@@ -0,0 +1,16 @@
+from sqlmodel import Field, SQLModel
+
+
+class BladeAeroSurface(SQLModel, table=True):
+    """Precomputed BEM Cp(λ, β) / Ct(λ, β) surface for one blade design.
+
+    Grids and surfaces are little-endian float64 arrays; ``cp`` and ``ct``
+    are row-major with shape (len(tsr), len(pitch_deg)).
+    """
+
+    design_key: str = Field(primary_key=True)   # hash of the Blade aero columns + solver version
+    tsr: bytes
+    pitch_deg: bytes
+    cp: bytes
+    ct: bytes
+    build_s: float
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class TelemetrySample(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_telemetrysample_turbine_id_timestamp", "turbine_id", "timestamp"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    turbine_id: int = Field(foreign_key="turbine.id")
+    timestamp: datetime
+    output_mw: float
+    wind_speed_mps: Optional[float] = Field(default=None)
+    wind_direction_deg: Optional[float] = Field(default=None)  # direction the wind blows from
+    rotor_rpm: Optional[float] = Field(default=None)
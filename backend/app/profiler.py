@@ -0,0 +1,203 @@
+"""Debug-mode SQL profiler.
+
+With ``SQL_PROFILER=1`` every HTTP request records each statement it runs,
+with its duration and the application call site that issued it. Statements
+are grouped by shape (the SQL text; parameters are bound separately), and a
+shape that runs ``SQL_PROFILER_REPEAT_THRESHOLD`` or more times in one request
+is reported as a likely N+1 pattern. Each response gets ``X-SQL-Queries``,
+``X-SQL-Time-Ms`` and ``X-SQL-Repeated`` headers, and the last
+``SQL_PROFILER_HISTORY`` requests are served at ``/debug/last-requests``.
+
+``assert_max_queries`` works independently of the middleware, for tests.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from app import database
+from app.config import SQL_PROFILER_HISTORY, SQL_PROFILER_REPEAT_THRESHOLD
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SKIP_FILES = {os.path.abspath(__file__), os.path.join(_APP_DIR, "database.py"), os.path.join(_APP_DIR, "metrics.py")}
+
+
+def _call_site() -> Optional[str]:
+    """Innermost frame inside the application package that led to this statement."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_APP_DIR) and filename not in _SKIP_FILES:
+            return f"{os.path.relpath(filename, _ROOT)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _shape(statement: str) -> str:
+    return " ".join(statement.split())
+
+
+class StatementRecord:
+    __slots__ = ("sql", "duration_ms", "call_site", "executemany")
+
+    def __init__(self, sql: str, duration_ms: float, call_site: Optional[str], executemany: bool):
+        self.sql = sql
+        self.duration_ms = duration_ms
+        self.call_site = call_site
+        self.executemany = executemany
+
+    def as_dict(self) -> dict:
+        return {
+            "sql": self.sql,
+            "duration_ms": round(self.duration_ms, 3),
+            "call_site": self.call_site,
+            "executemany": self.executemany,
+        }
+
+
+class QueryLog:
+    """Statements captured for one request (or one ``assert_max_queries`` block)."""
+
+    def __init__(self, repeat_threshold: int = SQL_PROFILER_REPEAT_THRESHOLD):
+        self.repeat_threshold = repeat_threshold
+        self.statements: List[StatementRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: StatementRecord) -> None:
+        with self._lock:
+            self.statements.append(record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(s.duration_ms for s in self.statements)
+
+    def repeated(self) -> List[dict]:
+        """Statement shapes run at least ``repeat_threshold`` times, most frequent first."""
+        counts = Counter(s.sql for s in self.statements)
+        sites: dict[str, set] = {}
+        for s in self.statements:
+            sites.setdefault(s.sql, set()).add(s.call_site)
+        return [
+            {"sql": sql, "count": n, "call_sites": sorted(c for c in sites[sql] if c)}
+            for sql, n in counts.most_common()
+            if n >= self.repeat_threshold
+        ]
+
+    def summary(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_time_ms": round(self.total_ms, 3),
+            "repeated": self.repeated(),
+            "statements": [s.as_dict() for s in self.statements],
+        }
+
+    def report(self) -> str:
+        lines = [f"{self.count} statements, {self.total_ms:.2f} ms"]
+        lines += [f"  {s.duration_ms:8.3f} ms  {s.call_site or '?'}  {s.sql}" for s in self.statements]
+        return "\n".join(lines)
+
+
+_current: ContextVar[Optional[QueryLog]] = ContextVar("sql_profiler_log", default=None)
+# Summaries of the most recent requests, oldest first.
+history: deque = deque(maxlen=SQL_PROFILER_HISTORY)
+# Logs that capture every statement regardless of context (assert_max_queries).
+_global_logs: List[QueryLog] = []
+
+
+def instrument_app_engines() -> None:
+    instrument_engine(database.engine)
+    if database.async_engine is not None:
+        instrument_engine(database.async_engine.sync_engine)
+
+
+def _record(statement: str, elapsed: float, executemany: bool) -> None:
+    log = _current.get()
+    if log is None and not _global_logs:
+        return
+    record = StatementRecord(_shape(statement), elapsed * 1000, _call_site(), executemany)
+    if log is not None:
+        log.add(record)
+    for g in list(_global_logs):
+        g.add(record)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Subscribe the profiler to ``engine``'s statements (idempotent)."""
+    database.on_statement(engine, _record)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, engine: Optional[Engine] = None) -> Iterator[QueryLog]:
+    """Fail if the block runs more than ``max_queries`` statements.
+
+    Counts statements on ``engine`` (default: the application's engines) from
+    every thread, so it also sees requests made through ``TestClient``::
+
+        with assert_max_queries(2):
+            client.get("/api/turbines/1/gearbox")
+    """
+    if engine is not None:
+        instrument_engine(engine)
+    else:
+        instrument_app_engines()
+    log = QueryLog()
+    _global_logs.append(log)
+    try:
+        yield log
+    finally:
+        _global_logs.remove(log)
+    if log.count > max_queries:
+        raise AssertionError(f"expected at most {max_queries} queries, got {log.report()}")
+
+
+class ProfilerMiddleware:
+    """Collects a :class:`QueryLog` per request into :data:`history`."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        log = QueryLog()
+        token = _current.set(log)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # Statements issued while a body is streamed come after the headers.
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-sql-queries", str(log.count).encode()),
+                    (b"x-sql-time-ms", f"{log.total_ms:.3f}".encode()),
+                    (b"x-sql-repeated", str(len(log.repeated())).encode()),
+                ]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            history.append({
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(scope.get("route"), "path", None),
+                "status": status,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                **log.summary(),
+            })
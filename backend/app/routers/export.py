@@ -0,0 +1,52 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.services import export as export_service
+
+router = APIRouter(prefix="/api/export", tags=["export"])
+
+ExportFormat = Literal["ndjson", "csv"]
+
+
+def _stream(chunks, columns, fmt: ExportFormat, filename: str) -> StreamingResponse:
+    body = export_service.ndjson(chunks) if fmt == "ndjson" else export_service.csv_text(chunks, columns)
+    return StreamingResponse(
+        body,
+        media_type=export_service.FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
+
+
+# Plain ``def`` generators: Starlette iterates them in the threadpool, so the
+# database cursor never blocks the event loop.
+@router.get("/turbines")
+def export_turbines(
+    format: ExportFormat = Query("ndjson"),
+    components: bool = Query(True, description="Include the seven component records as <component>.<column>"),
+    wind_speed: Optional[float] = Query(None, ge=0, le=50, description="Add physics.* columns at this wind speed (m/s)"),
+):
+    return _stream(
+        export_service.turbine_rows(components, wind_speed),
+        export_service.turbine_columns(components, wind_speed),
+        format,
+        "turbines",
+    )
+
+
+@router.get("/physics-sweep")
+def export_physics_sweep(
+    format: ExportFormat = Query("ndjson"),
+    start: float = Query(0.0, ge=0, le=50),
+    stop: float = Query(30.0, ge=0, le=50),
+    step: float = Query(0.5, ge=0.01, le=50),
+):
+    if stop < start:
+        raise HTTPException(status_code=422, detail="stop must not be below start")
+    return _stream(
+        export_service.sweep_rows(start, stop, step),
+        export_service.SWEEP_COLUMNS,
+        format,
+        "physics-sweep",
+    )
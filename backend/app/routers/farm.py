@@ -0,0 +1,269 @@
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from app.database import Database, get_db
+from app.models.turbine import Turbine
+from app.schemas.farm import (
+    AepRequest,
+    AepResponse,
+    AeroModel,
+    CampbellResponse,
+    FarmWakeResponse,
+    LayoutJobRead,
+    LayoutOptimizationRequest,
+    MonteCarloAepRequest,
+    MonteCarloAepResponse,
+    PitchSimulationRequest,
+    PitchSimulationResponse,
+    SuperpositionRule,
+    WindRoseInput,
+    YawSimulationResponse,
+)
+from app.services import aep as aep_service
+from app.services import bem as bem_service
+from app.services import campbell as campbell_service
+from app.services import layout as layout_service
+from app.services import montecarlo as montecarlo_service
+from app.services import pitch as pitch_service
+from app.services import wake as wake_service
+from app.services import yaw as yaw_service
+
+router = APIRouter(prefix="/api/farm", tags=["farm"])
+
+
+async def _bem_aero(db: Database, turbines: Sequence[Turbine]) -> Tuple[List[bem_service.Surface], List[float]]:
+    """BEM surfaces and fine pitch per turbine; new blade designs are solved off the event loop."""
+    blades = await db.run(bem_service.get_blades, turbines)
+    lookup = await db.run(bem_service.find_surfaces, blades)
+    if lookup.missing:
+        await db.run(bem_service.store_surfaces, await run_in_threadpool(bem_service.solve_missing, lookup))
+    fine_pitch = await db.run(bem_service.fleet_fine_pitch, turbines)
+    return lookup.surfaces(), fine_pitch
+
+
+@router.get("/wake", response_model=FarmWakeResponse)
+async def get_farm_wake(
+    wind_speed: float = Query(..., ge=0, le=50, description="Free-stream wind speed in m/s"),
+    wind_direction: float = Query(..., ge=0, lt=360, description="Direction the wind blows from, degrees clockwise from north"),
+    superposition: SuperpositionRule = Query("rss", description="Deficit superposition rule"),
+    max_distance_m: Optional[float] = Query(None, gt=0, description="Ignore wakes beyond this distance (default 50 rotor diameters)"),
+    aero: AeroModel = Query("constant", description="Cp/Ct from the stored constants or the blades' BEM curves"),
+    db: Database = Depends(get_db),
+):
+    turbines, wakes = await db.run(wake_service.get_farm)
+    surfaces, fine_pitch = await _bem_aero(db, turbines) if aero == "bem" else (None, None)
+    # CPU-bound: keep it off the event loop.
+    return await run_in_threadpool(
+        wake_service.farm_wake, turbines, wakes, wind_speed, wind_direction, superposition, max_distance_m,
+        surfaces, fine_pitch,
+    )
+
+
+def _max_cut_out(turbines: Sequence[Turbine]) -> float:
+    return max((t.cut_out_wind_speed_mps for t in turbines), default=0.0)
+
+
+def _wind_rose(data: WindRoseInput, cut_out_mps: float) -> aep_service.WindRose:
+    """The request's wind rose; ``cut_out_mps`` is the highest cut-out speed it is used with."""
+    try:
+        if data.wind_rose is not None:
+            return aep_service.wind_rose_from_table(
+                data.wind_rose.directions_deg, data.wind_rose.speeds_mps, data.wind_rose.frequencies
+            )
+        if data.max_speed_mps < cut_out_mps:
+            raise ValueError(
+                f"max_speed_mps ({data.max_speed_mps:g}) must be at least the highest cut-out wind speed "
+                f"({cut_out_mps:g} m/s): wind above it is treated as a stopped rotor"
+            )
+        sectors = data.weibull_sectors
+        return aep_service.wind_rose_from_weibull(
+            [s.direction_deg for s in sectors],
+            [s.frequency for s in sectors],
+            [s.weibull_a for s in sectors],
+            [s.weibull_k for s in sectors],
+            bin_width_mps=data.speed_bin_width_mps,
+            max_speed_mps=data.max_speed_mps,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+@router.post("/aep", response_model=AepResponse)
+async def post_farm_aep(data: AepRequest, db: Database = Depends(get_db)):
+    turbines, wakes = await db.run(wake_service.get_farm)
+    rose = _wind_rose(data, _max_cut_out(turbines))
+    surfaces, fine_pitch = await _bem_aero(db, turbines) if data.aero == "bem" else (None, None)
+    return await run_in_threadpool(
+        aep_service.farm_aep, turbines, wakes, rose, data.superposition, data.max_distance_m, surfaces, fine_pitch
+    )
+
+
+@router.post("/aep/monte-carlo", response_model=MonteCarloAepResponse)
+async def post_farm_aep_monte_carlo(data: MonteCarloAepRequest, db: Database = Depends(get_db)):
+    turbines, wakes = await db.run(wake_service.get_farm)
+    rose = _wind_rose(data, _max_cut_out(turbines))
+    try:
+        return await run_in_threadpool(
+            montecarlo_service.farm_monte_carlo,
+            turbines,
+            wakes,
+            rose,
+            montecarlo_service.Uncertainty(**data.uncertainty.model_dump()),
+            data.samples,
+            data.seed,
+            data.superposition,
+            data.max_distance_m,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+@router.get("/campbell", response_model=CampbellResponse, response_model_exclude_none=True)
+async def get_campbell(
+    separation: float = Query(campbell_service.DEFAULT_SEPARATION, ge=0, lt=0.5, description="Required relative separation of f_n from 1P and 3P"),
+    curve_step: Optional[float] = Query(None, gt=0, le=5, description="Also return 1P/3P curves sampled every curve_step m/s"),
+    ids: Optional[List[int]] = Query(None, description="Restrict to these turbine ids"),
+    db: Database = Depends(get_db),
+):
+    turbines, towers = await db.run(campbell_service.get_fleet_towers, ids)
+    return campbell_service.fleet_campbell(turbines, towers, separation, curve_step)
+
+
+def _is_header(line: bytes) -> bool:
+    try:
+        float(line.split(b",")[0])
+    except ValueError:
+        return True
+    return False
+
+
+async def _csv_batches(stream: AsyncIterator[bytes], batch_size: int) -> AsyncIterator[List[bytes]]:
+    """Group non-empty CSV lines into batches without buffering the whole body; a header line is dropped."""
+    pending = b""
+    lines: List[bytes] = []
+    header_checked = False
+    async for chunk in stream:
+        pending += chunk
+        *complete, pending = pending.split(b"\n")
+        lines.extend(line for line in complete if line.strip())
+        if lines and not header_checked:
+            header_checked = True
+            if _is_header(lines[0]):
+                lines.pop(0)
+        while len(lines) >= batch_size:
+            yield lines[:batch_size]
+            lines = lines[batch_size:]
+    if pending.strip() and (header_checked or not _is_header(pending)):
+        lines.append(pending)
+    if lines:
+        yield lines
+
+
+def _parse_series(lines: List[bytes]) -> np.ndarray:
+    try:
+        return np.loadtxt(lines, delimiter=",", ndmin=2, dtype=np.float64)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=f"Invalid CSV: {exc}")
+
+
+@router.post("/yaw-simulation", response_model=YawSimulationResponse)
+async def post_yaw_simulation(
+    request: Request,
+    sample_interval: float = Query(1.0, gt=0, le=3600, description="Seconds between samples"),
+    filter_s: float = Query(yaw_service.DEFAULT_FILTER_S, ge=0, le=3600, description="Yaw controller's direction averaging window in seconds"),
+    wind_speed: Optional[float] = Query(None, ge=0, le=50, description="Constant wind speed, for a direction-only series"),
+    ids: Optional[List[int]] = Query(None, description="Restrict to these turbine ids"),
+    db: Database = Depends(get_db),
+):
+    """Simulate each turbine's yaw controller over a wind series streamed as CSV.
+
+    Rows are ``wind_direction_deg,wind_speed_mps``, or just
+    ``wind_direction_deg`` together with the ``wind_speed`` parameter; an
+    optional header line is skipped. The body is processed in chunks as it
+    arrives, so it can cover years of 1 Hz data.
+    """
+    turbines, yaw_systems = await db.run(yaw_service.get_fleet_yaw, ids)
+    sim = yaw_service.YawSimulation(turbines, yaw_systems, sample_interval, filter_s)
+    async for lines in _csv_batches(request.stream(), yaw_service.CHUNK_SAMPLES):
+        rows = await run_in_threadpool(_parse_series, lines)
+        if rows.shape[1] >= 2:
+            speed = rows[:, 1]
+        elif wind_speed is not None:
+            speed = wind_speed
+        else:
+            raise HTTPException(status_code=422, detail="Provide a wind_speed_mps column or the wind_speed parameter")
+        try:
+            await run_in_threadpool(sim.feed, rows[:, 0], speed)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+    return sim.result()
+
+
+@router.post("/pitch-simulation", response_model=PitchSimulationResponse, response_model_exclude_none=True)
+async def post_pitch_simulation(data: PitchSimulationRequest, db: Database = Depends(get_db)):
+    """Collective pitch regulation of every turbine through synthetic turbulence and an optional IEC gust."""
+    turbines, pitch_systems, blades = await db.run(pitch_service.get_fleet_pitch, data.turbine_ids)
+    gust = pitch_service.Gust(**data.gust.model_dump()) if data.gust is not None else None
+    try:
+        return await run_in_threadpool(
+            pitch_service.simulate,
+            turbines,
+            pitch_systems,
+            blades,
+            data.mean_wind_speed_mps,
+            data.turbulence_intensity,
+            data.duration_s,
+            data.time_step_s,
+            data.seed,
+            gust,
+            data.overspeed_threshold,
+            data.trace_points,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+@router.post("/layout-jobs", response_model=LayoutJobRead, status_code=202)
+async def post_layout_job(data: LayoutOptimizationRequest):
+    """Start a background layout optimisation; poll the returned job for progress and the result."""
+    rose = _wind_rose(data, data.turbine.cut_out_wind_speed_mps)
+    try:
+        return await run_in_threadpool(
+            layout_service.start_job,
+            rose,
+            [p.latitude for p in data.site_polygon],
+            [p.longitude for p in data.site_polygon],
+            data.turbine.model_dump(),
+            data.turbine_count,
+            data.min_spacing_diameters,
+            data.algorithm,
+            data.population_size,
+            data.generations,
+            data.refine_passes,
+            data.seed,
+            data.superposition,
+            data.max_distance_m,
+            data.name_prefix,
+            data.write_back,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+@router.get("/layout-jobs", response_model=List[LayoutJobRead])
+def list_layout_jobs():
+    return layout_service.list_jobs()
+
+
+@router.get("/layout-jobs/{job_id}", response_model=LayoutJobRead)
+def get_layout_job(job_id: str):
+    return layout_service.get_job(job_id)
+
+
+@router.delete("/layout-jobs/{job_id}", response_model=LayoutJobRead)
+def cancel_layout_job(job_id: str):
+    """Stop the job at its next batch boundary; nothing is written once cancelled."""
+    return layout_service.cancel_job(job_id)
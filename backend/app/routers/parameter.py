@@ -1,8 +1,7 @@
 from typing import List
 from fastapi import APIRouter, Depends
-from sqlmodel import Session
 
-from app.database import get_session
+from app.database import Database, get_db
 from app.schemas.parameter import TurbineParameterRead
 from app.services import parameter as parameter_service
 
@@ -10,5 +9,5 @@ router = APIRouter(prefix="/api/parameters", tags=["parameters"])
 
 
 @router.get("/", response_model=List[TurbineParameterRead])
-def list_parameters(session: Session = Depends(get_session)):
-    return parameter_service.get_parameters(session)
+async def list_parameters(db: Database = Depends(get_db)):
+    return await db.run(parameter_service.get_parameters)
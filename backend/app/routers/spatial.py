@@ -0,0 +1,63 @@
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.database import Database, get_db
+from app.schemas.spatial import SpatialQueryResponse
+from app.services import spatial as spatial_service
+from app.services import turbine as turbine_service
+
+router = APIRouter(prefix="/api/spatial", tags=["spatial"])
+
+
+async def _origin(
+    db: Database, latitude: Optional[float], longitude: Optional[float], turbine_id: Optional[int]
+) -> Tuple[float, float]:
+    if turbine_id is not None:
+        turbine = await db.run(turbine_service.get_turbine, turbine_id)
+        return turbine.latitude, turbine.longitude
+    if latitude is None or longitude is None:
+        raise HTTPException(status_code=422, detail="Pass either latitude and longitude, or turbine_id")
+    return latitude, longitude
+
+
+def _response(hits: list) -> dict:
+    return {"count": len(hits), "turbines": hits}
+
+
+@router.get("/nearest", response_model=SpatialQueryResponse)
+async def get_nearest(
+    latitude: Optional[float] = Query(None, ge=-90, le=90),
+    longitude: Optional[float] = Query(None, ge=-180, le=180),
+    turbine_id: Optional[int] = Query(None, description="Search around this turbine (excluded from the result)"),
+    k: int = Query(5, ge=1, le=1000),
+    db: Database = Depends(get_db),
+):
+    lat, lon = await _origin(db, latitude, longitude, turbine_id)
+    return _response(await db.run(spatial_service.nearest, lat, lon, k, exclude_id=turbine_id))
+
+
+@router.get("/radius", response_model=SpatialQueryResponse)
+async def get_within_radius(
+    radius_m: float = Query(..., gt=0, le=500_000),
+    latitude: Optional[float] = Query(None, ge=-90, le=90),
+    longitude: Optional[float] = Query(None, ge=-180, le=180),
+    turbine_id: Optional[int] = Query(None, description="Search around this turbine"),
+    db: Database = Depends(get_db),
+):
+    lat, lon = await _origin(db, latitude, longitude, turbine_id)
+    return _response(await db.run(spatial_service.within_radius, lat, lon, radius_m))
+
+
+@router.get("/bbox", response_model=SpatialQueryResponse)
+async def get_within_bbox(
+    min_lon: float = Query(..., ge=-180, le=180),
+    min_lat: float = Query(..., ge=-90, le=90),
+    max_lon: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    db: Database = Depends(get_db),
+):
+    # min_lon > max_lon is a box across the antimeridian.
+    if min_lat > max_lat:
+        raise HTTPException(status_code=422, detail="min_lat must not exceed max_lat")
+    return _response(await db.run(spatial_service.within_bbox, min_lon, min_lat, max_lon, max_lat))
@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+from app.database import Database, get_db
+from app.schemas.telemetry import TelemetryIn, TelemetryIngestResponse, TelemetryRead
+from app.services import telemetry as telemetry_service
+from app.services import turbine as turbine_service
+
+router = APIRouter(prefix="/api/telemetry", tags=["telemetry"])
+
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+_samples = TypeAdapter(List[TelemetryIn])
+
+
+def _parse(payload: bytes) -> List[TelemetryIn]:
+    try:
+        return _samples.validate_json(payload)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False))
+
+
+async def _ndjson_batches(stream: AsyncIterator[bytes], batch_size: int) -> AsyncIterator[List[bytes]]:
+    """Group non-empty NDJSON lines into batches without buffering the whole body."""
+    pending = b""
+    lines: List[bytes] = []
+    async for chunk in stream:
+        pending += chunk
+        *complete, pending = pending.split(b"\n")
+        lines.extend(line for line in complete if line.strip())
+        while len(lines) >= batch_size:
+            yield lines[:batch_size]
+            lines = lines[batch_size:]
+    if pending.strip():
+        lines.append(pending)
+    if lines:
+        yield lines
+
+
+def _batch_failed(status_code: int, error, accepted: int, batches: int) -> HTTPException:
+    return HTTPException(
+        status_code=status_code,
+        detail={"error": error, "committed_batches": batches, "accepted": accepted},
+    )
+
+
+@router.post("/", response_model=TelemetryIngestResponse)
+async def ingest_telemetry(request: Request, db: Database = Depends(get_db)):
+    """Bulk-ingest samples as a JSON array or an NDJSON stream.
+
+    A JSON array is written as one batch. NDJSON is written in batches of
+    ``BATCH_SIZE`` lines as they arrive, each batch in its own transaction.
+    If an NDJSON batch fails, the batches before it stay committed; the error
+    detail reports them as ``committed_batches`` and ``accepted``.
+    """
+    accepted = batches = 0
+    updated: set[int] = set()
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        async for lines in _ndjson_batches(request.stream(), telemetry_service.BATCH_SIZE):
+            try:
+                samples = _parse(b"[" + b",".join(lines) + b"]")
+                updated.update(await db.run(telemetry_service.ingest_batch, samples))
+            except RequestValidationError as exc:
+                raise _batch_failed(422, exc.errors(), accepted, batches)
+            except HTTPException as exc:
+                raise _batch_failed(exc.status_code, exc.detail, accepted, batches)
+            accepted += len(samples)
+            batches += 1
+    else:
+        samples = _parse(await request.body())
+        if samples:
+            updated.update(await db.run(telemetry_service.ingest_batch, samples))
+            accepted, batches = len(samples), 1
+    return {"accepted": accepted, "batches": batches, "turbines_updated": len(updated)}
+
+
+@router.get("/{turbine_id}", response_model=List[TelemetryRead])
+async def list_telemetry(
+    turbine_id: int,
+    start: Optional[datetime] = Query(None, description="Inclusive lower bound"),
+    end: Optional[datetime] = Query(None, description="Exclusive upper bound"),
+    limit: int = Query(1000, ge=1, le=100_000),
+    db: Database = Depends(get_db),
+):
+    await db.run(turbine_service.get_turbine, turbine_id)
+    return await db.run(telemetry_service.get_samples, turbine_id, start, end, limit)
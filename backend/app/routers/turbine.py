@@ -1,38 +1,145 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlmodel import Session
-
-from app.database import get_session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from app.schemas.turbine import TurbineCreate, TurbineRead, TurbineUpdate, TurbinePhysicsResponse
+from app.database import Database, get_db
+from app.schemas.turbine import (
+    FleetDrivetrainResponse,
+    FleetPhysicsRequest,
+    FleetPhysicsResponse,
+    PowerCurveResponse,
+    TurbineAeroResponse,
+    TurbineCreate,
+    TurbineDrivetrainResponse,
+    TurbineListItem,
+    TurbinePhysicsResponse,
+    TurbineRead,
+    TurbineUpdate,
+)
+from app.schemas.components import TurbineFullRead
+from app.services import bem as bem_service
+from app.services import components as component_service
+from app.services import drivetrain as drivetrain_service
 from app.services import turbine as turbine_service
 from app.services import physics as physics_service
+from app.services import power_curve as power_curve_service
+from app.services.output_buffer import output_buffer
 
 router = APIRouter(prefix="/api/turbines", tags=["turbines"])
 
-
-@router.get("/", response_model=List[TurbineRead])
-def list_turbines(session: Session = Depends(get_session)):
-    return turbine_service.get_turbines(session)
+MAX_GRID_POINTS = 500
+
+
+def _csv_floats(value: str, n: int, name: str) -> tuple:
+    try:
+        parts = tuple(float(p) for p in value.split(","))
+    except ValueError:
+        parts = ()
+    if len(parts) != n:
+        raise HTTPException(status_code=422, detail=f"{name} must be {n} comma-separated numbers")
+    return parts
+
+
+@router.get("/", response_model=List[TurbineListItem], response_model_exclude_unset=True)
+async def list_turbines(
+    request: Request,
+    response: Response,
+    cursor: Optional[int] = Query(None, description="Id of the last turbine on the previous page"),
+    limit: int = Query(turbine_service.DEFAULT_PAGE_SIZE, ge=1, le=turbine_service.MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return (id is always included)"),
+    name_prefix: Optional[str] = None,
+    min_capacity_mw: Optional[float] = None,
+    max_capacity_mw: Optional[float] = None,
+    bbox: Optional[str] = Query(None, description="min_lon,min_lat,max_lon,max_lat"),
+    db: Database = Depends(get_db),
+):
+    rows, next_cursor = await db.run(
+        turbine_service.list_turbines,
+        after_id=cursor,
+        limit=limit,
+        fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None,
+        name_prefix=name_prefix,
+        min_capacity_mw=min_capacity_mw,
+        max_capacity_mw=max_capacity_mw,
+        bbox=_csv_floats(bbox, 4, "bbox") if bbox else None,
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+        response.headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+    for row in rows:
+        if "current_output_mw" in row:
+            buffered = output_buffer.get(row["id"])
+            if buffered is not None:
+                row["current_output_mw"] = buffered
+    return rows
+
+
+# Fleet routes must be registered before "/{turbine_id}" so the literal path wins.
+@router.get("/physics", response_model=FleetPhysicsResponse)
+async def get_fleet_physics(
+    wind_speed: float = Query(..., ge=0, le=50, description="Wind speed in m/s"),
+    db: Database = Depends(get_db),
+):
+    turbines = await db.run(turbine_service.get_turbines)
+    return physics_service.compute_fleet(turbines, wind_speed)
+
+
+@router.post("/physics", response_model=FleetPhysicsResponse)
+async def post_fleet_physics(data: FleetPhysicsRequest, db: Database = Depends(get_db)):
+    turbines = await db.run(
+        turbine_service.get_turbines_by_ids,
+        data.wind_speeds,
+        include_all=data.default_wind_speed is not None,
+    )
+    speeds = [data.wind_speeds.get(t.id, data.default_wind_speed) for t in turbines]
+    return physics_service.compute_fleet(turbines, speeds)
+
+
+@router.get("/drivetrain", response_model=FleetDrivetrainResponse)
+async def get_fleet_drivetrain(
+    wind_speeds: str = Query(..., description="Comma-separated wind speeds in m/s"),
+    ids: Optional[List[int]] = Query(None, description="Restrict to these turbine ids"),
+    db: Database = Depends(get_db),
+):
+    try:
+        speeds = [float(p) for p in wind_speeds.split(",")]
+    except ValueError:
+        raise HTTPException(status_code=422, detail="wind_speeds must be comma-separated numbers")
+    if not 0 < len(speeds) <= MAX_GRID_POINTS or not all(0 <= v <= 50 for v in speeds):
+        raise HTTPException(status_code=422, detail=f"wind_speeds must be 1-{MAX_GRID_POINTS} values between 0 and 50")
+    if ids is None:
+        turbines = await db.run(turbine_service.get_turbines)
+    else:
+        turbines = await db.run(turbine_service.get_turbines_by_ids, ids)
+    coefficients = await db.run(drivetrain_service.get_coefficients, turbines)
+    return drivetrain_service.fleet_drivetrain(turbines, coefficients, speeds)
+
+
+@router.get("/full", response_model=List[TurbineFullRead])
+async def list_turbines_full(
+    ids: Optional[List[int]] = Query(None, description="Restrict to these turbine ids"),
+    db: Database = Depends(get_db),
+):
+    return await db.run(component_service.get_turbines_full, ids)
 
 
 @router.get("/{turbine_id}", response_model=TurbineRead)
-def get_turbine(turbine_id: int, session: Session = Depends(get_session)):
-    return turbine_service.get_turbine(session, turbine_id)
+async def get_turbine(turbine_id: int, db: Database = Depends(get_db)):
+    return output_buffer.overlay(await db.run(turbine_service.get_turbine, turbine_id))
 
 
 @router.post("/", response_model=TurbineRead, status_code=201)
-def create_turbine(data: TurbineCreate, session: Session = Depends(get_session)):
-    return turbine_service.create_turbine(session, data)
+async def create_turbine(data: TurbineCreate, db: Database = Depends(get_db)):
+    return await db.run(turbine_service.create_turbine, data)
 
 
 @router.put("/{turbine_id}", response_model=TurbineRead)
-def update_turbine(
-    turbine_id: int, data: TurbineUpdate, session: Session = Depends(get_session)
+async def update_turbine(
+    turbine_id: int, data: TurbineUpdate, db: Database = Depends(get_db)
 ):
-    return turbine_service.update_turbine(session, turbine_id, data)
+    return output_buffer.overlay(await db.run(turbine_service.update_turbine, turbine_id, data))
 
 
 class OutputUpdate(BaseModel):
@@ -40,23 +147,78 @@ class OutputUpdate(BaseModel):
 
 
 @router.patch("/{turbine_id}/output", response_model=TurbineRead)
-def update_turbine_output(
-    turbine_id: int, data: OutputUpdate, session: Session = Depends(get_session)
+async def update_turbine_output(
+    turbine_id: int, data: OutputUpdate, db: Database = Depends(get_db)
 ):
-    update = TurbineUpdate(current_output_mw=data.current_output_mw)
-    return turbine_service.update_turbine(session, turbine_id, update)
+    # Buffered and written in bulk by the flusher thread; see services/output_buffer.py.
+    turbine = await db.run(turbine_service.get_turbine, turbine_id)
+    output_buffer.put(turbine_id, data.current_output_mw)
+    return output_buffer.overlay(turbine)
 
 
 @router.get("/{turbine_id}/physics", response_model=TurbinePhysicsResponse)
-def get_turbine_physics(
+async def get_turbine_physics(
     turbine_id: int,
     wind_speed: float = Query(..., ge=0, le=50, description="Wind speed in m/s"),
-    session: Session = Depends(get_session),
+    db: Database = Depends(get_db),
 ):
-    turbine = turbine_service.get_turbine(session, turbine_id)
+    turbine = await db.run(turbine_service.get_turbine, turbine_id)
     return physics_service.compute(wind_speed, turbine)
 
 
+@router.get("/{turbine_id}/drivetrain", response_model=TurbineDrivetrainResponse)
+async def get_turbine_drivetrain(
+    turbine_id: int,
+    wind_speed: float = Query(..., ge=0, le=50, description="Wind speed in m/s"),
+    db: Database = Depends(get_db),
+):
+    turbine = await db.run(turbine_service.get_turbine, turbine_id)
+    [coefficients] = await db.run(drivetrain_service.get_coefficients, [turbine])
+    return drivetrain_service.turbine_drivetrain(turbine, coefficients, wind_speed)
+
+
+@router.get("/{turbine_id}/aero", response_model=TurbineAeroResponse, response_model_exclude_none=True)
+async def get_turbine_aero(
+    turbine_id: int,
+    curve_step: float = Query(0.5, gt=0, le=5, description="Operating-curve spacing in m/s"),
+    surface: bool = Query(False, description="Also return the full Cp/Ct(λ, β) surface"),
+    db: Database = Depends(get_db),
+):
+    turbine = await db.run(turbine_service.get_turbine, turbine_id)
+    [blade] = await db.run(bem_service.get_blades, [turbine])
+    lookup = await db.run(bem_service.find_surfaces, [blade])
+    if lookup.missing:
+        # About 0.4 s of CPU per new design: off the event loop and without a pooled connection.
+        await db.run(bem_service.store_surfaces, await run_in_threadpool(bem_service.solve_missing, lookup))
+    [aero] = lookup.surfaces()
+    [fine_pitch] = await db.run(bem_service.fleet_fine_pitch, [turbine])
+    return bem_service.turbine_aero(turbine, blade, aero, curve_step, surface, fine_pitch)
+
+
+@router.get("/{turbine_id}/power-curve", response_model=PowerCurveResponse)
+async def get_turbine_power_curve(
+    turbine_id: int, request: Request, response: Response, db: Database = Depends(get_db)
+):
+    turbine = await db.run(turbine_service.get_turbine, turbine_id)
+    # The key changes whenever any physical parameter does, so a matching
+    # If-None-Match is answered with 304 without building the table.
+    etag = f'"{power_curve_service.params_key(turbine)}"'
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in (t.strip().removeprefix("W/") for t in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    curve = power_curve_service.get_power_curve(turbine)
+    response.headers["ETag"] = etag
+    return {
+        "turbine_id": turbine.id,
+        "resolution_mps": power_curve_service.RESOLUTION_MPS,
+        "cut_in_wind_speed_mps": curve.cut_in_wind_speed_mps,
+        "cut_out_wind_speed_mps": curve.cut_out_wind_speed_mps,
+        "capacity_mw": turbine.capacity_mw,
+        "wind_speed_mps": curve.wind_speed_mps.tolist(),
+        "power_mw": curve.power_mw.tolist(),
+    }
+
+
 @router.delete("/{turbine_id}", status_code=204)
-def delete_turbine(turbine_id: int, session: Session = Depends(get_session)):
-    turbine_service.delete_turbine(session, turbine_id)
+async def delete_turbine(turbine_id: int, db: Database = Depends(get_db)):
+    await db.run(turbine_service.delete_turbine, turbine_id)
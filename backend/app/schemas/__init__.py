@@ -1,4 +1,25 @@
-from app.schemas.turbine import TurbineCreate, TurbineRead, TurbineUpdate, TurbinePhysicsResponse
+from app.schemas.turbine import (
+    TurbineCreate,
+    TurbineRead,
+    TurbineUpdate,
+    TurbineListItem,
+    TurbinePhysicsResponse,
+    PowerCurveResponse,
+    TurbinePhysicsItem,
+    FleetPhysicsRequest,
+    FleetPhysicsResponse,
+)
 from app.schemas.parameter import TurbineParameterRead
 
-__all__ = ["TurbineCreate", "TurbineRead", "TurbineUpdate", "TurbinePhysicsResponse", "TurbineParameterRead"]
+__all__ = [
+    "TurbineCreate",
+    "TurbineRead",
+    "TurbineUpdate",
+    "TurbineListItem",
+    "TurbinePhysicsResponse",
+    "PowerCurveResponse",
+    "TurbinePhysicsItem",
+    "FleetPhysicsRequest",
+    "FleetPhysicsResponse",
+    "TurbineParameterRead",
+]
@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from sqlmodel import SQLModel
 
+from app.schemas.turbine import TurbineRead
+
 
 class GearboxRead(SQLModel):
     id: int
@@ -108,3 +110,14 @@ class WakeDeficitResponse(SQLModel):
     distance_m: float
     wake_speed_mps: float
     speed_deficit_fraction: float
+
+
+class TurbineFullRead(TurbineRead):
+    gearbox: Optional[GearboxRead] = None
+    generator: Optional[GeneratorRead] = None
+    blade: Optional[BladeRead] = None
+    pitch_system: Optional[PitchSystemRead] = None
+    yaw_system: Optional[YawSystemRead] = None
+    tower: Optional[TowerRead] = None
+    wake_model: Optional[WakeModelRead] = None
+    errors: Dict[str, str] = {}   # component key -> detail the component route would 404 with
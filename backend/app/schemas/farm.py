@@ -0,0 +1,337 @@
+from typing import List, Literal, Optional
+
+from pydantic import Field, model_validator
+from sqlmodel import SQLModel
+
+SuperpositionRule = Literal["rss", "linear", "max"]
+# "bem": Cp and Ct from each blade design's BEM operating curve instead of the stored constants.
+AeroModel = Literal["constant", "bem"]
+
+
+class FarmWakeTurbine(SQLModel):
+    turbine_id: int
+    name: str
+    x_m: float                      # metres east of farm centroid
+    y_m: float                      # metres north of farm centroid
+    effective_wind_speed_mps: float
+    speed_deficit_fraction: float
+    power_mw: float
+    freestream_power_mw: float
+    upstream_turbine_ids: List[int]
+
+
+class FarmWakeResponse(SQLModel):
+    wind_speed_mps: float
+    wind_direction_deg: float
+    superposition: SuperpositionRule
+    aero: AeroModel
+    total_power_mw: float
+    total_freestream_power_mw: float
+    wake_loss_fraction: float
+    turbines: List[FarmWakeTurbine]
+
+
+class WindRoseTable(SQLModel):
+    directions_deg: List[float] = Field(min_length=1)   # sector centres, direction the wind blows from
+    speeds_mps: List[float] = Field(min_length=1)       # speed bin centres
+    frequencies: List[List[float]]                      # [sector][speed bin], normalised server-side
+
+
+class WeibullSector(SQLModel):
+    direction_deg: float
+    frequency: float = Field(ge=0)                      # share of the year in this sector
+    weibull_a: float = Field(gt=0)                      # scale, m/s
+    weibull_k: float = Field(gt=0)                      # shape
+
+
+class WindRoseInput(SQLModel):
+    wind_rose: Optional[WindRoseTable] = None
+    weibull_sectors: Optional[List[WeibullSector]] = Field(default=None, min_length=1)
+    # Weibull discretisation: at most 1000 bins per sector. max_speed_mps must
+    # be at least every turbine's cut-out speed (the tail above it is one bin).
+    speed_bin_width_mps: float = Field(default=1.0, ge=0.1)
+    max_speed_mps: float = Field(default=30.0, gt=0, le=100)
+    superposition: SuperpositionRule = "rss"
+    max_distance_m: Optional[float] = Field(default=None, gt=0)
+
+    @model_validator(mode="after")
+    def _one_wind_source(self):
+        if (self.wind_rose is None) == (self.weibull_sectors is None):
+            raise ValueError("Provide exactly one of wind_rose or weibull_sectors")
+        return self
+
+
+class AepRequest(WindRoseInput):
+    aero: AeroModel = "constant"
+
+
+class AepTurbine(SQLModel):
+    turbine_id: int
+    name: str
+    gross_energy_mwh: float
+    wake_loss_mwh: float
+    net_energy_mwh: float
+    capacity_factor: float
+
+
+class AepSector(SQLModel):
+    direction_deg: float
+    frequency: float
+    gross_energy_mwh: float
+    wake_loss_mwh: float
+    net_energy_mwh: float
+
+
+class AepResponse(SQLModel):
+    aero: AeroModel
+    gross_energy_mwh: float
+    wake_loss_mwh: float
+    net_energy_mwh: float
+    wake_loss_fraction: float
+    capacity_factor: float
+    turbines: List[AepTurbine]
+    sectors: List[AepSector]
+
+
+class AepUncertainty(SQLModel):
+    # One-sigma, relative to the stored values and applied farm-wide (fully correlated).
+    wind_speed: float = Field(default=0.05, ge=0, le=0.5)
+    air_density: float = Field(default=0.01, ge=0, le=0.5)
+    power_coefficient: float = Field(default=0.03, ge=0, le=0.5)
+    wake_decay_constant: float = Field(default=0.25, ge=0, le=1)
+    availability_mean: float = Field(default=0.97, gt=0, le=1)
+    availability: float = Field(default=0.015, ge=0, le=0.5)     # one-sigma, absolute
+
+
+class MonteCarloAepRequest(WindRoseInput):
+    samples: int = Field(default=10_000, ge=100, le=200_000)
+    seed: Optional[int] = Field(default=None, ge=0)             # random (and returned) if unset
+    uncertainty: AepUncertainty = AepUncertainty()
+
+
+class AepExceedance(SQLModel):
+    probability: float                  # 0.9 is P90: the energy exceeded in 90 % of samples
+    energy_mwh: float
+
+
+class AepConvergencePoint(SQLModel):
+    samples: int                        # estimate from the first `samples` samples
+    mean_energy_mwh: float
+    p50_energy_mwh: float
+    p90_energy_mwh: float
+
+
+class MonteCarloAepResponse(SQLModel):
+    samples: int
+    seed: int
+    turbine_count: int
+    uncertainty: AepUncertainty
+    nominal_energy_mwh: float           # every input at its stored value, mean availability
+    mean_energy_mwh: float
+    std_energy_mwh: float
+    standard_error_mwh: float           # of the mean
+    p90_standard_error_mwh: float       # batch means over contiguous sample groups
+    exceedance: List[AepExceedance]
+    convergence: List[AepConvergencePoint]
+
+
+class CampbellViolation(SQLModel):
+    band: Literal["1P", "3P"]
+    start_mps: float
+    end_mps: float
+
+
+class CampbellCurve(SQLModel):
+    wind_speed_mps: List[float]
+    one_p_hz: List[float]
+    three_p_hz: List[float]
+
+
+class CampbellTurbine(SQLModel):
+    turbine_id: int
+    name: str
+    first_nat_freq_hz: float
+    tower_missing: bool                 # no Tower row; the model default frequency was used
+    cut_in_wind_speed_mps: float
+    cut_out_wind_speed_mps: float
+    one_p_min_hz: float
+    one_p_max_hz: float
+    three_p_min_hz: float
+    three_p_max_hz: float
+    min_margin_to_1p_hz: float          # f_n − max 1P; negative means 1P crosses f_n
+    min_margin_to_3p_hz: float          # min 3P − f_n; negative means 3P crosses f_n
+    is_soft_stiff: bool
+    violations: List[CampbellViolation]
+    curve: Optional[CampbellCurve] = None
+
+
+class CampbellResponse(SQLModel):
+    separation: float
+    turbine_count: int
+    violating_turbine_count: int
+    min_margin_to_1p_hz: Optional[float]
+    min_margin_to_3p_hz: Optional[float]
+    turbines: List[CampbellTurbine]
+
+
+class YawSimulationTurbine(SQLModel):
+    turbine_id: int
+    name: str
+    yaw_system_missing: bool            # no YawSystem row; the model defaults were used
+    free_yaw: bool
+    activation_threshold_deg: float
+    yaw_rate_deg_per_s: float
+    gross_energy_mwh: float             # with perfect alignment
+    yaw_loss_mwh: float
+    net_energy_mwh: float
+    yaw_loss_fraction: float
+    yaw_events: int
+    yawing_time_s: float
+    yaw_travel_deg: float
+    mean_abs_error_deg: float
+    rms_error_deg: float
+    max_abs_error_deg: float
+
+
+class YawSimulationResponse(SQLModel):
+    samples: int
+    sample_interval_s: float
+    duration_s: float
+    filter_s: float
+    turbine_count: int
+    gross_energy_mwh: float
+    yaw_loss_mwh: float
+    net_energy_mwh: float
+    yaw_loss_fraction: float
+    turbines: List[YawSimulationTurbine]
+
+
+class PitchGust(SQLModel):
+    magnitude_mps: float = Field(gt=0, le=30)           # IEC V_gust; peak is 0.74·V_gust above the mean
+    start_s: float = Field(ge=0)
+    period_s: float = Field(default=10.5, gt=0, le=60)
+
+
+class PitchSimulationRequest(SQLModel):
+    mean_wind_speed_mps: float = Field(ge=0, le=50)
+    turbulence_intensity: float = Field(default=0.12, ge=0, le=0.5)
+    duration_s: float = Field(default=600.0, gt=0, le=86_400)
+    time_step_s: float = Field(default=0.05, ge=0.005, le=1.0)
+    seed: Optional[int] = None
+    gust: Optional[PitchGust] = None
+    overspeed_threshold: float = Field(default=0.10, gt=0, le=1)   # relative to rated rotor speed
+    trace_points: Optional[int] = Field(default=None, ge=2, le=5_000)
+    turbine_ids: Optional[List[int]] = None
+
+
+class PitchTrace(SQLModel):
+    time_s: List[float]
+    power_mw: List[float]
+    pitch_deg: List[float]
+    rotor_rpm: List[float]
+
+
+class PitchSimulationTurbine(SQLModel):
+    turbine_id: int
+    name: str
+    pitch_system_missing: bool          # no PitchSystem row; the model defaults were used
+    blade_missing: bool                 # no Blade row; rotor inertia from the model defaults
+    rated_rotor_rpm: float
+    rotor_inertia_kg_m2: float
+    energy_mwh: float
+    quasi_static_energy_mwh: float      # physics.actual_power_mw, i.e. instantaneous pitch response
+    mean_power_mw: float
+    max_power_mw: float
+    mean_pitch_deg: float
+    max_pitch_deg: float
+    pitch_rate_limited_fraction: float
+    max_rotor_rpm: float
+    max_overspeed_fraction: float
+    overspeed_events: int
+    overspeed_time_s: float
+    feather_events: int
+    trace: Optional[PitchTrace] = None
+
+
+class PitchSimulationResponse(SQLModel):
+    mean_wind_speed_mps: float
+    turbulence_intensity: float
+    time_step_s: float
+    steps: int
+    duration_s: float
+    overspeed_threshold: float
+    turbine_count: int
+    energy_mwh: float
+    quasi_static_energy_mwh: float
+    overspeed_turbine_count: int
+    turbines: List[PitchSimulationTurbine]
+
+
+LayoutAlgorithm = Literal["random", "genetic"]
+LayoutJobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class SitePoint(SQLModel):
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+
+
+class LayoutTurbineTemplate(SQLModel):
+    """Every optimised turbine gets these properties; components take their defaults."""
+    capacity_mw: float = Field(gt=0)
+    rotor_diameter_m: float = Field(default=112.0, gt=0)
+    hub_height_m: float = Field(default=94.0, gt=0)
+    cut_in_wind_speed_mps: float = 3.0
+    rated_wind_speed_mps: float = 13.0
+    cut_out_wind_speed_mps: float = 25.0
+    power_coefficient: float = 0.40
+    tip_speed_ratio: float = 8.0
+    air_density_kg_m3: float = 1.225
+
+
+class LayoutOptimizationRequest(WindRoseInput):
+    site_polygon: List[SitePoint] = Field(min_length=3)
+    turbine_count: int = Field(ge=1, le=500)
+    turbine: LayoutTurbineTemplate
+    min_spacing_diameters: float = Field(default=4.0, gt=0)
+    algorithm: LayoutAlgorithm = "genetic"
+    population_size: int = Field(default=32, ge=4, le=1000)
+    generations: int = Field(default=40, ge=1, le=1000)      # random search: population_size × generations layouts
+    refine_passes: int = Field(default=2, ge=0, le=20)
+    seed: Optional[int] = Field(default=None, ge=0)          # random (and returned) if unset
+    name_prefix: str = Field(default="L", min_length=1, max_length=32)
+    write_back: bool = True                                   # False only reports the layout
+
+
+class LayoutTurbine(SQLModel):
+    turbine_id: Optional[int] = None    # set once written back
+    name: str
+    latitude: float
+    longitude: float
+    net_energy_mwh: float
+
+
+class LayoutResult(SQLModel):
+    gross_energy_mwh: float
+    wake_loss_mwh: float
+    net_energy_mwh: float
+    wake_loss_fraction: float
+    capacity_factor: float
+    turbines: List[LayoutTurbine]
+
+
+class LayoutJobRead(SQLModel):
+    job_id: str
+    status: LayoutJobStatus
+    phase: Optional[Literal["search", "refine", "writing"]] = None
+    algorithm: LayoutAlgorithm
+    turbine_count: int
+    seed: int
+    write_back: bool
+    evaluations: int
+    total_evaluations: int              # planned; infeasible refinement moves are skipped
+    progress: float                     # 0–1
+    best_net_energy_mwh: Optional[float] = None
+    elapsed_s: float
+    error: Optional[str] = None
+    result: Optional[LayoutResult] = None
@@ -0,0 +1,15 @@
+from typing import List, Optional
+
+from sqlmodel import SQLModel
+
+
+class SpatialHit(SQLModel):
+    turbine_id: int
+    latitude: float
+    longitude: float
+    distance_m: Optional[float] = None  # great-circle distance from the query point; None for bbox queries
+
+
+class SpatialQueryResponse(SQLModel):
+    count: int
+    turbines: List[SpatialHit]
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import field_validator
+from sqlmodel import SQLModel
+
+
+def as_utc(value: datetime) -> datetime:
+    """Timestamps without an offset are taken to be UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+class TelemetryIn(SQLModel):
+    turbine_id: int
+    timestamp: datetime
+    output_mw: float
+    wind_speed_mps: Optional[float] = None
+    wind_direction_deg: Optional[float] = None
+    rotor_rpm: Optional[float] = None
+
+    _utc_timestamp = field_validator("timestamp")(as_utc)
+
+
+class TelemetryRead(TelemetryIn):
+    id: int
+
+
+class TelemetryIngestResponse(SQLModel):
+    accepted: int
+    batches: int
+    turbines_updated: int
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Annotated, Dict, List, Optional
+
+from pydantic import Field
 from sqlmodel import SQLModel
 
 
@@ -51,6 +53,25 @@ class TurbineRead(SQLModel):
     air_density_kg_m3: float
 
 
+class TurbineListItem(SQLModel):
+    """A row of the turbine list; only ``id`` and the projected fields are present."""
+
+    id: int
+    name: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    capacity_mw: Optional[float] = None
+    current_output_mw: Optional[float] = None
+    rotor_diameter_m: Optional[float] = None
+    hub_height_m: Optional[float] = None
+    cut_in_wind_speed_mps: Optional[float] = None
+    rated_wind_speed_mps: Optional[float] = None
+    cut_out_wind_speed_mps: Optional[float] = None
+    power_coefficient: Optional[float] = None
+    tip_speed_ratio: Optional[float] = None
+    air_density_kg_m3: Optional[float] = None
+
+
 class TurbinePhysicsResponse(SQLModel):
     wind_speed_mps: float
     power_mw: float
@@ -58,3 +79,109 @@ class TurbinePhysicsResponse(SQLModel):
     rotor_rpm: float
     swept_area_m2: float
     tip_speed_mps: float
+
+
+class PowerCurveResponse(SQLModel):
+    turbine_id: int
+    resolution_mps: float
+    cut_in_wind_speed_mps: float
+    cut_out_wind_speed_mps: float
+    capacity_mw: float
+    wind_speed_mps: List[float]
+    power_mw: List[float]
+
+
+class TurbinePhysicsItem(TurbinePhysicsResponse):
+    turbine_id: int
+    name: str
+
+
+class FleetPhysicsResponse(SQLModel):
+    turbine_count: int
+    total_power_mw: float
+    turbines: List[TurbinePhysicsItem]
+
+
+class FleetPhysicsRequest(SQLModel):
+    # turbine_id -> wind speed in m/s
+    wind_speeds: Dict[int, Annotated[float, Field(ge=0, le=50)]] = {}
+    # applied to every turbine not listed in wind_speeds; if unset only listed turbines are returned
+    default_wind_speed: Optional[float] = Field(default=None, ge=0, le=50)
+
+
+class DrivetrainState(SQLModel):
+    direct_drive: bool                  # Generator.gearbox_id is None: no gearbox stage
+    gearbox_missing: bool
+    generator_missing: bool             # missing rows use the model defaults
+    gear_ratio: float
+
+
+class TurbineDrivetrainResponse(DrivetrainState):
+    turbine_id: int
+    wind_speed_mps: float
+    rotor_rpm: float
+    shaft_power_mw: float
+    high_speed_shaft_rpm: float
+    gearbox_loss_mw: float
+    generator_input_mw: float
+    generator_loss_mw: float
+    active_power_mw: float
+    reactive_power_mvar: float
+    apparent_power_mva: float
+    electrical_frequency_hz: float
+    drivetrain_efficiency: float
+
+
+class FleetDrivetrainItem(DrivetrainState):
+    turbine_id: int
+    name: str
+    # One value per entry of FleetDrivetrainResponse.wind_speed_mps.
+    rotor_rpm: List[float]
+    shaft_power_mw: List[float]
+    high_speed_shaft_rpm: List[float]
+    gearbox_loss_mw: List[float]
+    generator_input_mw: List[float]
+    generator_loss_mw: List[float]
+    active_power_mw: List[float]
+    reactive_power_mvar: List[float]
+    apparent_power_mva: List[float]
+    electrical_frequency_hz: List[float]
+    drivetrain_efficiency: List[float]
+
+
+class FleetDrivetrainResponse(SQLModel):
+    wind_speed_mps: List[float]
+    turbine_count: int
+    total_active_power_mw: List[float]
+    total_reactive_power_mvar: List[float]
+    turbines: List[FleetDrivetrainItem]
+
+
+class AeroSurface(SQLModel):
+    tip_speed_ratio: List[float]
+    pitch_deg: List[float]
+    power_coefficient: List[List[float]]    # [tip_speed_ratio][pitch_deg]
+    thrust_coefficient: List[List[float]]
+
+
+class AeroOperatingCurve(SQLModel):
+    wind_speed_mps: List[float]
+    tip_speed_ratio: List[float]
+    pitch_deg: List[float]
+    power_coefficient: List[float]
+    thrust_coefficient: List[float]
+    power_mw: List[float]
+
+
+class TurbineAeroResponse(SQLModel):
+    turbine_id: int
+    blade_missing: bool                 # no Blade row; the default blade design was used
+    design_key: str                     # shared by every turbine with the same blade design
+    airfoil_family: str
+    max_power_coefficient: float
+    optimal_tip_speed_ratio: float
+    optimal_pitch_deg: float
+    thrust_coefficient_at_max_cp: float
+    rated_wind_speed_mps: float         # where peak Cp reaches capacity
+    curve: AeroOperatingCurve
+    surface: Optional[AeroSurface] = None
@@ -0,0 +1,578 @@
+"""Blade Element Momentum rotor aerodynamics.
+
+A blade design (the aerodynamic columns of a Blade row) is split into radial
+stations. Each station gets a chord and twist derived from the stored
+root/max chord, total twist and design tip-speed ratio. Its lift and drag
+come from a parametric polar for the airfoil family: attached flow up to
+stall, then blended into flat-plate behaviour. Induction is solved with
+Ning's one-variable form: bisection on the inflow angle φ with Prandtl
+tip/hub losses and Buhl's high-induction correction. That converges for
+every station, tip-speed ratio and pitch angle at once, so the full
+Cp(λ, β) / Ct(λ, β) surface is a handful of array passes.
+
+Surfaces depend only on the blade design, not on the turbine. They are keyed
+by a hash of the design, persisted in ``bladeaerosurface``, cached in memory
+and shared by every turbine with the same blade. A changed Blade row hashes
+to a new key, so nothing needs invalidating. A new design costs about 0.4 s
+of CPU, so async routes look surfaces up (:func:`find_surfaces`), solve the
+missing ones in a worker thread (:func:`solve_missing`) and store them
+(:func:`store_surfaces`) as three steps, never solving inside ``db.run``.
+
+:func:`fleet_curves` turns surfaces into per-turbine Cp(v) and Ct(v)
+operating curves: the Cp peak at or above each turbine's fine pitch below
+rated, then constant rotor speed with the pitch that holds rated power.
+Passing these curves to the wake and AEP models replaces the constant
+``power_coefficient`` and ``thrust_coefficient``.
+"""
+import hashlib
+import logging
+import math
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlmodel import Session, select
+
+from app.cache import LRUCache
+from app.config import AERO_SURFACE_CACHE_MAXSIZE
+from app.models.blade import Blade
+from app.models.blade_aero_surface import BladeAeroSurface
+from app.models.pitch_system import PitchSystem
+from app.models.turbine import Turbine
+from app.services import physics
+
+# Bumped whenever the solver, the geometry/polar model or the grids change, so
+# stored surfaces from an older solver are not reused.
+SOLVER_VERSION = 1
+
+STATIONS = 32
+HUB_RADIUS_FRACTION = 0.025        # blade root sits at 2.5 % of the rotor radius
+MAX_CHORD_STATION = 0.25           # r/R of the widest chord
+TIP_CHORD_FRACTION = 0.3           # tip chord relative to the max chord
+BISECTION_STEPS = 24               # φ bracket ≤ π/2 wide: ~1e-7 rad, Cp good to ~1e-6
+
+TSR_GRID = np.arange(0.5, 15.0 + 1e-9, 0.25)
+PITCH_GRID_DEG = np.arange(-2.0, 40.0 + 1e-9, 1.0)
+
+# Operating curves are tabulated on this wind-speed grid and interpolated.
+CURVE_STEP_MPS = 0.25
+CURVE_MAX_MPS = 50.0
+# Jensen needs Ct < 1; the turbulent-wake state is not modelled.
+CT_MAX = 0.99
+# Turbines without a PitchSystem row never pitch below this.
+FINE_PITCH_DEG = PitchSystem.model_fields["fine_pitch_angle_deg"].default
+
+
+class Airfoil(NamedTuple):
+    cl0: float               # lift at zero angle of attack
+    cl_max: float
+    cd0: float               # minimum drag
+    alpha_design_deg: float  # angle of attack the twist is designed for (≈ best L/D)
+
+
+CL_SLOPE = 2 * math.pi * 0.95      # per radian, attached flow
+DRAG_RISE = 1.0                    # cd = cd0 + DRAG_RISE·(α − α_design)², radians
+CD_FLAT_PLATE = 1.8                # drag normal to the flow after full stall
+STALL_BLEND_DEG = 2.0
+
+AIRFOILS: Dict[str, Airfoil] = {
+    "NACA": Airfoil(0.25, 1.35, 0.008, 6.0),
+    "NREL S-series": Airfoil(0.45, 1.40, 0.009, 5.0),
+    "FFA-W3": Airfoil(0.40, 1.50, 0.011, 6.0),
+    "DU": Airfoil(0.40, 1.45, 0.010, 5.5),
+}
+DEFAULT_AIRFOIL = "NREL S-series"
+
+# Blade columns the aerodynamics depend on; together they form the design key.
+DESIGN_FIELDS = (
+    "blade_length_m",
+    "max_chord_m",
+    "root_chord_m",
+    "total_twist_deg",
+    "airfoil_family",
+    "design_tip_speed_ratio",
+    "num_blades",
+)
+
+
+class Surface(NamedTuple):
+    design_key: str
+    tsr: np.ndarray           # (L,)
+    pitch_deg: np.ndarray     # (P,)
+    cp: np.ndarray            # (L, P)
+    ct: np.ndarray            # (L, P)
+
+
+class AeroCurves(NamedTuple):
+    """Per-turbine operating curves on a uniform wind-speed grid."""
+    speeds_mps: np.ndarray    # (k,)
+    cp: np.ndarray            # (n, k)
+    ct: np.ndarray            # (n, k)
+    pitch_deg: np.ndarray     # (n, k)
+
+
+logger = logging.getLogger(__name__)
+
+_surfaces: LRUCache[Surface] = LRUCache(maxsize=AERO_SURFACE_CACHE_MAXSIZE)
+_DEFAULT_BLADE = Blade(turbine_id=0)
+
+
+# --- Geometry and polars ---
+
+def design_key(blade: Optional[Blade]) -> str:
+    b = blade if blade is not None else _DEFAULT_BLADE
+    design = repr(tuple(getattr(b, f) for f in DESIGN_FIELDS))
+    return f"v{SOLVER_VERSION}-{hashlib.sha1(design.encode()).hexdigest()[:20]}"
+
+
+def airfoil(family: str) -> Airfoil:
+    return AIRFOILS.get(family, AIRFOILS[DEFAULT_AIRFOIL])
+
+
+def blade_geometry(blade: Blade) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Station r/R, chord/R and twist (rad) at annulus midpoints, plus the annulus width."""
+    R = blade.blade_length_m / (1 - HUB_RADIUS_FRACTION)
+    dx = (1 - HUB_RADIUS_FRACTION) / STATIONS
+    x = HUB_RADIUS_FRACTION + dx * (np.arange(STATIONS) + 0.5)
+
+    tip_chord = TIP_CHORD_FRACTION * blade.max_chord_m
+    chord = np.where(
+        x < MAX_CHORD_STATION,
+        np.interp(x, [HUB_RADIUS_FRACTION, MAX_CHORD_STATION], [blade.root_chord_m, blade.max_chord_m]),
+        np.interp(x, [MAX_CHORD_STATION, 1.0], [blade.max_chord_m, tip_chord]),
+    )
+
+    # Twist follows the optimum-rotor inflow angle φ = ⅔·atan(1/λ_r), scaled so
+    # the twist from the max-chord station to the tip equals total_twist_deg.
+    def phi_opt(xr):
+        return 2 / 3 * np.arctan(1 / (blade.design_tip_speed_ratio * xr))
+
+    foil = airfoil(blade.airfoil_family)
+    tip_twist = phi_opt(1.0) - math.radians(foil.alpha_design_deg)
+    shape = (phi_opt(np.maximum(x, MAX_CHORD_STATION)) - phi_opt(1.0)) / (phi_opt(MAX_CHORD_STATION) - phi_opt(1.0))
+    twist = tip_twist + math.radians(blade.total_twist_deg) * shape
+    return x, chord / R, twist, dx
+
+
+def polar(alpha: np.ndarray, foil: Airfoil) -> tuple[np.ndarray, np.ndarray]:
+    """Lift and drag coefficients: attached flow blended into a flat plate past stall."""
+    return _polar(alpha, np.sin(alpha), np.cos(alpha), foil)
+
+
+def _polar(alpha: np.ndarray, sin_a: np.ndarray, cos_a: np.ndarray, foil: Airfoil) -> tuple[np.ndarray, np.ndarray]:
+    alpha0 = -foil.cl0 / CL_SLOPE
+    alpha_stall = foil.cl_max / CL_SLOPE
+    rel = alpha - alpha0
+    attached = 1 / (1 + np.exp((np.abs(rel) - alpha_stall) / math.radians(STALL_BLEND_DEG)))
+    cl_att = CL_SLOPE * rel
+    cd_att = foil.cd0 + DRAG_RISE * (alpha - math.radians(foil.alpha_design_deg)) ** 2
+    cl = attached * cl_att + (1 - attached) * CD_FLAT_PLATE * sin_a * cos_a
+    cd = attached * cd_att + (1 - attached) * (foil.cd0 + CD_FLAT_PLATE * sin_a * sin_a)
+    return cl, cd
+
+
+# --- Solver ---
+
+class _Stations(NamedTuple):
+    """Per-station constants, broadcast against the (L, P, S) grid."""
+    lambda_r: np.ndarray      # local speed ratio λ·x
+    sigma: np.ndarray         # local solidity B·c / (2πr)
+    theta: np.ndarray         # twist + pitch (rad)
+    sin_theta: np.ndarray
+    cos_theta: np.ndarray
+    tip_loss: np.ndarray      # Prandtl exponents times |sin φ|
+    hub_loss: np.ndarray
+    foil: Airfoil
+
+
+def _subset(st: _Stations, idx: tuple) -> _Stations:
+    """The stations at ``idx`` of the (L, P, S) grid, flattened."""
+    shape = np.broadcast_shapes(st.lambda_r.shape, st.theta.shape)
+    return _Stations(*(np.broadcast_to(a, shape)[idx] for a in st[:-1]), st.foil)
+
+
+def _induction(phi: np.ndarray, st: _Stations):
+    """Ning's residual at φ, with the axial/tangential induction and the force coefficients."""
+    s, c = np.sin(phi), np.cos(phi)
+    abs_s = np.maximum(np.abs(s), 1e-12)
+    F = (2 / math.pi) ** 2 * np.arccos(np.exp(-st.tip_loss / abs_s)) * np.arccos(np.exp(-st.hub_loss / abs_s))
+    F = np.maximum(F, 1e-6)
+
+    # sin/cos of α = φ − θ from the angle-difference identities.
+    cl, cd = _polar(phi - st.theta, s * st.cos_theta - c * st.sin_theta, c * st.cos_theta + s * st.sin_theta, st.foil)
+    cn = cl * c + cd * s
+    ctan = cl * s - cd * c
+    k = st.sigma * cn / (4 * F * s * s + 1e-300)
+    kp = st.sigma * ctan / (4 * F * s * c + np.where(s * c >= 0, 1e-300, -1e-300))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Momentum region, Buhl's empirical correction above a = 0.4, propeller brake for φ < 0.
+        g1 = 2 * F * k - (10 / 9 - F)
+        g2 = np.maximum(2 * F * k - F * (4 / 3 - F), 0.0)
+        g3 = 2 * F * k - (25 / 9 - 2 * F)
+        buhl = np.where(np.abs(g3) < 1e-6, 1 - 1 / (2 * np.sqrt(g2)), (g1 - np.sqrt(g2)) / g3)
+        a = np.where(phi > 0, np.where(k <= 2 / 3, k / (1 + k), buhl), k / (k - 1))
+        residual = np.where(
+            phi > 0,
+            s / (1 - a) - c / st.lambda_r * (1 - kp),
+            s * (1 - k) - c / st.lambda_r * (1 - kp),
+        )
+        ap = kp / (1 - kp)
+    return residual, a, ap, cn, ctan
+
+
+def solve_surface(blade: Optional[Blade], tsr: ArrayLike = TSR_GRID, pitch_deg: ArrayLike = PITCH_GRID_DEG) -> Surface:
+    """Cp and Ct over the λ × β grid, every station and grid point solved together."""
+    b = blade if blade is not None else _DEFAULT_BLADE
+    tsr = np.asarray(tsr, dtype=np.float64)
+    pitch_deg = np.asarray(pitch_deg, dtype=np.float64)
+    x, chord, twist, dx = blade_geometry(b)
+    B = float(b.num_blades)
+    theta = twist + np.radians(pitch_deg)[:, None]
+    st = _Stations(
+        lambda_r=tsr[:, None, None] * x,
+        sigma=B * chord / (2 * math.pi * x),
+        theta=theta,
+        sin_theta=np.sin(theta),
+        cos_theta=np.cos(theta),
+        tip_loss=B / 2 * (1 - x) / x,
+        hub_loss=B / 2 * (x - HUB_RADIUS_FRACTION) / HUB_RADIUS_FRACTION,
+        foil=airfoil(b.airfoil_family),
+    )
+    shape = (tsr.size, pitch_deg.size, x.size)
+
+    # Windmill bracket first; the few elements without a sign change there try
+    # the propeller-brake bracket, then φ > π/2.
+    eps = 1e-6
+    lo = np.full(shape, eps)
+    hi = np.full(shape, math.pi / 2)
+    f_lo = _induction(lo, st)[0]
+    chosen = f_lo * _induction(hi, st)[0] <= 0
+    for b_lo, b_hi in ((-math.pi / 4, -eps), (math.pi / 2, math.pi - eps)):
+        idx = np.nonzero(~chosen)
+        if not idx[0].size:
+            break
+        sub = _subset(st, idx)
+        f_a = _induction(np.full(idx[0].size, b_lo), sub)[0]
+        take = f_a * _induction(np.full(idx[0].size, b_hi), sub)[0] <= 0
+        idx = tuple(i[take] for i in idx)
+        lo[idx], hi[idx], f_lo[idx] = b_lo, b_hi, f_a[take]
+        chosen[idx] = True
+
+    for _ in range(BISECTION_STEPS):
+        mid = (lo + hi) / 2
+        f_mid = _induction(mid, st)[0]
+        left = f_lo * f_mid <= 0
+        hi = np.where(left, mid, hi)
+        lo = np.where(left, lo, mid)
+        f_lo = np.where(left, f_lo, f_mid)
+    phi = (lo + hi) / 2
+    _, a, ap, cn, ctan = _induction(phi, st)
+
+    # Relative velocity² with V = 1; stations without a bracket carry no load.
+    w2 = np.where(chosen, (1 - a) ** 2 + (st.lambda_r * (1 + ap)) ** 2, 0.0)
+    w2 = np.nan_to_num(w2, nan=0.0, posinf=0.0)
+    blade_load = B * chord * w2 * dx / math.pi
+    cp = tsr[:, None] * np.sum(blade_load * ctan * x, axis=-1)
+    ct = np.sum(blade_load * cn, axis=-1)
+    return Surface(design_key(blade), tsr, pitch_deg, cp, ct)
+
+
+# --- Persistence and cache ---
+
+def _encode(a: np.ndarray) -> bytes:
+    return np.ascontiguousarray(a, dtype="<f8").tobytes()
+
+
+def _decode(row: BladeAeroSurface) -> Surface:
+    tsr = np.frombuffer(row.tsr, dtype="<f8")
+    pitch = np.frombuffer(row.pitch_deg, dtype="<f8")
+    shape = (tsr.size, pitch.size)
+    return Surface(
+        row.design_key, tsr, pitch,
+        np.frombuffer(row.cp, dtype="<f8").reshape(shape),
+        np.frombuffer(row.ct, dtype="<f8").reshape(shape),
+    )
+
+
+def _store(session: Session, rows: List[BladeAeroSurface]) -> None:
+    # A separate session, so the commit does not expire rows the caller has loaded.
+    with Session(session.get_bind()) as writer:
+        writer.add_all(rows)
+        try:
+            writer.commit()
+        except IntegrityError:
+            # Another worker stored the same design first; the surfaces are identical.
+            writer.rollback()
+        except SQLAlchemyError:
+            writer.rollback()
+            logger.exception("Storing BEM surfaces failed; they stay cached in memory only")
+
+
+def get_blades(session: Session, turbines: Sequence[Turbine]) -> List[Optional[Blade]]:
+    """The first Blade row of each turbine (or None), from one query."""
+    ids = [t.id for t in turbines]
+    first: Dict[int, Blade] = {}
+    for blade in session.exec(select(Blade).where(Blade.turbine_id.in_(ids)).order_by(Blade.id)).all():
+        first.setdefault(blade.turbine_id, blade)
+    return [first.get(t.id) for t in turbines]
+
+
+class SurfaceLookup(NamedTuple):
+    keys: List[str]                         # design key of each blade
+    found: Dict[str, Surface]               # cached, stored or solved designs
+    missing: Dict[str, Optional[Blade]]     # designs left for solve_missing
+
+    def surfaces(self) -> List[Surface]:
+        """One surface per blade; every design must have been found or solved."""
+        return [self.found[k] for k in self.keys]
+
+
+def find_surfaces(session: Session, blades: Sequence[Optional[Blade]]) -> SurfaceLookup:
+    """Surfaces of the blades' designs from the cache, else the database; the rest are ``missing``.
+
+    Each distinct design is looked up once, however many turbines share it.
+    """
+    keys = [design_key(b) for b in blades]
+    found: Dict[str, Surface] = {}
+    missing: Dict[str, Optional[Blade]] = {}
+    for key, blade in zip(keys, blades):
+        if key in found or key in missing:
+            continue
+        cached = _surfaces.get(key)
+        if cached is not None:
+            found[key] = cached
+        else:
+            missing[key] = blade
+    if missing:
+        stmt = select(BladeAeroSurface).where(BladeAeroSurface.design_key.in_(list(missing)))
+        for row in session.exec(stmt).all():
+            found[row.design_key] = surface = _decode(row)
+            _surfaces.put(row.design_key, surface)
+            del missing[row.design_key]
+    return SurfaceLookup(keys, found, missing)
+
+
+def solve_missing(lookup: SurfaceLookup) -> List[BladeAeroSurface]:
+    """Solve and cache the missing designs; returns the rows for :func:`store_surfaces`.
+
+    CPU-bound and free of database access, so routes run it in a worker thread.
+    """
+    rows = []
+    for key, blade in lookup.missing.items():
+        start = time.perf_counter()
+        surface = solve_surface(blade)
+        lookup.found[key] = surface
+        _surfaces.put(key, surface)
+        rows.append(BladeAeroSurface(
+            design_key=key, tsr=_encode(surface.tsr), pitch_deg=_encode(surface.pitch_deg),
+            cp=_encode(surface.cp), ct=_encode(surface.ct), build_s=time.perf_counter() - start,
+        ))
+    return rows
+
+
+def store_surfaces(session: Session, rows: List[BladeAeroSurface]) -> None:
+    if rows:
+        _store(session, rows)
+
+
+def get_surfaces(session: Session, blades: Sequence[Optional[Blade]]) -> List[Surface]:
+    """One surface per blade: from the cache, else the database, else solved and stored."""
+    lookup = find_surfaces(session, blades)
+    store_surfaces(session, solve_missing(lookup))
+    return lookup.surfaces()
+
+
+def fleet_surfaces(session: Session, turbines: Sequence[Turbine]) -> List[Surface]:
+    return get_surfaces(session, get_blades(session, turbines))
+
+
+def fleet_fine_pitch(session: Session, turbines: Sequence[Turbine]) -> List[float]:
+    """Fine pitch of each turbine's first PitchSystem row (or the model default), from one query."""
+    ids = [t.id for t in turbines]
+    first: Dict[int, float] = {}
+    stmt = select(PitchSystem.turbine_id, PitchSystem.fine_pitch_angle_deg).where(PitchSystem.turbine_id.in_(ids)).order_by(PitchSystem.id)
+    for turbine_id, fine_pitch in session.exec(stmt).all():
+        first.setdefault(turbine_id, fine_pitch)
+    return [first.get(t.id, FINE_PITCH_DEG) for t in turbines]
+
+
+def cache_stats() -> dict:
+    return _surfaces.stats()
+
+
+# --- Operating curves ---
+
+def _grid_index(grid: np.ndarray, values: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """Lower index and weight for linear interpolation on a uniform grid, clamped to its ends."""
+    pos = (np.asarray(values, dtype=np.float64) - grid[0]) / (grid[1] - grid[0])
+    pos = np.clip(pos, 0.0, grid.size - 1 - 1e-9)
+    i = pos.astype(np.intp)
+    return i, pos - i
+
+
+def optimum(surface: Surface, fine_pitch_deg: float = FINE_PITCH_DEG) -> tuple[int, int]:
+    """Grid indices (λ, β) of the peak Cp at pitch angles the blades can reach (β ≥ fine pitch)."""
+    j0 = min(int(np.searchsorted(surface.pitch_deg, fine_pitch_deg - 1e-9)), surface.pitch_deg.size - 1)
+    reachable = surface.cp[:, j0:]
+    i, j = np.unravel_index(np.argmax(reachable), reachable.shape)
+    return int(i), int(j) + j0
+
+
+def rated_wind_speed(
+    surface: Surface,
+    capacity_mw: ArrayLike,
+    rotor_diameter_m: ArrayLike,
+    air_density_kg_m3: ArrayLike,
+    fine_pitch_deg: float = FINE_PITCH_DEG,
+):
+    """Wind speed at which the rotor reaches capacity at peak Cp."""
+    cp_max = surface.cp[optimum(surface, fine_pitch_deg)]
+    area = physics.swept_area_m2(np.asarray(rotor_diameter_m, dtype=np.float64))
+    return np.cbrt(np.asarray(capacity_mw) * 1_000_000 / (0.5 * air_density_kg_m3 * area * cp_max))
+
+
+def operating_curve(
+    surface: Surface, rated_wind_speed_mps: float, speeds_mps: ArrayLike, fine_pitch_deg: float = FINE_PITCH_DEG
+) -> dict[str, np.ndarray]:
+    """Cp, Ct and pitch of a variable-speed, pitch-regulated rotor at each wind speed.
+
+    Below rated the rotor runs at the (λ, β ≥ fine pitch) Cp peak. Above rated,
+    rotor speed is held (λ falls as 1/v) and the blades pitch towards feather
+    until Cp drops to the value that keeps power at capacity.
+    """
+    v = np.asarray(speeds_mps, dtype=np.float64)
+    i_opt, j_opt = optimum(surface, fine_pitch_deg)
+    lam_opt, cp_max = surface.tsr[i_opt], surface.cp[i_opt, j_opt]
+    above = v > rated_wind_speed_mps
+    ratio = np.where(above, rated_wind_speed_mps / np.maximum(v, 1e-9), 1.0)
+
+    li, lw = _grid_index(surface.tsr, lam_opt * ratio)
+    cp_rows = surface.cp[li] * (1 - lw)[:, None] + surface.cp[li + 1] * lw[:, None]
+    ct_rows = surface.ct[li] * (1 - lw)[:, None] + surface.ct[li + 1] * lw[:, None]
+    target = cp_max * ratio ** 3
+
+    # Pitch towards feather from the row's own Cp peak at or past the optimum
+    # pitch (at low λ the blade is stalled and Cp first rises with pitch), then
+    # interpolate to the pitch where Cp falls to the target.
+    pitches = surface.pitch_deg
+    columns = np.arange(pitches.size)
+    start = np.where(columns >= j_opt, cp_rows, -np.inf).argmax(axis=1)
+    past = (columns > start[:, None]) & (cp_rows <= target[:, None])
+    m = np.where(past.any(axis=1), past.argmax(axis=1), pitches.size - 1)
+    rows = np.arange(v.size)
+    cp_a, cp_b = cp_rows[rows, m - 1], cp_rows[rows, m]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = np.clip(np.nan_to_num((cp_a - target) / (cp_a - cp_b)), 0.0, 1.0)
+    pitch = pitches[m - 1] + w * (pitches[m] - pitches[m - 1])
+    cp = cp_a + w * (cp_b - cp_a)
+    ct = ct_rows[rows, m - 1] + w * (ct_rows[rows, m] - ct_rows[rows, m - 1])
+    return {
+        "power_coefficient": np.where(above, cp, cp_max),
+        "thrust_coefficient": np.where(above, ct, surface.ct[i_opt, j_opt]),
+        "pitch_deg": np.where(above, pitch, pitches[j_opt]),
+        "tip_speed_ratio": lam_opt * ratio,
+    }
+
+
+def fleet_curves(
+    turbines: Sequence[Turbine], surfaces: Sequence[Surface], fine_pitch_deg: Optional[Sequence[float]] = None
+) -> AeroCurves:
+    """Operating curves per turbine, computed once per distinct (design, fine pitch, rated wind speed).
+
+    ``fine_pitch_deg`` (one per turbine, from :func:`fleet_fine_pitch`) defaults to FINE_PITCH_DEG.
+    """
+    speeds = np.arange(0.0, CURVE_MAX_MPS + 1e-9, CURVE_STEP_MPS)
+    by_key = {s.design_key: s for s in surfaces}
+    key_index = {k: i for i, k in enumerate(by_key)}
+    designs = list(by_key.values())
+    if fine_pitch_deg is None:
+        fine_pitch_deg = [FINE_PITCH_DEG] * len(turbines)
+    rated = np.array([
+        rated_wind_speed(s, t.capacity_mw, t.rotor_diameter_m, t.air_density_kg_m3, f)
+        for t, s, f in zip(turbines, surfaces, fine_pitch_deg)
+    ], dtype=np.float64)
+    combos, inverse = np.unique(
+        np.column_stack([[key_index[s.design_key] for s in surfaces], fine_pitch_deg, rated]).reshape(-1, 3),
+        axis=0, return_inverse=True,
+    )
+    tables = {f: np.zeros((len(combos), speeds.size)) for f in ("power_coefficient", "thrust_coefficient", "pitch_deg")}
+    for g, (key_i, fine_pitch, v_rated) in enumerate(combos):
+        curve = operating_curve(designs[int(key_i)], v_rated, speeds, fine_pitch)
+        for f, table in tables.items():
+            table[g] = curve[f]
+    inverse = inverse.ravel()
+    return AeroCurves(
+        speeds,
+        tables["power_coefficient"][inverse],
+        np.clip(tables["thrust_coefficient"][inverse], 0.0, CT_MAX),
+        tables["pitch_deg"][inverse],
+    )
+
+
+def _at(curves: AeroCurves, table: np.ndarray, wind_speed_mps: ArrayLike) -> np.ndarray:
+    """Each turbine's curve at wind speeds that broadcast against the (n,) fleet."""
+    v = np.asarray(wind_speed_mps, dtype=np.float64)
+    shape = np.broadcast_shapes(v.shape, (table.shape[0],))
+    i, w = _grid_index(curves.speeds_mps, np.broadcast_to(v, shape))
+    rows = np.broadcast_to(np.arange(table.shape[0]), shape)
+    return table[rows, i] * (1 - w) + table[rows, i + 1] * w
+
+
+def power_coefficient(curves: AeroCurves, wind_speed_mps: ArrayLike) -> np.ndarray:
+    return _at(curves, curves.cp, wind_speed_mps)
+
+
+def thrust_coefficient(curves: AeroCurves, wind_speed_mps: ArrayLike) -> np.ndarray:
+    return _at(curves, curves.ct, wind_speed_mps)
+
+
+def at_speed(params: physics.PhysicsParams, curves: Optional[AeroCurves], wind_speed_mps: ArrayLike) -> physics.PhysicsParams:
+    """``params`` with Cp read off the operating curves at ``wind_speed_mps``; unchanged without curves."""
+    if curves is None:
+        return params
+    return {**params, "power_coefficient": power_coefficient(curves, wind_speed_mps)}
+
+
+def turbine_aero(
+    turbine: Turbine,
+    blade: Optional[Blade],
+    surface: Surface,
+    curve_step_mps: float = 0.5,
+    include_surface: bool = False,
+    fine_pitch_deg: float = FINE_PITCH_DEG,
+) -> dict:
+    """Peak-Cp summary and operating curve (cut-in to cut-out) of one turbine."""
+    i, j = optimum(surface, fine_pitch_deg)
+    rated = float(rated_wind_speed(
+        surface, turbine.capacity_mw, turbine.rotor_diameter_m, turbine.air_density_kg_m3, fine_pitch_deg
+    ))
+    speeds = np.arange(turbine.cut_in_wind_speed_mps, turbine.cut_out_wind_speed_mps + 1e-9, curve_step_mps)
+    curve = operating_curve(surface, rated, speeds, fine_pitch_deg)
+    params = {**physics.turbine_params(turbine), "power_coefficient": curve["power_coefficient"]}
+    result = {
+        "turbine_id": turbine.id,
+        "blade_missing": blade is None,
+        "design_key": surface.design_key,
+        "airfoil_family": (blade if blade is not None else _DEFAULT_BLADE).airfoil_family,
+        "max_power_coefficient": float(surface.cp[i, j]),
+        "optimal_tip_speed_ratio": float(surface.tsr[i]),
+        "optimal_pitch_deg": float(surface.pitch_deg[j]),
+        "thrust_coefficient_at_max_cp": float(surface.ct[i, j]),
+        "rated_wind_speed_mps": rated,
+        "curve": {
+            "wind_speed_mps": speeds.tolist(),
+            **{k: v.tolist() for k, v in curve.items()},
+            "power_mw": physics.power_batch(speeds, params).tolist(),
+        },
+    }
+    if include_surface:
+        result["surface"] = {
+            "tip_speed_ratio": surface.tsr.tolist(),
+            "pitch_deg": surface.pitch_deg.tolist(),
+            "power_coefficient": surface.cp.tolist(),
+            "thrust_coefficient": surface.ct.tolist(),
+        }
+    return result
@@ -0,0 +1,147 @@
+"""Fleet-wide Campbell diagram: rotor 1P/3P excitation against tower frequency.
+
+Below rated wind speed the rotor tracks its design tip-speed ratio, so
+1P = λv / (2πR); above rated, pitch control holds rotor speed at its rated
+value. 1P and 3P are therefore non-decreasing in wind speed, which makes the
+violation intervals and minimum margins closed-form and lets the whole fleet
+be evaluated as arrays. A soft-stiff tower needs
+``1P·(1 + separation) ≤ f_n ≤ 3P·(1 − separation)`` across the operating range.
+"""
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.models.tower import Tower
+from app.models.turbine import Turbine
+
+DEFAULT_SEPARATION = 0.10  # ±10 % frequency separation, as in IEC 61400-style design practice
+MAX_CURVE_POINTS = 2_000
+
+
+def get_fleet_towers(session: Session, turbine_ids: Optional[Sequence[int]] = None) -> Tuple[List[Turbine], List[Optional[Tower]]]:
+    """Turbines with their Tower (or None) from one outer-joined SELECT."""
+    stmt = select(Turbine, Tower).outerjoin(Tower, Tower.turbine_id == Turbine.id).order_by(Turbine.id, Tower.id)
+    if turbine_ids is not None:
+        stmt = stmt.where(Turbine.id.in_(turbine_ids))
+    turbines, towers, seen = [], [], set()
+    for turbine, tower in session.exec(stmt).all():
+        if turbine.id in seen:
+            continue
+        seen.add(turbine.id)
+        turbines.append(turbine)
+        towers.append(tower)
+    return turbines, towers
+
+
+def one_p_hz(wind_speed_mps: np.ndarray, tip_speed_ratio, rotor_diameter_m, rated_wind_speed_mps) -> np.ndarray:
+    """Rotor rotation frequency, constant above rated wind speed."""
+    v = np.minimum(wind_speed_mps, rated_wind_speed_mps)
+    return tip_speed_ratio * v / (math.pi * rotor_diameter_m)
+
+
+def campbell_arrays(
+    cut_in_mps: np.ndarray,
+    cut_out_mps: np.ndarray,
+    rated_mps: np.ndarray,
+    tip_speed_ratio: np.ndarray,
+    rotor_diameter_m: np.ndarray,
+    tower_hz: np.ndarray,
+    separation: float = DEFAULT_SEPARATION,
+) -> dict[str, np.ndarray]:
+    """Bands, minimum margins and violation intervals for n turbines at once (all inputs shape (n,)).
+
+    ``violation_1p_from_mps``: 1P is too close to (or above) f_n for wind
+    speeds above this value, up to cut-out (NaN if never).
+    ``violation_3p_until_mps``: 3P is too close to (or below) f_n from cut-in
+    up to this value (NaN if never).
+    """
+    # 1P per m/s of wind below rated.
+    slope = tip_speed_ratio / (math.pi * rotor_diameter_m)
+    top = np.minimum(cut_out_mps, rated_mps)
+    one_p_min, one_p_max = slope * cut_in_mps, slope * top
+
+    # 1P·(1+s) > f_n  ⇔  v > f_n / ((1+s)·slope), reachable only below rated.
+    v_1p = tower_hz / ((1 + separation) * slope)
+    v_1p = np.where(v_1p < top, np.maximum(v_1p, cut_in_mps), np.nan)
+    # 3P·(1−s) < f_n  ⇔  v < f_n / (3(1−s)·slope); above rated 3P stops rising.
+    v_3p = tower_hz / (3 * (1 - separation) * slope)
+    v_3p = np.where(v_3p > cut_in_mps, np.where(v_3p > rated_mps, cut_out_mps, np.minimum(v_3p, cut_out_mps)), np.nan)
+
+    return {
+        "one_p_min_hz": one_p_min,
+        "one_p_max_hz": one_p_max,
+        "three_p_min_hz": 3 * one_p_min,
+        "three_p_max_hz": 3 * one_p_max,
+        "min_margin_to_1p_hz": tower_hz - one_p_max,
+        "min_margin_to_3p_hz": 3 * one_p_min - tower_hz,
+        "violation_1p_from_mps": v_1p,
+        "violation_3p_until_mps": v_3p,
+    }
+
+
+def _column(turbines: Sequence[Turbine], field: str) -> np.ndarray:
+    return np.fromiter((getattr(t, field) for t in turbines), dtype=np.float64, count=len(turbines))
+
+
+def _nan_to_none(values: np.ndarray) -> list:
+    return [None if math.isnan(x) else x for x in values.tolist()]
+
+
+def fleet_campbell(
+    turbines: Sequence[Turbine],
+    towers: Sequence[Optional[Tower]],
+    separation: float = DEFAULT_SEPARATION,
+    curve_step_mps: Optional[float] = None,
+) -> dict:
+    """Campbell check for the fleet returned by :func:`get_fleet_towers`.
+
+    With ``curve_step_mps`` each turbine also gets its 1P/3P curves sampled
+    over its operating range, for plotting. Turbines without a Tower row use
+    the model's default natural frequency and are flagged ``tower_missing``.
+    """
+    default_hz = Tower.model_fields["first_nat_freq_hz"].default
+    tower_hz = np.array([w.first_nat_freq_hz if w is not None else default_hz for w in towers], dtype=np.float64)
+    cut_in = _column(turbines, "cut_in_wind_speed_mps")
+    cut_out = _column(turbines, "cut_out_wind_speed_mps")
+    rated = _column(turbines, "rated_wind_speed_mps")
+    tsr = _column(turbines, "tip_speed_ratio")
+    diameter = _column(turbines, "rotor_diameter_m")
+    result = campbell_arrays(cut_in, cut_out, rated, tsr, diameter, tower_hz, separation)
+
+    lists = {k: v.tolist() for k, v in result.items() if not k.startswith("violation")}
+    v_1p = _nan_to_none(result["violation_1p_from_mps"])
+    v_3p = _nan_to_none(result["violation_3p_until_mps"])
+    rows = []
+    for i, (t, w) in enumerate(zip(turbines, towers)):
+        violations = []
+        if v_3p[i] is not None:
+            violations.append({"band": "3P", "start_mps": cut_in[i].item(), "end_mps": v_3p[i]})
+        if v_1p[i] is not None:
+            violations.append({"band": "1P", "start_mps": v_1p[i], "end_mps": cut_out[i].item()})
+        row = {
+            "turbine_id": t.id,
+            "name": t.name,
+            "first_nat_freq_hz": tower_hz[i].item(),
+            "tower_missing": w is None,
+            "cut_in_wind_speed_mps": cut_in[i].item(),
+            "cut_out_wind_speed_mps": cut_out[i].item(),
+            **{k: values[i] for k, values in lists.items()},
+            "is_soft_stiff": not violations,
+            "violations": violations,
+        }
+        if curve_step_mps is not None:
+            v = np.append(np.arange(cut_in[i], cut_out[i], curve_step_mps)[: MAX_CURVE_POINTS - 1], cut_out[i])
+            p1 = one_p_hz(v, tsr[i], diameter[i], rated[i])
+            row["curve"] = {"wind_speed_mps": v.tolist(), "one_p_hz": p1.tolist(), "three_p_hz": (3 * p1).tolist()}
+        rows.append(row)
+
+    return {
+        "separation": separation,
+        "turbine_count": len(rows),
+        "violating_turbine_count": sum(not r["is_soft_stiff"] for r in rows),
+        "min_margin_to_1p_hz": float(result["min_margin_to_1p_hz"].min()) if rows else None,
+        "min_margin_to_3p_hz": float(result["min_margin_to_3p_hz"].min()) if rows else None,
+        "turbines": rows,
+    }
@@ -1,4 +1,5 @@
 import math
+from typing import List, Optional, Sequence
 
 from fastapi import HTTPException
 from sqlmodel import Session, select
@@ -9,60 +10,140 @@ from app.models.generator import Generator
 from app.models.pitch_system import PitchSystem
 from app.models.yaw_system import YawSystem
 from app.models.tower import Tower
+from app.models.turbine import Turbine
 from app.models.wake_model import WakeModel
+from app.services import entity_cache
+from app.services.output_buffer import output_buffer
 
 
 # --- CRUD ---
 
 def get_gearbox(session: Session, turbine_id: int) -> Gearbox:
-    result = session.exec(select(Gearbox).where(Gearbox.turbine_id == turbine_id)).first()
+    result = entity_cache.get_or_load(
+        Gearbox, turbine_id,
+        lambda: session.exec(select(Gearbox).where(Gearbox.turbine_id == turbine_id)).first(),
+    )
     if not result:
         raise HTTPException(status_code=404, detail="Gearbox not found for this turbine")
     return result
 
 
 def get_generator(session: Session, turbine_id: int) -> Generator:
-    result = session.exec(select(Generator).where(Generator.turbine_id == turbine_id)).first()
+    result = entity_cache.get_or_load(
+        Generator, turbine_id,
+        lambda: session.exec(select(Generator).where(Generator.turbine_id == turbine_id)).first(),
+    )
     if not result:
         raise HTTPException(status_code=404, detail="Generator not found for this turbine")
     return result
 
 
 def get_blade(session: Session, turbine_id: int) -> Blade:
-    result = session.exec(select(Blade).where(Blade.turbine_id == turbine_id)).first()
+    result = entity_cache.get_or_load(
+        Blade, turbine_id,
+        lambda: session.exec(select(Blade).where(Blade.turbine_id == turbine_id)).first(),
+    )
     if not result:
         raise HTTPException(status_code=404, detail="Blade not found for this turbine")
     return result
 
 
 def get_pitch_system(session: Session, turbine_id: int) -> PitchSystem:
-    result = session.exec(select(PitchSystem).where(PitchSystem.turbine_id == turbine_id)).first()
+    result = entity_cache.get_or_load(
+        PitchSystem, turbine_id,
+        lambda: session.exec(select(PitchSystem).where(PitchSystem.turbine_id == turbine_id)).first(),
+    )
     if not result:
         raise HTTPException(status_code=404, detail="PitchSystem not found for this turbine")
     return result
 
 
 def get_yaw_system(session: Session, turbine_id: int) -> YawSystem:
-    result = session.exec(select(YawSystem).where(YawSystem.turbine_id == turbine_id)).first()
+    result = entity_cache.get_or_load(
+        YawSystem, turbine_id,
+        lambda: session.exec(select(YawSystem).where(YawSystem.turbine_id == turbine_id)).first(),
+    )
     if not result:
         raise HTTPException(status_code=404, detail="YawSystem not found for this turbine")
     return result
 
 
 def get_tower(session: Session, turbine_id: int) -> Tower:
-    result = session.exec(select(Tower).where(Tower.turbine_id == turbine_id)).first()
+    result = entity_cache.get_or_load(
+        Tower, turbine_id,
+        lambda: session.exec(select(Tower).where(Tower.turbine_id == turbine_id)).first(),
+    )
     if not result:
         raise HTTPException(status_code=404, detail="Tower not found for this turbine")
     return result
 
 
 def get_wake_model(session: Session, turbine_id: int) -> WakeModel:
-    result = session.exec(select(WakeModel).where(WakeModel.turbine_id == turbine_id)).first()
+    result = entity_cache.get_or_load(
+        WakeModel, turbine_id,
+        lambda: session.exec(select(WakeModel).where(WakeModel.turbine_id == turbine_id)).first(),
+    )
     if not result:
         raise HTTPException(status_code=404, detail="WakeModel not found for this turbine")
     return result
 
 
+# --- Aggregate ---
+
+# Response key -> model, in the order components are joined and reported.
+COMPONENT_MODELS = {
+    "gearbox": Gearbox,
+    "generator": Generator,
+    "blade": Blade,
+    "pitch_system": PitchSystem,
+    "yaw_system": YawSystem,
+    "tower": Tower,
+    "wake_model": WakeModel,
+}
+
+
+def get_turbines_full(session: Session, turbine_ids: Optional[Sequence[int]] = None) -> List[dict]:
+    """Turbines with all seven components from one outer-joined SELECT.
+
+    Missing components are reported inline under ``errors`` with the same
+    detail the per-component routes return as a 404.
+    """
+    models = list(COMPONENT_MODELS.values())
+    stmt = select(Turbine, *models)
+    for model in models:
+        stmt = stmt.outerjoin(model, model.turbine_id == Turbine.id)
+    if turbine_ids is not None:
+        stmt = stmt.where(Turbine.id.in_(turbine_ids))
+    stmt = stmt.order_by(Turbine.id, *(model.id for model in models))
+
+    by_turbine: dict[int, dict] = {}
+    for turbine, *components in session.exec(stmt).all():
+        entry = by_turbine.get(turbine.id)
+        if entry is None:
+            entry = by_turbine[turbine.id] = {
+                **output_buffer.overlay(turbine).model_dump(),
+                **dict.fromkeys(COMPONENT_MODELS),
+            }
+        for key, component in zip(COMPONENT_MODELS, components):
+            if entry[key] is None:
+                entry[key] = component
+
+    for entry in by_turbine.values():
+        entry["errors"] = {
+            key: f"{model.__name__} not found for this turbine"
+            for key, model in COMPONENT_MODELS.items()
+            if entry[key] is None
+        }
+    return list(by_turbine.values())
+
+
+def get_turbine_full(session: Session, turbine_id: int) -> dict:
+    result = get_turbines_full(session, [turbine_id])
+    if not result:
+        raise HTTPException(status_code=404, detail="Turbine not found")
+    return result[0]
+
+
 # --- Physics ---
 
 def yaw_power_loss(yaw_error_deg: float) -> dict:
@@ -0,0 +1,228 @@
+"""Rotor shaft → gearbox → generator → electrical output.
+
+Each stage loses ``P_rated_in · (a·s + b·x + c·x²)``, where x is the stage's
+input load fraction and s its speed fraction. The constant part covers
+churning, windage and iron losses and scales with speed. The linear part is
+gear-mesh friction and the quadratic part copper losses. Shares are fixed
+per stage and scaled so that efficiency at rated load and speed equals the
+stored ``efficiency``, which gives the usual part-load efficiency curve.
+A Generator with ``gearbox_id`` None is direct drive: there is no gearbox
+stage and the generator turns at rotor speed.
+
+Coefficients depend only on a turbine's Gearbox and Generator rows, so they
+are built once per turbine, cached, and stacked into arrays. A fleet is then
+evaluated over any grid of operating points by broadcasting.
+"""
+import math
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+from sqlmodel import Session, select
+
+from app.cache import LRUCache
+from app.config import ENTITY_CACHE_MAXSIZE, ENTITY_CACHE_TTL_S
+from app.models.gearbox import Gearbox
+from app.models.generator import Generator
+from app.models.turbine import Turbine
+from app.services import physics
+
+# Loss shares (constant·speed, linear, quadratic) at rated load.
+GEARBOX_LOSS_SHARES = (0.3, 0.7, 0.0)
+GENERATOR_LOSS_SHARES = (0.35, 0.0, 0.65)
+
+
+class DrivetrainCoefficients(NamedTuple):
+    direct_drive: bool
+    gearbox_missing: bool
+    generator_missing: bool
+    gear_ratio: float
+    gearbox_rated_input_mw: float
+    gearbox_rated_rpm: float
+    gearbox_loss_mw: tuple         # (constant, linear, quadratic) at rated input
+    generator_rated_input_mw: float
+    generator_rated_rpm: float
+    generator_loss_mw: tuple
+    pole_pairs: float
+    tan_phi: float                 # Q / P at the rated power factor
+
+
+# The default row for whichever component is missing.
+_DEFAULT_GEARBOX = Gearbox(turbine_id=0)
+_DEFAULT_GENERATOR = Generator(turbine_id=0)
+
+_coefficients: LRUCache[DrivetrainCoefficients] = LRUCache(maxsize=ENTITY_CACHE_MAXSIZE, ttl_s=ENTITY_CACHE_TTL_S)
+
+
+def build_coefficients(turbine: Turbine, gearbox: Optional[Gearbox], generator: Optional[Generator]) -> DrivetrainCoefficients:
+    # Without a Generator row, the drivetrain is geared if the turbine has a gearbox.
+    direct_drive = generator.gearbox_id is None if generator is not None else gearbox is None
+    gb = gearbox if gearbox is not None else _DEFAULT_GEARBOX
+    gen = generator if generator is not None else _DEFAULT_GENERATOR
+    gb_rated = turbine.capacity_mw
+    gb_loss = tuple(0.0 if direct_drive else gb_rated * (1 - gb.efficiency) * s for s in GEARBOX_LOSS_SHARES)
+    gen_rated = gen.rated_power_kw / 1000 / gen.efficiency
+    gen_loss = tuple(gen_rated * (1 - gen.efficiency) * s for s in GENERATOR_LOSS_SHARES)
+    return DrivetrainCoefficients(
+        direct_drive=direct_drive,
+        gearbox_missing=gearbox is None,
+        generator_missing=generator is None,
+        gear_ratio=1.0 if direct_drive else gb.gear_ratio,
+        gearbox_rated_input_mw=gb_rated,
+        gearbox_rated_rpm=gb.input_speed_rpm,
+        gearbox_loss_mw=gb_loss,
+        generator_rated_input_mw=gen_rated,
+        generator_rated_rpm=gen.rated_speed_rpm,
+        generator_loss_mw=gen_loss,
+        pole_pairs=float(gen.pole_pairs),
+        tan_phi=math.tan(math.acos(min(max(gen.power_factor, 0.0), 1.0))),
+    )
+
+
+def get_coefficients(session: Session, turbines: Sequence[Turbine]) -> List[DrivetrainCoefficients]:
+    """Cached coefficients per turbine; misses are loaded with one query per component table."""
+    found: Dict[int, DrivetrainCoefficients] = {}
+    missing = []
+    for t in turbines:
+        cached = _coefficients.get(t.id)
+        if cached is not None:
+            found[t.id] = cached
+        else:
+            missing.append(t)
+    if missing:
+        ids = [t.id for t in missing]
+        gearboxes = session.exec(select(Gearbox).where(Gearbox.turbine_id.in_(ids)).order_by(Gearbox.id)).all()
+        generators = session.exec(select(Generator).where(Generator.turbine_id.in_(ids)).order_by(Generator.id)).all()
+        gearbox_by_id = {g.id: g for g in gearboxes}
+        first_gearbox: Dict[int, Gearbox] = {}
+        for g in gearboxes:
+            first_gearbox.setdefault(g.turbine_id, g)
+        first_generator: Dict[int, Generator] = {}
+        for g in generators:
+            first_generator.setdefault(g.turbine_id, g)
+        for t in missing:
+            generator = first_generator.get(t.id)
+            gearbox = first_gearbox.get(t.id)
+            if generator is not None and generator.gearbox_id is not None:
+                gearbox = gearbox_by_id.get(generator.gearbox_id, gearbox)
+            found[t.id] = build_coefficients(t, gearbox, generator)
+            _coefficients.put(t.id, found[t.id])
+    return [found[t.id] for t in turbines]
+
+
+def stack(coefficients: Sequence[DrivetrainCoefficients]) -> dict[str, np.ndarray]:
+    """Columnar (n,) arrays; the loss triples become (n, 3)."""
+    n = len(coefficients)
+    return {
+        field: np.array([c[i] for c in coefficients], dtype=np.float64).reshape((n, 3) if field.endswith("_loss_mw") else (n,))
+        for i, field in enumerate(DrivetrainCoefficients._fields)
+    }
+
+
+def _ratio(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """a / b, zero where b is not positive."""
+    return np.divide(a, b, out=np.zeros(a.shape), where=np.broadcast_to(b > 0, a.shape))
+
+
+def _stage_loss(power_in: np.ndarray, speed_fraction: np.ndarray, rated_in: np.ndarray, loss: np.ndarray) -> np.ndarray:
+    """Stage loss, never more than the power flowing into it."""
+    x = _ratio(power_in, rated_in)
+    total = loss[:, 0] * speed_fraction + loss[:, 1] * x + loss[:, 2] * x * x
+    return np.clip(total, 0.0, np.maximum(power_in, 0.0))
+
+
+def compute_batch(rotor_rpm: ArrayLike, shaft_power_mw: ArrayLike, coefficients: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Drivetrain state for operating points that broadcast against the (n,) coefficient arrays.
+
+    A fleet over m wind speeds is evaluated by passing (m, 1) or (m, n) inputs.
+    """
+    c = coefficients
+    shape = np.broadcast_shapes(np.shape(rotor_rpm), np.shape(shaft_power_mw), c["gear_ratio"].shape)
+    rpm = np.broadcast_to(np.asarray(rotor_rpm, dtype=np.float64), shape)
+    p_shaft = np.broadcast_to(np.asarray(shaft_power_mw, dtype=np.float64), shape)
+
+    hss_rpm = rpm * c["gear_ratio"]
+    gearbox_loss = _stage_loss(p_shaft, _ratio(rpm, c["gearbox_rated_rpm"]), c["gearbox_rated_input_mw"], c["gearbox_loss_mw"])
+    p_gen_in = p_shaft - gearbox_loss
+    generator_loss = _stage_loss(p_gen_in, _ratio(hss_rpm, c["generator_rated_rpm"]), c["generator_rated_input_mw"], c["generator_loss_mw"])
+    active = p_gen_in - generator_loss
+    reactive = active * c["tan_phi"]
+    return {
+        "rotor_rpm": rpm,
+        "shaft_power_mw": p_shaft,
+        "high_speed_shaft_rpm": hss_rpm,
+        "gearbox_loss_mw": gearbox_loss,
+        "generator_input_mw": p_gen_in,
+        "generator_loss_mw": generator_loss,
+        "active_power_mw": active,
+        "reactive_power_mvar": reactive,
+        "apparent_power_mva": np.hypot(active, reactive),
+        "electrical_frequency_hz": hss_rpm * c["pole_pairs"] / 60,
+        "drivetrain_efficiency": _ratio(active, p_shaft),
+    }
+
+
+def invalidate(turbine_id: int) -> None:
+    """Drop cached coefficients (called when the turbine row changes)."""
+    _coefficients.pop(turbine_id)
+
+
+def cache_stats() -> dict:
+    return _coefficients.stats()
+
+
+# --- Wind speed → electrical output ---
+
+def _rotor_rpm(wind_speed_mps: np.ndarray, params: physics.PhysicsParams, rated_wind_speed_mps) -> np.ndarray:
+    # Pitch control holds rotor speed constant above rated, as in the Campbell
+    # check; at and above cut-out the machine is feathered and stopped, as in
+    # physics.power_batch.
+    rpm = physics.rotor_rpm_batch(np.minimum(wind_speed_mps, rated_wind_speed_mps), params)
+    return np.where(wind_speed_mps >= params["cut_out_wind_speed_mps"], 0.0, rpm)
+
+
+def _flags(c: DrivetrainCoefficients) -> dict:
+    return {"direct_drive": c.direct_drive, "gearbox_missing": c.gearbox_missing, "generator_missing": c.generator_missing}
+
+
+def turbine_drivetrain(turbine: Turbine, coefficients: DrivetrainCoefficients, wind_speed_mps: float) -> dict:
+    params = physics.turbine_params(turbine)
+    result = compute_batch(
+        _rotor_rpm(wind_speed_mps, params, turbine.rated_wind_speed_mps),
+        physics.power_batch(wind_speed_mps, params),
+        stack([coefficients]),
+    )
+    return {
+        "turbine_id": turbine.id,
+        "wind_speed_mps": wind_speed_mps,
+        **_flags(coefficients),
+        "gear_ratio": coefficients.gear_ratio,
+        **{k: float(v[0]) for k, v in result.items()},
+    }
+
+
+def fleet_drivetrain(
+    turbines: Sequence[Turbine], coefficients: Sequence[DrivetrainCoefficients], wind_speeds_mps: Sequence[float]
+) -> dict:
+    """Every turbine over a wind-speed grid in one broadcast pass; per-turbine columns follow the grid."""
+    v = np.asarray(wind_speeds_mps, dtype=np.float64)[:, None]
+    params = physics.turbine_params(turbines)
+    rated = np.array([t.rated_wind_speed_mps for t in turbines], dtype=np.float64)
+    result = compute_batch(_rotor_rpm(v, params, rated), physics.power_batch(v, params), stack(coefficients))
+    columns = {k: a.T.tolist() for k, a in result.items()}
+    return {
+        "wind_speed_mps": v.ravel().tolist(),
+        "turbine_count": len(turbines),
+        "total_active_power_mw": result["active_power_mw"].sum(axis=1).tolist(),
+        "total_reactive_power_mvar": result["reactive_power_mvar"].sum(axis=1).tolist(),
+        "turbines": [
+            {
+                "turbine_id": t.id,
+                "name": t.name,
+                **_flags(c),
+                "gear_ratio": c.gear_ratio,
+                **{k: col[i] for k, col in columns.items()},
+            }
+            for i, (t, c) in enumerate(zip(turbines, coefficients))
+        ],
+    }
@@ -0,0 +1,41 @@
+"""Read-through cache for Turbine and component rows.
+
+Values are detached copies (``model.model_validate(row)``) so one instance can
+be shared across requests without being bound to, or expired by, any session.
+Code that modifies a row must load it from its own session, never from here,
+and invalidate the turbine afterwards.
+"""
+from typing import Callable, Optional, Type, TypeVar
+
+from sqlmodel import SQLModel
+
+from app.cache import LRUCache
+from app.config import ENTITY_CACHE_ENABLED, ENTITY_CACHE_MAXSIZE, ENTITY_CACHE_TTL_S
+
+M = TypeVar("M", bound=SQLModel)
+
+entity_cache: LRUCache[SQLModel] = LRUCache(
+    maxsize=ENTITY_CACHE_MAXSIZE, ttl_s=ENTITY_CACHE_TTL_S, enabled=ENTITY_CACHE_ENABLED
+)
+_cached_models: set[str] = set()
+
+
+def get_or_load(model: Type[M], turbine_id: int, load: Callable[[], Optional[M]]) -> Optional[M]:
+    """Cached row of ``model`` for this turbine, calling ``load`` on a miss. Misses are not cached."""
+    key = (model.__name__, turbine_id)
+    cached = entity_cache.get(key)
+    if cached is not None:
+        return cached
+    row = load()
+    if row is not None:
+        row = model.model_validate(row)
+        _cached_models.add(model.__name__)
+        entity_cache.put(key, row)
+    return row
+
+
+def invalidate_turbine(turbine_id: int, components: bool = True) -> None:
+    """Drop the cached turbine and, unless told otherwise, every component cached under its id."""
+    names = list(_cached_models) if components else ["Turbine"]
+    for name in names:
+        entity_cache.pop((name, turbine_id))
@@ -0,0 +1,123 @@
+"""Streaming fleet exports.
+
+Rows are read from a server-side cursor in chunks of ``CHUNK_ROWS`` and
+serialised chunk by chunk, so memory stays flat however large the fleet.
+Each export opens its own session: the response body is produced after the
+request handler (and its session) has returned.
+"""
+import csv
+import io
+import json
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlmodel import Session
+
+from app.database import engine
+from app.models.turbine import Turbine
+from app.services import physics
+from app.services.components import COMPONENT_MODELS
+from app.services.output_buffer import output_buffer
+
+CHUNK_ROWS = 1000
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+PHYSICS_COLUMNS = tuple(f"physics.{k}" for k in ("power_mw", "wind_power_available_mw", "rotor_rpm", "swept_area_m2", "tip_speed_mps"))
+SWEEP_COLUMNS = ("turbine_id", "wind_speed_mps", "power_mw", "wind_power_available_mw", "rotor_rpm", "tip_speed_mps")
+
+_turbine = Turbine.__table__
+
+
+def _component_columns(components: bool) -> list:
+    """Component columns labelled ``<component>.<column>``, minus their own keys."""
+    if not components:
+        return []
+    return [
+        col.label(f"{key}.{col.name}")
+        for key, model in COMPONENT_MODELS.items()
+        for col in model.__table__.columns
+        if col.name not in ("id", "turbine_id")
+    ]
+
+
+def turbine_columns(components: bool = True, wind_speed_mps: Optional[float] = None) -> List[str]:
+    names = [c.name for c in _turbine.columns] + [c.name for c in _component_columns(components)]
+    return names + list(PHYSICS_COLUMNS) if wind_speed_mps is not None else names
+
+
+def _chunks(stmt, session: Session) -> Iterator[list]:
+    result = session.connection().execution_options(stream_results=True, yield_per=CHUNK_ROWS).execute(stmt)
+    for partition in result.mappings().partitions():
+        yield partition
+
+
+def turbine_rows(components: bool = True, wind_speed_mps: Optional[float] = None) -> Iterator[List[dict]]:
+    """Chunks of flat export rows: turbine columns, then components, then physics."""
+    stmt = select(_turbine, *_component_columns(components))
+    order = [_turbine.c.id]
+    if components:
+        for model in COMPONENT_MODELS.values():
+            table = model.__table__
+            stmt = stmt.outerjoin(table, table.c.turbine_id == _turbine.c.id)
+            order.append(table.c.id)
+    stmt = stmt.order_by(*order)
+
+    last_id = None
+    with Session(engine) as session:
+        for partition in _chunks(stmt, session):
+            rows = []
+            for mapping in partition:
+                # A turbine with duplicate component rows joins to several; keep the first.
+                if mapping["id"] == last_id:
+                    continue
+                last_id = mapping["id"]
+                row = dict(mapping)
+                buffered = output_buffer.get(row["id"])
+                if buffered is not None:
+                    row["current_output_mw"] = buffered
+                rows.append(row)
+            if wind_speed_mps is not None and rows:
+                columns = physics.compute_batch(wind_speed_mps, _params(rows))
+                for i, row in enumerate(rows):
+                    for name in PHYSICS_COLUMNS:
+                        row[name] = float(columns[name.removeprefix("physics.")][i])
+            yield rows
+
+
+def _params(rows: Sequence[dict]) -> dict[str, np.ndarray]:
+    return {f: np.fromiter((r[f] for r in rows), dtype=np.float64, count=len(rows)) for f in physics.PHYSICS_FIELDS}
+
+
+def sweep_rows(start_mps: float, stop_mps: float, step_mps: float) -> Iterator[List[dict]]:
+    """Chunks of (turbine, wind speed) physics rows over ``[start, stop]`` for every turbine."""
+    speeds = np.arange(start_mps, stop_mps + step_mps / 2, step_mps)
+    per_chunk = max(1, CHUNK_ROWS // speeds.size)
+    stmt = select(_turbine.c.id, *(_turbine.c[f] for f in physics.PHYSICS_FIELDS)).order_by(_turbine.c.id)
+    with Session(engine) as session:
+        result = session.connection().execution_options(stream_results=True, yield_per=per_chunk).execute(stmt)
+        for partition in result.mappings().partitions():
+            columns = physics.compute_batch(speeds[:, None], _params(partition))
+            ids = np.array([r["id"] for r in partition])
+            table = {"turbine_id": np.broadcast_to(ids, columns["power_mw"].shape), **columns}
+            # Turbine-major order: every speed for one turbine, then the next.
+            flat = {k: table[k].T.ravel().tolist() for k in SWEEP_COLUMNS}
+            yield [dict(zip(SWEEP_COLUMNS, values)) for values in zip(*(flat[k] for k in SWEEP_COLUMNS))]
+
+
+def ndjson(chunks: Iterable[List[dict]]) -> Iterator[str]:
+    for rows in chunks:
+        if rows:
+            yield "".join(json.dumps(row) + "\n" for row in rows)
+
+
+def csv_text(chunks: Iterable[List[dict]], columns: Sequence[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
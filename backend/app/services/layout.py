@@ -0,0 +1,590 @@
+"""Layout optimisation: turbine positions inside a site polygon that maximise net AEP.
+
+Candidates are always feasible: every turbine lies inside the polygon and at
+least ``min_spacing_diameters`` rotor diameters from every other. A layout is
+scored with ``aep.compute_aep`` on a local east/north plane (the same
+equirectangular projection as ``wake.project_positions``). Each batch of
+candidates (a generation, or a block of random layouts) is split across the
+process pool.
+
+- ``random``: population_size × generations independent random layouts.
+- ``genetic``: tournament selection, a line-cut crossover that keeps parent
+  A's turbines on one side of a random line and parent B's on the other,
+  Gaussian moves as mutation, and the best layouts carried over unchanged.
+
+Either search is followed by greedy refinement. Each pass tries random moves
+of every turbine in one batch and applies the best non-conflicting moves.
+The step size halves every pass.
+
+Jobs run on a background thread and are tracked in this process only. The
+best layout is written back as new turbines, each with one default row of
+every component, in a single transaction.
+"""
+import logging
+import math
+import secrets
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.config import LAYOUT_JOB_HISTORY, LAYOUT_MAX_RUNNING_JOBS, LAYOUT_SHUTDOWN_TIMEOUT_S, PROCESS_POOL_WORKERS
+from app.database import engine
+from app.models.blade import Blade
+from app.models.gearbox import Gearbox
+from app.models.generator import Generator
+from app.models.tower import Tower
+from app.models.turbine import Turbine
+from app.seed import SEED_COMPONENTS
+from app.services import drivetrain, entity_cache, physics
+from app.services import wake as wake_service
+from app.services.aep import HOURS_PER_YEAR, WindRose, compute_aep
+from app.services.pool import parallel_map, split
+from app.services.spatial import spatial_index
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on layout evaluations × turbines × wind-rose bins per job
+# (roughly ten minutes of CPU on one core; the pool divides it).
+MAX_TURBINE_EVALUATIONS = 1_500_000_000
+# Below this many layouts × turbines per batch, evaluate in-process.
+MIN_PARALLEL_TURBINE_LAYOUTS = 2_000
+# Random points tried per turbine before a placement is declared impossible.
+PLACEMENT_ATTEMPTS = 500
+TOURNAMENT_SIZE = 3
+ELITE_LAYOUTS = 2
+MUTATION_RATE = 0.15
+# Mutation and first refinement step, in minimum spacings.
+MUTATION_STEP = 0.5
+REFINE_STEP = 1.0
+REFINE_CANDIDATES = 8       # moves tried per turbine and pass
+
+
+class Site(NamedTuple):
+    polygon: np.ndarray     # (V, 2) east/north metres from the vertex centroid
+    lat0: float             # projection origin, radians
+    lon0: float
+    min_spacing_m: float
+
+
+class _Evaluation(NamedTuple):
+    rose: WindRose
+    params: dict
+    wakes: dict
+    superposition: str
+    max_distance_m: float
+    layouts: List[np.ndarray]
+
+
+def make_site(latitudes: Sequence[float], longitudes: Sequence[float], min_spacing_m: float) -> Site:
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    lat0, lon0 = float(lat.mean()), float(lon.mean())
+    x = (lon - lon0) * math.cos(lat0) * wake_service.EARTH_RADIUS_M
+    y = (lat - lat0) * wake_service.EARTH_RADIUS_M
+    polygon = np.column_stack([x, y])
+    if _area(polygon) <= 0:
+        raise ValueError("site_polygon must enclose a positive area")
+    return Site(polygon, lat0, lon0, min_spacing_m)
+
+
+def to_lat_lon(site: Site, xy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    lat = site.lat0 + xy[:, 1] / wake_service.EARTH_RADIUS_M
+    lon = site.lon0 + xy[:, 0] / (math.cos(site.lat0) * wake_service.EARTH_RADIUS_M)
+    return np.degrees(lat), np.degrees(lon)
+
+
+def _area(polygon: np.ndarray) -> float:
+    x, y = polygon[:, 0], polygon[:, 1]
+    return abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))) / 2
+
+
+def inside(polygon: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Even-odd point-in-polygon test, vectorised over points."""
+    px, py = polygon[:, 0], polygon[:, 1]
+    qx, qy = np.roll(px, -1), np.roll(py, -1)
+    x, y = np.asarray(x, dtype=np.float64)[..., None], np.asarray(y, dtype=np.float64)[..., None]
+    crosses = (py > y) != (qy > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = px + (y - py) * (qx - px) / (qy - py)
+    return (crosses & (x < x_cross)).sum(axis=-1) % 2 == 1
+
+
+def _feasible(site: Site, xy: np.ndarray, i: int, p: np.ndarray) -> bool:
+    """Whether turbine i may move to p."""
+    if not inside(site.polygon, p[0], p[1]):
+        return False
+    d2 = ((xy - p) ** 2).sum(axis=1)
+    d2[i] = np.inf
+    return bool((d2 >= site.min_spacing_m ** 2).all())
+
+
+def _fill(rng: np.random.Generator, site: Site, xy: np.ndarray, n: int) -> Optional[np.ndarray]:
+    """Add random feasible turbines until there are n; None if the site runs out of room."""
+    points = list(xy)
+    lo, hi = site.polygon.min(axis=0), site.polygon.max(axis=0)
+    spacing2 = site.min_spacing_m ** 2
+    budget = PLACEMENT_ATTEMPTS * (n - len(points))
+    while len(points) < n and budget > 0:
+        batch = rng.uniform(lo, hi, size=(min(budget, 4 * n), 2))
+        budget -= len(batch)
+        for p in batch[inside(site.polygon, batch[:, 0], batch[:, 1])]:
+            if not points or (((np.asarray(points) - p) ** 2).sum(axis=1) >= spacing2).all():
+                points.append(p)
+                if len(points) == n:
+                    break
+    return np.asarray(points).reshape(-1, 2) if len(points) == n else None
+
+
+def random_layout(rng: np.random.Generator, site: Site, n: int) -> np.ndarray:
+    xy = _fill(rng, site, np.empty((0, 2)), n)
+    if xy is None:
+        raise ValueError(
+            f"Could not place {n} turbines in the site polygon {site.min_spacing_m:.0f} m apart; "
+            "enlarge the site or reduce turbine_count or min_spacing_diameters"
+        )
+    return xy
+
+
+def _mutate(rng: np.random.Generator, site: Site, xy: np.ndarray) -> np.ndarray:
+    xy = xy.copy()
+    for i in np.flatnonzero(rng.random(len(xy)) < MUTATION_RATE):
+        p = xy[i] + rng.normal(0.0, MUTATION_STEP * site.min_spacing_m, 2)
+        if _feasible(site, xy, i, p):
+            xy[i] = p
+    return xy
+
+
+def _crossover(rng: np.random.Generator, site: Site, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    angle = rng.uniform(0.0, math.pi)
+    u = np.array([math.cos(angle), math.sin(angle)])
+    cut = np.quantile(a @ u, rng.uniform())
+    child = [p for p in a if p @ u < cut]
+    spacing2 = site.min_spacing_m ** 2
+    for p in b[b @ u >= cut]:
+        if len(child) == len(a):
+            break
+        if not child or (((np.asarray(child) - p) ** 2).sum(axis=1) >= spacing2).all():
+            child.append(p)
+    filled = _fill(rng, site, np.asarray(child).reshape(-1, 2), len(a))
+    return filled if filled is not None else a.copy()
+
+
+def _tournament(rng: np.random.Generator, scores: np.ndarray) -> int:
+    picks = rng.integers(0, scores.size, TOURNAMENT_SIZE)
+    return int(picks[np.argmax(scores[picks])])
+
+
+def _evaluate(task: _Evaluation) -> List[float]:
+    """Net AEP (MWh) of each layout in the task (runs in a worker)."""
+    out = []
+    for xy in task.layouts:
+        geometry = wake_service.pair_geometry(xy[:, 0], xy[:, 1], task.max_distance_m)
+        result = compute_aep(task.rose, geometry, task.params, task.wakes, task.superposition, workers=1)
+        out.append(float(result["net_mwh"].sum()))
+    return out
+
+
+class Problem(NamedTuple):
+    site: Site
+    rose: WindRose
+    params: dict
+    wakes: dict
+    superposition: str
+    max_distance_m: float
+    turbine_count: int
+
+    def evaluate(self, layouts: List[np.ndarray]) -> np.ndarray:
+        workers = PROCESS_POOL_WORKERS
+        if len(layouts) * self.turbine_count < MIN_PARALLEL_TURBINE_LAYOUTS:
+            workers = 1
+        tasks = [
+            _Evaluation(self.rose, self.params, self.wakes, self.superposition, self.max_distance_m, chunk)
+            for chunk in split(layouts, workers)
+        ]
+        results = [_evaluate(t) for t in tasks] if workers == 1 else parallel_map(_evaluate, tasks)
+        return np.array([v for chunk in results for v in chunk])
+
+
+def make_problem(
+    site: Site,
+    rose: WindRose,
+    template: Turbine,
+    turbine_count: int,
+    superposition: str = "rss",
+    max_distance_m: Optional[float] = None,
+) -> Problem:
+    """New turbines get default WakeModel rows, so Ct and k are the model defaults."""
+    if superposition not in wake_service.SUPERPOSITION_RULES:
+        raise ValueError(f"Unknown superposition rule {superposition!r}")
+    if max_distance_m is None:
+        max_distance_m = wake_service.DEFAULT_CUTOFF_DIAMETERS * template.rotor_diameter_m
+    params = {k: np.asarray(v, dtype=np.float64) for k, v in physics.turbine_params([template] * turbine_count).items()}
+    wakes = wake_service.wake_params([None] * turbine_count)
+    return Problem(site, rose, params, wakes, superposition, max_distance_m, turbine_count)
+
+
+def planned_evaluations(algorithm: str, turbine_count: int, population_size: int, generations: int, refine_passes: int) -> int:
+    search = population_size * generations if algorithm == "random" else population_size * (generations + 1)
+    return search + refine_passes * (turbine_count * REFINE_CANDIDATES + 1)
+
+
+Progress = Callable[[str, int, float], None]   # (phase, evaluations, best net MWh); raises to abort
+
+
+def search(
+    problem: Problem,
+    rng: np.random.Generator,
+    algorithm: str,
+    population_size: int,
+    generations: int,
+    progress: Progress,
+) -> tuple[np.ndarray, float]:
+    """Best layout found and its net AEP."""
+    n, site = problem.turbine_count, problem.site
+    evaluations = 0
+    if algorithm == "random":
+        best, best_score = None, -math.inf
+        for _ in range(generations):
+            layouts = [random_layout(rng, site, n) for _ in range(population_size)]
+            scores = problem.evaluate(layouts)
+            evaluations += len(layouts)
+            i = int(np.argmax(scores))
+            if scores[i] > best_score:
+                best, best_score = layouts[i], float(scores[i])
+            progress("search", evaluations, best_score)
+        return best, best_score
+    if algorithm != "genetic":
+        raise ValueError(f"Unknown layout algorithm {algorithm!r}")
+
+    population = [random_layout(rng, site, n) for _ in range(population_size)]
+    scores = problem.evaluate(population)
+    evaluations += len(population)
+    progress("search", evaluations, float(scores.max()))
+    for _ in range(generations):
+        order = np.argsort(scores)[::-1]
+        elite = [population[i] for i in order[:ELITE_LAYOUTS]]
+        children = [
+            _mutate(rng, site, _crossover(rng, site, population[_tournament(rng, scores)], population[_tournament(rng, scores)]))
+            for _ in range(population_size - len(elite))
+        ]
+        child_scores = problem.evaluate(children)
+        evaluations += len(children)
+        population = elite + children
+        scores = np.concatenate([scores[order[:ELITE_LAYOUTS]], child_scores])
+        progress("search", evaluations, float(scores.max()))
+    i = int(np.argmax(scores))
+    return population[i], float(scores[i])
+
+
+def refine(
+    problem: Problem,
+    rng: np.random.Generator,
+    xy: np.ndarray,
+    score: float,
+    passes: int,
+    progress: Progress,
+    evaluations: int = 0,
+) -> tuple[np.ndarray, float]:
+    """Greedy single-turbine moves, evaluated as one batch per pass."""
+    site = problem.site
+    for k in range(passes):
+        step = REFINE_STEP * site.min_spacing_m / 2 ** k
+        moves = []
+        for i in range(len(xy)):
+            for p in xy[i] + rng.normal(0.0, step, (REFINE_CANDIDATES, 2)):
+                if _feasible(site, xy, i, p):
+                    moves.append((i, p))
+        candidates = []
+        for i, p in moves:
+            c = xy.copy()
+            c[i] = p
+            candidates.append(c)
+        gains = problem.evaluate(candidates) - score if candidates else np.empty(0)
+        evaluations += len(candidates)
+        if gains.size == 0 or gains.max() <= 0:
+            progress("refine", evaluations, score)
+            continue
+        # Apply every improving move that is still feasible, best first, then
+        # keep the combination only if it beats the single best move.
+        best_move = int(np.argmax(gains))
+        combined, moved = xy.copy(), set()
+        for j in np.argsort(gains)[::-1]:
+            i, p = moves[j]
+            if gains[j] <= 0:
+                break
+            if i not in moved and _feasible(site, combined, i, p):
+                combined[i] = p
+                moved.add(i)
+        combined_score = float(problem.evaluate([combined])[0])
+        evaluations += 1
+        if combined_score >= score + gains[best_move]:
+            xy, score = combined, combined_score
+        else:
+            xy, score = candidates[best_move], score + float(gains[best_move])
+        progress("refine", evaluations, score)
+    return xy, score
+
+
+def write_layout(engine: Engine, template: Turbine, names: Sequence[str], lats: Sequence[float], lons: Sequence[float]) -> List[Turbine]:
+    """Insert the turbines and one default row of each component in one transaction."""
+    fields = template.model_dump(exclude={"id", "name", "latitude", "longitude"})
+    with Session(engine, expire_on_commit=False) as session:
+        turbines = [Turbine(**fields, name=name, latitude=lat, longitude=lon) for name, lat, lon in zip(names, lats, lons)]
+        session.add_all(turbines)
+        session.flush()
+        gearbox_of: Dict[int, int] = {}
+        for model in SEED_COMPONENTS:
+            rows = []
+            for t in turbines:
+                if model is Generator:
+                    rows.append(Generator(turbine_id=t.id, gearbox_id=gearbox_of.get(t.id)))
+                elif model is Tower:
+                    rows.append(Tower(turbine_id=t.id, hub_height_m=t.hub_height_m))
+                elif model is Blade:
+                    rows.append(Blade(turbine_id=t.id, blade_length_m=t.rotor_diameter_m / 2))
+                else:
+                    rows.append(model(turbine_id=t.id))
+            session.add_all(rows)
+            session.flush()
+            if model is Gearbox:
+                gearbox_of = {r.turbine_id: r.id for r in rows}
+        session.commit()
+    for t in turbines:
+        # SQLite may reuse the ids of deleted turbines.
+        entity_cache.invalidate_turbine(t.id)
+        drivetrain.invalidate(t.id)
+        spatial_index.upsert(t)
+    return turbines
+
+
+def layout_report(problem: Problem, xy: np.ndarray) -> dict:
+    geometry = wake_service.pair_geometry(xy[:, 0], xy[:, 1], problem.max_distance_m)
+    result = compute_aep(problem.rose, geometry, problem.params, problem.wakes, problem.superposition, workers=1)
+    gross_t, net_t = result["gross_mwh"].sum(axis=0), result["net_mwh"].sum(axis=0)
+    gross, net = float(gross_t.sum()), float(net_t.sum())
+    capacity = float(problem.params["capacity_mw"].sum())
+    return {
+        "gross_energy_mwh": gross,
+        "wake_loss_mwh": gross - net,
+        "net_energy_mwh": net,
+        "wake_loss_fraction": (gross - net) / gross if gross > 0 else 0.0,
+        "capacity_factor": net / (capacity * HOURS_PER_YEAR) if capacity > 0 else 0.0,
+        "net_mwh": net_t,
+    }
+
+
+# --- Jobs ---
+
+class _Cancelled(Exception):
+    pass
+
+
+class LayoutJob:
+    def __init__(self, problem: Problem, template: Turbine, options: dict, engine: Engine):
+        self.id = uuid.uuid4().hex
+        self.problem = problem
+        self.template = template
+        self.options = options
+        self.engine = engine
+        self.status = "queued"
+        self.phase: Optional[str] = None
+        self.evaluations = 0
+        self.total_evaluations = planned_evaluations(
+            options["algorithm"], problem.turbine_count, options["population_size"],
+            options["generations"], options["refine_passes"],
+        )
+        self.best_net_energy_mwh: Optional[float] = None
+        self.error: Optional[str] = None
+        self.result: Optional[dict] = None
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"layout-{self.id[:8]}", daemon=True)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def join(self, timeout_s: Optional[float] = None) -> bool:
+        """Wait for the worker thread; True once it has exited."""
+        if self._thread.is_alive():
+            self._thread.join(timeout_s)
+        return not self._thread.is_alive()
+
+    def _progress(self, phase: str, evaluations: int, best: float) -> None:
+        if self._cancel.is_set():
+            raise _Cancelled
+        with self._lock:
+            self.phase = phase
+            self.evaluations = evaluations
+            self.best_net_energy_mwh = best
+
+    def _finish(self, status: str, **fields) -> None:
+        with self._lock:
+            self.status = status
+            self.phase = None
+            self.finished = time.monotonic()
+            for k, v in fields.items():
+                setattr(self, k, v)
+
+    def _run(self) -> None:
+        o, problem = self.options, self.problem
+        with self._lock:
+            self.status = "running"
+        try:
+            rng = np.random.default_rng(o["seed"])
+            xy, score = search(problem, rng, o["algorithm"], o["population_size"], o["generations"], self._progress)
+            xy, score = refine(problem, rng, xy, score, o["refine_passes"], self._progress, self.evaluations)
+            report = layout_report(problem, xy)
+            lats, lons = to_lat_lon(problem.site, xy)
+            names = [f"{o['name_prefix']}-{i + 1:02d}" for i in range(len(xy))]
+            ids: List[Optional[int]] = [None] * len(xy)
+            if o["write_back"]:
+                if self._cancel.is_set():
+                    raise _Cancelled
+                with self._lock:
+                    self.phase = "writing"
+                ids = [t.id for t in write_layout(self.engine, self.template, names, lats.tolist(), lons.tolist())]
+            net_t = report.pop("net_mwh").tolist()
+            report["turbines"] = [
+                {"turbine_id": tid, "name": name, "latitude": lat, "longitude": lon, "net_energy_mwh": e}
+                for tid, name, lat, lon, e in zip(ids, names, lats.tolist(), lons.tolist(), net_t)
+            ]
+            self._finish("succeeded", result=report, best_net_energy_mwh=report["net_energy_mwh"])
+        except _Cancelled:
+            self._finish("cancelled")
+        except Exception as exc:
+            if self._cancel.is_set():
+                # The pool went away under a cancelled job (shutdown outlived the join).
+                self._finish("cancelled")
+                return
+            logger.exception("Layout job %s failed", self.id)
+            self._finish("failed", error=str(exc) or type(exc).__name__)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            end = self.finished if self.finished is not None else time.monotonic()
+            return {
+                "job_id": self.id,
+                "status": self.status,
+                "phase": self.phase,
+                "algorithm": self.options["algorithm"],
+                "turbine_count": self.problem.turbine_count,
+                "seed": self.options["seed"],
+                "write_back": self.options["write_back"],
+                "evaluations": self.evaluations,
+                "total_evaluations": self.total_evaluations,
+                "progress": 1.0 if self.status == "succeeded" else min(self.evaluations / self.total_evaluations, 1.0),
+                "best_net_energy_mwh": self.best_net_energy_mwh,
+                "elapsed_s": end - self.started,
+                "error": self.error,
+                "result": self.result,
+            }
+
+
+_jobs: Dict[str, LayoutJob] = {}
+_jobs_lock = threading.Lock()
+
+
+def start_job(
+    rose: WindRose,
+    polygon_lat: Sequence[float],
+    polygon_lon: Sequence[float],
+    template: dict,
+    turbine_count: int,
+    min_spacing_diameters: float,
+    algorithm: str = "genetic",
+    population_size: int = 32,
+    generations: int = 40,
+    refine_passes: int = 2,
+    seed: Optional[int] = None,
+    superposition: str = "rss",
+    max_distance_m: Optional[float] = None,
+    name_prefix: str = "L",
+    write_back: bool = True,
+) -> dict:
+    """Validate the request, check that the site can hold the turbines, and start the job.
+
+    ``template`` holds the Turbine fields shared by every new turbine.
+    """
+    template = Turbine(name="", latitude=0.0, longitude=0.0, **template)
+    site = make_site(polygon_lat, polygon_lon, min_spacing_diameters * template.rotor_diameter_m)
+    problem = make_problem(site, rose, template, turbine_count, superposition, max_distance_m)
+    total = planned_evaluations(algorithm, turbine_count, population_size, generations, refine_passes)
+    if total * turbine_count * rose.frequencies.size > MAX_TURBINE_EVALUATIONS:
+        raise ValueError(
+            f"{total} layout evaluations × {turbine_count} turbines × {rose.frequencies.size} wind-rose bins "
+            f"exceeds {MAX_TURBINE_EVALUATIONS:,}; use fewer generations or a coarser wind rose"
+        )
+    if seed is None:
+        seed = secrets.randbits(63)
+    random_layout(np.random.default_rng(seed), site, turbine_count)   # fail fast if the site is too small
+    options = {
+        "algorithm": algorithm, "population_size": population_size, "generations": generations,
+        "refine_passes": refine_passes, "seed": seed, "name_prefix": name_prefix, "write_back": write_back,
+    }
+    job = LayoutJob(problem, template, options, engine)
+    with _jobs_lock:
+        if sum(not j.done for j in _jobs.values()) >= LAYOUT_MAX_RUNNING_JOBS:
+            raise HTTPException(status_code=429, detail="Too many layout jobs running; try again later")
+        finished = [k for k, j in _jobs.items() if j.done]
+        for k in finished[: max(0, len(finished) - LAYOUT_JOB_HISTORY + 1)]:
+            del _jobs[k]
+        _jobs[job.id] = job
+    job.start()
+    return job.snapshot()
+
+
+def _get(job_id: str) -> LayoutJob:
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Layout job not found")
+    return job
+
+
+def get_job(job_id: str) -> dict:
+    return _get(job_id).snapshot()
+
+
+def list_jobs() -> List[dict]:
+    with _jobs_lock:
+        jobs = list(_jobs.values())
+    return [j.snapshot() for j in jobs]
+
+
+def cancel_job(job_id: str) -> dict:
+    """Request cancellation; the job stops at its next batch boundary, before writing."""
+    job = _get(job_id)
+    job.cancel()
+    return job.snapshot()
+
+
+def cancel_all(timeout_s: float = LAYOUT_SHUTDOWN_TIMEOUT_S) -> None:
+    """Cancel every job and wait up to ``timeout_s`` for them to stop.
+
+    Called at shutdown, before the process pool goes away: a job only notices
+    the cancellation between batches, so it needs the pool to finish the one
+    in flight.
+    """
+    with _jobs_lock:
+        jobs = list(_jobs.values())
+    for j in jobs:
+        j.cancel()
+    deadline = time.monotonic() + timeout_s
+    for j in jobs:
+        if not j.join(max(0.0, deadline - time.monotonic())):
+            logger.warning("Layout job %s still running after %.0f s; shutting down anyway", j.id, timeout_s)
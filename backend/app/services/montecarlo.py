@@ -0,0 +1,263 @@
+"""Monte Carlo AEP uncertainty: P50/P90 from sampled input biases.
+
+Each sample draws farm-wide (fully correlated) multipliers on the wind
+speeds of the rose, ``air_density_kg_m3``, ``power_coefficient`` and
+``WakeModel.wake_decay_constant``, plus an availability factor. The wake and
+power model is the one in ``services/aep.py``. Jensen deficits depend on k,
+so they are recomputed per sample: ``wake.pair_deficits`` gets one k per
+sample and turbine for a chunk of samples in each direction. Speed scaling, density and Cp then enter one batched
+``physics.power_batch`` call per direction.
+
+Samples are drawn in fixed blocks of SEED_BLOCK_SAMPLES, each from its own
+child of ``SeedSequence(seed)``. Blocks are split across the process pool,
+so results depend only on the seed and never on the number of workers.
+"""
+import math
+import secrets
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from app.config import PROCESS_POOL_WORKERS
+from app.models.turbine import Turbine
+from app.models.wake_model import WakeModel
+from app.services import physics
+from app.services import wake as wake_service
+from app.services.aep import HOURS_PER_YEAR, WindRose
+from app.services.pool import parallel_map, split
+
+SEED_BLOCK_SAMPLES = 256
+# Upper bound on samples × turbines × wind-rose bins per request (roughly a
+# minute of CPU on one core; the pool divides it).
+MAX_SAMPLE_EVALUATIONS = 2_000_000_000
+# Temporary (samples × pairs) and (samples × bins × turbines) arrays stay below this.
+CHUNK_ELEMENTS = 2_000_000
+# Below this many samples × turbines, the pool's start-up cost outweighs the speed-up.
+MIN_PARALLEL_TURBINE_SAMPLES = 100_000
+EXCEEDANCE_PROBABILITIES = (0.5, 0.75, 0.9, 0.95, 0.99)
+# Contiguous sample groups for the batch-means standard error of P90.
+ERROR_GROUPS = 20
+
+
+class Uncertainty(NamedTuple):
+    """One-sigma uncertainties; all but availability are relative to the stored values."""
+    wind_speed: float = 0.05
+    air_density: float = 0.01
+    power_coefficient: float = 0.03
+    wake_decay_constant: float = 0.25
+    availability_mean: float = 0.97
+    availability: float = 0.015         # absolute, clipped to [0, 1]
+
+
+class _Farm(NamedTuple):
+    n: int
+    speeds_mps: np.ndarray              # (B,)
+    frequencies: np.ndarray             # (S, B)
+    directions_deg: np.ndarray          # (S,)
+    geometry: wake_service.PairGeometry
+    params: dict
+    wake_decay_constant: np.ndarray     # (n,)
+    thrust_coefficient: np.ndarray      # (n,)
+    superposition: str
+
+
+class _Task(NamedTuple):
+    farm: _Farm
+    uncertainty: Uncertainty
+    seeds: List[np.random.SeedSequence]
+    sizes: List[int]
+
+
+def _prepare(
+    rose: WindRose,
+    geometry: wake_service.PairGeometry,
+    params: physics.PhysicsParams,
+    wakes: dict,
+    superposition: str,
+) -> _Farm:
+    return _Farm(
+        n=geometry.n,
+        speeds_mps=rose.speeds_mps,
+        frequencies=rose.frequencies,
+        directions_deg=rose.directions_deg,
+        geometry=geometry,
+        params={k: np.asarray(v, dtype=np.float64) for k, v in params.items()},
+        wake_decay_constant=wakes["wake_decay_constant"],
+        thrust_coefficient=wakes["thrust_coefficient"],
+        superposition=superposition,
+    )
+
+
+def draw(rng: np.random.Generator, size: int, u: Uncertainty) -> dict[str, np.ndarray]:
+    """Multipliers (and availability) for ``size`` samples; the draw order is part of the seed contract."""
+    normal = rng.standard_normal((5, size))
+    return {
+        "wind_speed": np.maximum(1 + u.wind_speed * normal[0], 0.0),
+        "air_density": np.maximum(1 + u.air_density * normal[1], 0.0),
+        "power_coefficient": np.maximum(1 + u.power_coefficient * normal[2], 0.0),
+        "wake_decay_constant": np.maximum(1 + u.wake_decay_constant * normal[3], 0.0),
+        "availability": np.clip(u.availability_mean + u.availability * normal[4], 0.0, 1.0),
+    }
+
+
+def nominal(u: Uncertainty) -> dict[str, np.ndarray]:
+    ones = np.ones(1)
+    return {
+        "wind_speed": ones, "air_density": ones, "power_coefficient": ones, "wake_decay_constant": ones,
+        "availability": np.full(1, u.availability_mean),
+    }
+
+
+def _evaluate_chunk(farm: _Farm, d: dict[str, np.ndarray]) -> np.ndarray:
+    m, n = d["wind_speed"].size, farm.n
+    p = farm.params
+    D = p["rotor_diameter_m"]
+    v = d["wind_speed"][:, None] * farm.speeds_mps                                  # (m, B)
+    params = {
+        **p,
+        "air_density_kg_m3": p["air_density_kg_m3"] * d["air_density"][:, None, None],
+        "power_coefficient": p["power_coefficient"] * d["power_coefficient"][:, None, None],
+    }
+    # Only operating turbines cast a wake. The operating set only changes at the
+    # fleet's distinct cut-in/cut-out speeds, so deficits are combined once per
+    # interval between them that some sample actually reaches.
+    cut_in = np.broadcast_to(p["cut_in_wind_speed_mps"], (n,))
+    cut_out = np.broadcast_to(p["cut_out_wind_speed_mps"], (n,))
+    thresholds = np.unique(np.concatenate([cut_in, cut_out]))
+    used, pattern_of = np.unique(np.searchsorted(thresholds, v, side="right"), return_inverse=True)
+    start = np.concatenate([[thresholds[0] - 1], thresholds])[used]
+    patterns = (start[:, None] >= cut_in) & (start[:, None] < cut_out)
+    pattern_of = pattern_of.reshape(m, -1)
+    rows = np.arange(m)[:, None]
+    k = d["wake_decay_constant"][:, None] * farm.wake_decay_constant                # (m, n)
+
+    energy = np.zeros(m)
+    for direction, freq in zip(farm.directions_deg, farm.frequencies):
+        src, dst, deficit = wake_service.pair_deficits(farm.geometry, direction, D, farm.thrust_coefficient, k)
+        combined = np.empty((m, len(patterns), n))
+        for j, mask in enumerate(patterns):
+            keep = mask[src]
+            combined[:, j] = wake_service.combine_deficits(
+                (rows * n + dst[keep]).ravel(), deficit[:, keep].ravel(), m * n, farm.superposition
+            ).reshape(m, n)
+        effective = v[..., None] * (1 - combined[rows, pattern_of])                 # (m, B, n)
+        energy += physics.power_batch(effective, params).sum(axis=2) @ freq
+    return energy * HOURS_PER_YEAR * d["availability"]
+
+
+def evaluate(farm: _Farm, d: dict[str, np.ndarray]) -> np.ndarray:
+    """Net AEP (MWh) per sample, in memory-bounded chunks of samples."""
+    size = d["wind_speed"].size
+    if farm.n == 0:
+        return np.zeros(size)
+    widest = max(farm.speeds_mps.size * farm.n, farm.geometry.src.size)
+    step = max(1, CHUNK_ELEMENTS // widest)
+    return np.concatenate([
+        _evaluate_chunk(farm, {k: a[start:start + step] for k, a in d.items()})
+        for start in range(0, size, step)
+    ])
+
+
+def _run(task: _Task) -> np.ndarray:
+    """Every seed block in the task (runs in a worker)."""
+    return np.concatenate([
+        evaluate(task.farm, draw(np.random.default_rng(seed), size, task.uncertainty))
+        for seed, size in zip(task.seeds, task.sizes)
+    ])
+
+
+def simulate(
+    rose: WindRose,
+    geometry: wake_service.PairGeometry,
+    params: physics.PhysicsParams,
+    wakes: dict,
+    uncertainty: Uncertainty,
+    samples: int,
+    seed: int,
+    superposition: str = "rss",
+    workers: Optional[int] = None,
+) -> dict[str, np.ndarray]:
+    """Per-sample net AEP (MWh, in sample order) and the AEP at nominal inputs."""
+    if superposition not in wake_service.SUPERPOSITION_RULES:
+        raise ValueError(f"Unknown superposition rule {superposition!r}")
+    if samples * max(geometry.n, 1) * rose.frequencies.size > MAX_SAMPLE_EVALUATIONS:
+        raise ValueError(
+            f"{samples} samples × {geometry.n} turbines × {rose.frequencies.size} wind-rose bins exceeds "
+            f"{MAX_SAMPLE_EVALUATIONS:,}; use fewer samples or a coarser wind rose"
+        )
+    farm = _prepare(rose, geometry, params, wakes, superposition)
+    blocks = math.ceil(samples / SEED_BLOCK_SAMPLES)
+    seeds = np.random.SeedSequence(seed).spawn(blocks)
+    sizes = [min(SEED_BLOCK_SAMPLES, samples - i * SEED_BLOCK_SAMPLES) for i in range(blocks)]
+
+    workers = workers or PROCESS_POOL_WORKERS
+    if samples * geometry.n < MIN_PARALLEL_TURBINE_SAMPLES:
+        workers = 1
+    tasks = [
+        _Task(farm, uncertainty, [seeds[i] for i in idx], [sizes[i] for i in idx])
+        for idx in split(list(range(blocks)), workers)
+    ]
+    results = [_run(t) for t in tasks] if workers == 1 else parallel_map(_run, tasks)
+    return {
+        "energy_mwh": np.concatenate(results),
+        "nominal_energy_mwh": evaluate(farm, nominal(uncertainty)),
+    }
+
+
+def exceedance(energy: np.ndarray, probability: float) -> float:
+    """P-value energy: exceeded with the given probability (P90 is the 10th percentile)."""
+    return float(np.quantile(energy, 1 - probability))
+
+
+def summarize(energy: np.ndarray) -> dict:
+    n = energy.size
+    groups = np.array_split(energy, min(ERROR_GROUPS, n))
+    p90_groups = np.array([exceedance(g, 0.9) for g in groups])
+    # Running estimates on doubling prefixes; blocks are independent, so each prefix is a valid sample.
+    checkpoints = sorted({n >> j for j in range(8) if n >> j >= 100} | {n})
+    return {
+        "mean_energy_mwh": float(energy.mean()),
+        "std_energy_mwh": float(energy.std(ddof=1)) if n > 1 else 0.0,
+        "standard_error_mwh": float(energy.std(ddof=1) / math.sqrt(n)) if n > 1 else 0.0,
+        "p90_standard_error_mwh": float(p90_groups.std(ddof=1) / math.sqrt(len(groups))) if len(groups) > 1 else 0.0,
+        "exceedance": [
+            {"probability": p, "energy_mwh": exceedance(energy, p)} for p in EXCEEDANCE_PROBABILITIES
+        ],
+        "convergence": [
+            {
+                "samples": c,
+                "mean_energy_mwh": float(energy[:c].mean()),
+                "p50_energy_mwh": exceedance(energy[:c], 0.5),
+                "p90_energy_mwh": exceedance(energy[:c], 0.9),
+            }
+            for c in checkpoints
+        ],
+    }
+
+
+def farm_monte_carlo(
+    turbines: Sequence[Turbine],
+    wakes: Sequence[Optional[WakeModel]],
+    rose: WindRose,
+    uncertainty: Uncertainty,
+    samples: int,
+    seed: Optional[int] = None,
+    superposition: str = "rss",
+    max_distance_m: Optional[float] = None,
+) -> dict:
+    """P-values and convergence diagnostics for the farm returned by ``wake.get_farm``."""
+    if seed is None:
+        seed = secrets.randbits(63)
+    _, _, geometry = wake_service.farm_geometry(turbines, max_distance_m)
+    result = simulate(
+        rose, geometry, physics.turbine_params(turbines), wake_service.wake_params(wakes),
+        uncertainty, samples, seed, superposition,
+    )
+    return {
+        "samples": samples,
+        "seed": seed,
+        "turbine_count": len(turbines),
+        "uncertainty": uncertainty._asdict(),
+        "nominal_energy_mwh": float(result["nominal_energy_mwh"][0]),
+        **summarize(result["energy_mwh"]),
+    }
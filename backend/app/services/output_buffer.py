@@ -0,0 +1,123 @@
+"""Write-behind buffer for turbine current_output_mw.
+
+Output updates arrive far more often than anyone reads them, and most are
+overwritten within a second or two. The buffer keeps only the latest value per
+turbine and a background thread writes the dirty set with one executemany
+UPDATE per flush.
+"""
+import logging
+import threading
+from typing import Iterable, Optional, Union
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.config import OUTPUT_FLUSH_INTERVAL_S, OUTPUT_FLUSH_MAX_PENDING
+from app.database import engine
+from app.models.turbine import Turbine
+from app.schemas.turbine import TurbineRead
+from app.services import entity_cache
+
+logger = logging.getLogger(__name__)
+
+_turbine = Turbine.__table__
+_UPDATE_OUTPUT = (
+    update(_turbine)
+    .where(_turbine.c.id == bindparam("_id"))
+    .values(current_output_mw=bindparam("_output"))
+)
+
+
+class OutputBuffer:
+    def __init__(self, engine: Engine, flush_interval_s: float, max_pending: int):
+        self.engine = engine
+        self.flush_interval_s = flush_interval_s
+        self.max_pending = max_pending
+        self._pending: dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def put(self, turbine_id: int, output_mw: float) -> None:
+        with self._lock:
+            self._pending[turbine_id] = output_mw
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wake.set()
+
+    def get(self, turbine_id: int) -> Optional[float]:
+        with self._lock:
+            return self._pending.get(turbine_id)
+
+    def discard(self, turbine_ids: Iterable[int]) -> None:
+        """Forget buffered values superseded by a direct write to the row.
+
+        Call before the transaction makes its first write. Waits for any
+        in-flight flush, so a stale value taken out of the buffer cannot land
+        after the write; a transaction that already holds write locks would
+        deadlock with that flush.
+        """
+        with self._flush_lock, self._lock:
+            for turbine_id in turbine_ids:
+                self._pending.pop(turbine_id, None)
+
+    def overlay(self, turbine: Turbine) -> Union[Turbine, TurbineRead]:
+        """The turbine as readers should see it, with any buffered output applied."""
+        output = self.get(turbine.id)
+        if output is None:
+            return turbine
+        return TurbineRead.model_validate(turbine).model_copy(update={"current_output_mw": output})
+
+    def flush(self) -> int:
+        """Write every dirty value in one transaction; returns the number of rows written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            try:
+                with Session(self.engine) as session:
+                    session.connection().execute(
+                        _UPDATE_OUTPUT,
+                        [{"_id": tid, "_output": out} for tid, out in batch.items()],
+                    )
+                    session.commit()
+                for tid in batch:
+                    entity_cache.invalidate_turbine(tid, components=False)
+            except Exception:
+                # Put the values back unless a newer one arrived meanwhile.
+                with self._lock:
+                    for tid, out in batch.items():
+                        self._pending.setdefault(tid, out)
+                raise
+            return len(batch)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Flushing buffered turbine output failed")
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="output-buffer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher thread and write anything still pending."""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+output_buffer = OutputBuffer(engine, OUTPUT_FLUSH_INTERVAL_S, OUTPUT_FLUSH_MAX_PENDING)
@@ -1,45 +1,119 @@
 import math
+from typing import Mapping, Sequence, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
 from app.models.turbine import Turbine
 
+# Turbine columns the power curve depends on. Batch functions take a mapping of
+# these names to scalars or arrays that broadcast against the wind speeds.
+PHYSICS_FIELDS = (
+    "capacity_mw",
+    "rotor_diameter_m",
+    "cut_in_wind_speed_mps",
+    "cut_out_wind_speed_mps",
+    "power_coefficient",
+    "tip_speed_ratio",
+    "air_density_kg_m3",
+)
+
+PhysicsParams = Mapping[str, ArrayLike]
 
-def swept_area_m2(rotor_diameter_m: float) -> float:
-    return math.pi * (rotor_diameter_m / 2) ** 2
+
+def turbine_params(turbines: Union[Turbine, Sequence[Turbine]]) -> dict[str, np.ndarray]:
+    """Columnar float64 arrays of PHYSICS_FIELDS for one turbine or a fleet."""
+    if isinstance(turbines, Turbine):
+        return {f: np.float64(getattr(turbines, f)) for f in PHYSICS_FIELDS}
+    return {
+        f: np.fromiter((getattr(t, f) for t in turbines), dtype=np.float64, count=len(turbines))
+        for f in PHYSICS_FIELDS
+    }
 
 
-def wind_power_mw(wind_speed_mps: float, rotor_diameter_m: float, air_density_kg_m3: float) -> float:
+def _cube(x: ArrayLike) -> ArrayLike:
+    # Plain products round the same for floats, numpy scalars and arrays; ** does
+    # not (array powers and libm pow can differ in the last ulp), which would make
+    # the scalar wrappers disagree with the batch results.
+    return x * x * x
+
+
+def swept_area_m2(rotor_diameter_m: ArrayLike) -> ArrayLike:
+    r = rotor_diameter_m / 2
+    return math.pi * (r * r)
+
+
+def wind_power_mw(wind_speed_mps: ArrayLike, rotor_diameter_m: ArrayLike, air_density_kg_m3: ArrayLike) -> ArrayLike:
     """Theoretical power available in the wind (before Cp)."""
     A = swept_area_m2(rotor_diameter_m)
-    return 0.5 * air_density_kg_m3 * A * wind_speed_mps ** 3 / 1_000_000
+    return 0.5 * air_density_kg_m3 * A * _cube(wind_speed_mps) / 1_000_000
+
+
+def power_batch(wind_speed_mps: ArrayLike, params: PhysicsParams) -> np.ndarray:
+    """Vectorised P_actual = ½ρAv³·Cp, zero outside [cut-in, cut-out), clamped to rated capacity."""
+    v = np.asarray(wind_speed_mps, dtype=np.float64)
+    A = swept_area_m2(np.asarray(params["rotor_diameter_m"], dtype=np.float64))
+    p_mw = (0.5 * params["air_density_kg_m3"] * A * _cube(v) * params["power_coefficient"]) / 1_000_000
+    p_mw = np.minimum(p_mw, params["capacity_mw"])
+    operating = (v >= params["cut_in_wind_speed_mps"]) & (v < params["cut_out_wind_speed_mps"])
+    return np.where(operating, p_mw, 0.0)
+
+
+def rotor_rpm_batch(wind_speed_mps: ArrayLike, params: PhysicsParams) -> np.ndarray:
+    """Vectorised RPM = λ·v·60 / (2π·R), zero for non-positive wind speeds."""
+    v = np.asarray(wind_speed_mps, dtype=np.float64)
+    R = np.asarray(params["rotor_diameter_m"], dtype=np.float64) / 2
+    tip_speed = params["tip_speed_ratio"] * v
+    return np.where(v > 0, tip_speed * 60 / (2 * math.pi * R), 0.0)
+
+
+def compute_batch(wind_speed_mps: ArrayLike, params: PhysicsParams) -> dict[str, np.ndarray]:
+    """Columnar physics for arrays of wind speeds and (optionally) turbine parameters.
+
+    Wind speeds and every entry of ``params`` are broadcast together, so a fleet
+    (shape ``(n,)``) can be evaluated over a wind-speed grid (shape ``(m, 1)``)
+    in one call. Keys match :func:`compute`.
+    """
+    v = np.asarray(wind_speed_mps, dtype=np.float64)
+    D = np.asarray(params["rotor_diameter_m"], dtype=np.float64)
+    shape = np.broadcast_shapes(v.shape, *(np.shape(params[f]) for f in PHYSICS_FIELDS))
+    return {
+        "wind_speed_mps": np.broadcast_to(v, shape),
+        "power_mw": np.broadcast_to(power_batch(v, params), shape),
+        "wind_power_available_mw": np.broadcast_to(wind_power_mw(v, D, params["air_density_kg_m3"]), shape),
+        "rotor_rpm": np.broadcast_to(rotor_rpm_batch(v, params), shape),
+        "swept_area_m2": np.broadcast_to(swept_area_m2(D), shape),
+        "tip_speed_mps": np.broadcast_to(params["tip_speed_ratio"] * v, shape),
+    }
 
 
 def actual_power_mw(wind_speed_mps: float, turbine: Turbine) -> float:
     """P_actual = ½ρAv³·Cp, clamped to rated capacity."""
-    if wind_speed_mps < turbine.cut_in_wind_speed_mps:
-        return 0.0
-    if wind_speed_mps >= turbine.cut_out_wind_speed_mps:
-        return 0.0
-    A = swept_area_m2(turbine.rotor_diameter_m)
-    p_mw = (0.5 * turbine.air_density_kg_m3 * A * wind_speed_mps ** 3 * turbine.power_coefficient) / 1_000_000
-    return min(p_mw, turbine.capacity_mw)
+    return float(power_batch(wind_speed_mps, turbine_params(turbine)))
 
 
 def rotor_rpm(wind_speed_mps: float, turbine: Turbine) -> float:
     """RPM = λ·v·60 / (2π·R)"""
-    if wind_speed_mps <= 0:
-        return 0.0
-    R = turbine.rotor_diameter_m / 2
-    tip_speed = turbine.tip_speed_ratio * wind_speed_mps
-    return tip_speed * 60 / (2 * math.pi * R)
+    return float(rotor_rpm_batch(wind_speed_mps, turbine_params(turbine)))
 
 
 def compute(wind_speed_mps: float, turbine: Turbine) -> dict:
-    A = swept_area_m2(turbine.rotor_diameter_m)
-    tip_spd = turbine.tip_speed_ratio * wind_speed_mps
+    return {k: float(v) for k, v in compute_batch(wind_speed_mps, turbine_params(turbine)).items()}
+
+
+def compute_fleet(turbines: Sequence[Turbine], wind_speed_mps: ArrayLike) -> dict:
+    """One vectorised pass over a fleet; ``wind_speed_mps`` is a scalar or one value per turbine."""
+    columns = compute_batch(
+        np.broadcast_to(np.asarray(wind_speed_mps, dtype=np.float64), (len(turbines),)),
+        turbine_params(turbines),
+    )
+    lists = {k: v.tolist() for k, v in columns.items()}
+    rows = [
+        {"turbine_id": t.id, "name": t.name, **{k: col[i] for k, col in lists.items()}}
+        for i, t in enumerate(turbines)
+    ]
     return {
-        "wind_speed_mps": wind_speed_mps,
-        "power_mw": actual_power_mw(wind_speed_mps, turbine),
-        "wind_power_available_mw": wind_power_mw(wind_speed_mps, turbine.rotor_diameter_m, turbine.air_density_kg_m3),
-        "rotor_rpm": rotor_rpm(wind_speed_mps, turbine),
-        "swept_area_m2": A,
-        "tip_speed_mps": tip_spd,
+        "turbine_count": len(rows),
+        "total_power_mw": float(columns["power_mw"].sum()),
+        "turbines": rows,
     }
@@ -0,0 +1,52 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+from app.config import PROCESS_POOL_WORKERS
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Shared, lazily started pool. Uses spawn so workers never inherit server threads or DB connections."""
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=PROCESS_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_process_pool() -> None:
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def split(items: List[T], parts: int) -> List[List[T]]:
+    """Split into at most ``parts`` contiguous, near-equal, non-empty chunks."""
+    parts = max(1, min(parts, len(items)))
+    size, extra = divmod(len(items), parts)
+    out, start = [], 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        out.append(items[start:stop])
+        start = stop
+    return out
+
+
+def parallel_map(fn: Callable[[T], R], tasks: Iterable[T]) -> List[R]:
+    """``map`` over the process pool, or in-process when there is only one worker or task."""
+    tasks = list(tasks)
+    if PROCESS_POOL_WORKERS <= 1 or len(tasks) <= 1:
+        return [fn(t) for t in tasks]
+    return list(get_process_pool().map(fn, tasks))
@@ -0,0 +1,56 @@
+import hashlib
+from typing import NamedTuple
+
+import numpy as np
+
+from app.cache import LRUCache
+from app.models.turbine import Turbine
+from app.services import physics
+
+RESOLUTION_MPS = 0.05
+CACHE_SIZE = 1024
+
+
+class PowerCurve(NamedTuple):
+    key: str
+    wind_speed_mps: np.ndarray
+    power_mw: np.ndarray
+    cut_in_wind_speed_mps: float
+    cut_out_wind_speed_mps: float
+
+
+# Tables are keyed by a hash of the physical parameters, so they are shared by
+# every turbine with identical ones; a changed row simply maps to a new key and
+# the old table ages out of the LRU.
+_tables: LRUCache[PowerCurve] = LRUCache(maxsize=CACHE_SIZE)
+
+
+def params_key(turbine: Turbine) -> str:
+    values = tuple(float(getattr(turbine, f)) for f in physics.PHYSICS_FIELDS) + (RESOLUTION_MPS,)
+    return hashlib.blake2b(repr(values).encode(), digest_size=12).hexdigest()
+
+
+def build_power_curve(turbine: Turbine, key: str) -> PowerCurve:
+    """Tabulate physics.actual_power_mw from 0 to cut-out, with an exact knot at cut-in."""
+    cut_in = turbine.cut_in_wind_speed_mps
+    cut_out = turbine.cut_out_wind_speed_mps
+    grid = np.round(np.arange(0.0, cut_out, RESOLUTION_MPS), 6)
+    grid = np.union1d(grid[grid < cut_out], [min(cut_in, cut_out), cut_out])
+    # The cut-out knot holds the left-hand limit so clients interpolating just
+    # below cut-out do not ramp towards zero.
+    below_cut_out = np.minimum(grid, np.nextafter(cut_out, 0.0))
+    power = physics.power_batch(below_cut_out, physics.turbine_params(turbine))
+    return PowerCurve(key, grid, power, cut_in, cut_out)
+
+
+def get_power_curve(turbine: Turbine) -> PowerCurve:
+    key = params_key(turbine)
+    curve = _tables.get(key)
+    if curve is None:
+        curve = build_power_curve(turbine, key)
+        _tables.put(key, curve)
+    return curve
+
+
+def cache_stats() -> dict:
+    return _tables.stats()
@@ -0,0 +1,256 @@
+"""In-memory spatial index over turbine positions.
+
+Turbines are bucketed into a regular latitude/longitude grid. A query only
+visits the cells that can contain a match and computes exact haversine
+distances for the turbines in them. The index is built from the database on
+first use and kept in step with turbine create/update/delete; it is rebuilt
+after ``SPATIAL_INDEX_TTL_S`` so writes made by other worker processes are
+eventually picked up.
+
+Cells are replaced wholesale (one dict assignment) or deleted, so readers
+never need the lock as long as they look cells up with ``.get``; only
+writers take it, and never while talking to the database. Longitude ranges
+that cross ±180° are split, so queries near the antimeridian see both sides.
+"""
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.config import SPATIAL_CELL_DEG, SPATIAL_INDEX_TTL_S
+from app.models.turbine import Turbine
+from app.services.wake import EARTH_RADIUS_M
+
+Cell = Tuple[int, int]
+Points = Tuple[np.ndarray, np.ndarray, np.ndarray]  # ids, latitudes, longitudes
+_EMPTY = (np.empty(0, dtype=np.int64), np.empty(0), np.empty(0))
+
+
+def haversine_m(lat1: float, lon1: float, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """Great-circle distance in metres from one point to arrays of points."""
+    phi1, phi2 = math.radians(lat1), np.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = np.radians(lon2 - lon1)
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GridIndex:
+    def __init__(self, cell_deg: float = SPATIAL_CELL_DEG):
+        self.cell_deg = cell_deg
+        # cell -> (ids, latitudes, longitudes)
+        self._cells: Dict[Cell, Points] = {}
+        self._cell_of: Dict[int, Cell] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+    def _cell(self, lat: float, lon: float) -> Cell:
+        return (math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg))
+
+    @classmethod
+    def build(cls, ids: Iterable[int], lats: Iterable[float], lons: Iterable[float], cell_deg: float = SPATIAL_CELL_DEG) -> "GridIndex":
+        index = cls(cell_deg)
+        ids = np.fromiter(ids, dtype=np.int64)
+        lat = np.fromiter(lats, dtype=np.float64, count=ids.size)
+        lon = np.fromiter(lons, dtype=np.float64, count=ids.size)
+        if ids.size == 0:
+            return index
+        ci = np.floor(lat / cell_deg).astype(np.int64)
+        cj = np.floor(lon / cell_deg).astype(np.int64)
+        order = np.lexsort((cj, ci))
+        ids, lat, lon, ci, cj = ids[order], lat[order], lon[order], ci[order], cj[order]
+        starts = np.flatnonzero(np.r_[True, (ci[1:] != ci[:-1]) | (cj[1:] != cj[:-1])])
+        stops = np.r_[starts[1:], ids.size]
+        for a, b in zip(starts.tolist(), stops.tolist()):
+            cell = (int(ci[a]), int(cj[a]))
+            index._cells[cell] = (ids[a:b], lat[a:b], lon[a:b])
+        index._cell_of = dict(zip(ids.tolist(), zip(ci.tolist(), cj.tolist())))
+        return index
+
+    # --- Writes ---
+
+    def _without(self, cell: Cell, turbine_id: int) -> None:
+        ids, lat, lon = self._cells[cell]
+        keep = ids != turbine_id
+        if keep.all():
+            return
+        if keep.any():
+            self._cells[cell] = (ids[keep], lat[keep], lon[keep])
+        else:
+            del self._cells[cell]
+
+    def upsert(self, turbine_id: int, lat: float, lon: float) -> None:
+        with self._lock:
+            old = self._cell_of.get(turbine_id)
+            if old is not None:
+                self._without(old, turbine_id)
+            cell = self._cell(lat, lon)
+            ids, lats, lons = self._cells.get(cell, _EMPTY)
+            self._cells[cell] = (np.append(ids, turbine_id), np.append(lats, lat), np.append(lons, lon))
+            self._cell_of[turbine_id] = cell
+
+    def remove(self, turbine_id: int) -> None:
+        with self._lock:
+            cell = self._cell_of.pop(turbine_id, None)
+            if cell is not None:
+                self._without(cell, turbine_id)
+
+    # --- Reads ---
+
+    def _gather(self, cells: Iterable[Cell]) -> Points:
+        parts = [p for p in map(self._cells.get, cells) if p is not None]
+        if not parts:
+            return _EMPTY
+        if len(parts) == 1:
+            return parts[0]
+        return tuple(np.concatenate(col) for col in zip(*parts))
+
+    def _cells_in(self, i0: int, i1: int, j0: int, j1: int) -> Iterable[Cell]:
+        """Cell keys in the inclusive key range, or the occupied ones if that is fewer."""
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self._cells):
+            return [c for c in list(self._cells) if i0 <= c[0] <= i1 and j0 <= c[1] <= j1]
+        return [(i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)]
+
+    def _cells_around(self, min_lat: float, max_lat: float, west: float, east: float) -> List[Cell]:
+        """Cells covering [west, east] longitude, which may run past ±180° and wraps around."""
+        if east - west >= 360:
+            spans = [(-180.0, 180.0)]
+        else:
+            spans = [(max(west, -180.0), min(east, 180.0))]
+            if west < -180:
+                spans.append((west + 360, 180.0))
+            if east > 180:
+                spans.append((-180.0, east - 360))
+        cells: Dict[Cell, None] = {}
+        for w, e in spans:
+            i0, j0 = self._cell(min_lat, w)
+            i1, j1 = self._cell(max_lat, e)
+            cells.update(dict.fromkeys(self._cells_in(i0, i1, j0, j1)))
+        return list(cells)
+
+    def bbox(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> Points:
+        """Turbines inside the box, in ascending id order; ``min_lon > max_lon`` crosses the antimeridian."""
+        crosses = min_lon > max_lon
+        ids, lat, lon = self._gather(self._cells_around(min_lat, max_lat, min_lon, max_lon + 360 * crosses))
+        in_lon = (lon >= min_lon) | (lon <= max_lon) if crosses else (lon >= min_lon) & (lon <= max_lon)
+        inside = np.flatnonzero((lat >= min_lat) & (lat <= max_lat) & in_lon)
+        order = inside[np.argsort(ids[inside])]
+        return ids[order], lat[order], lon[order]
+
+    def radius(self, lat: float, lon: float, radius_m: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Turbines within ``radius_m`` and their distances, nearest first."""
+        dlat = math.degrees(radius_m / EARTH_RADIUS_M)
+        widest = math.cos(math.radians(min(abs(lat) + dlat, 90.0)))
+        dlon = min(math.degrees(radius_m / (EARTH_RADIUS_M * widest)), 180.0) if widest > 1e-9 else 180.0
+        cells = self._cells_around(lat - dlat, lat + dlat, lon - dlon, lon + dlon)
+        return _by_distance(lat, lon, self._gather(cells), radius_m)
+
+    def nearest(
+        self, lat: float, lon: float, k: int, exclude_id: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """The ``k`` nearest turbines and their distances, nearest first."""
+        want = k + (exclude_id is not None)
+        ci, cj = self._cell(lat, lon)
+        found, r = 0, 0
+        # Grow square rings of cells until they hold enough candidates; the
+        # want-th candidate's distance then bounds an exact radius query.
+        while found < want and found < len(self):
+            if 8 * r > len(self._cells):
+                candidates = self._gather(list(self._cells))
+                break
+            ring = [(ci + di, cj + dj) for di in range(-r, r + 1) for dj in range(-r, r + 1) if max(abs(di), abs(dj)) == r]
+            found += sum(self._cells.get(c, _EMPTY)[0].size for c in ring)
+            r += 1
+        else:
+            candidates = self._gather([(ci + di, cj + dj) for di in range(1 - r, r) for dj in range(1 - r, r)])
+        if candidates[0].size >= want:
+            d = haversine_m(lat, lon, candidates[1], candidates[2])
+            hits = self.radius(lat, lon, float(np.partition(d, want - 1)[want - 1]))
+        else:
+            hits = _by_distance(lat, lon, candidates)
+        if exclude_id is not None:
+            keep = hits[0] != exclude_id
+            hits = tuple(h[keep] for h in hits)
+        return tuple(h[:k] for h in hits)
+
+
+def _by_distance(lat: float, lon: float, points: Points, max_m: float = math.inf) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    ids, lats, lons = points
+    d = haversine_m(lat, lon, lats, lons)
+    inside = np.flatnonzero(d <= max_m)
+    order = inside[np.argsort(d[inside], kind="stable")]
+    return ids[order], lats[order], lons[order], d[order]
+
+
+class SpatialIndex:
+    """The process-wide :class:`GridIndex`, loaded lazily from the database."""
+
+    def __init__(self, cell_deg: float = SPATIAL_CELL_DEG, ttl_s: float = SPATIAL_INDEX_TTL_S):
+        self.cell_deg = cell_deg
+        self.ttl_s = ttl_s
+        self._grid: Optional[GridIndex] = None
+        self._expires = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, session: Session) -> GridIndex:
+        grid = self._grid
+        if grid is not None and time.monotonic() < self._expires:
+            return grid
+        with self._lock:
+            generation = self._generation
+        rows = session.exec(select(Turbine.id, Turbine.latitude, Turbine.longitude)).all()
+        ids, lats, lons = zip(*rows) if rows else ((), (), ())
+        grid = GridIndex.build(ids, lats, lons, self.cell_deg)
+        with self._lock:
+            # A write that landed while we were reading may be missing from
+            # this snapshot: answer from it, but rebuild on the next query.
+            if generation == self._generation:
+                self._grid = grid
+                self._expires = time.monotonic() + self.ttl_s
+        return grid
+
+    def upsert(self, turbine: Turbine) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._grid is not None:
+                self._grid.upsert(turbine.id, turbine.latitude, turbine.longitude)
+
+    def remove(self, turbine_id: int) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._grid is not None:
+                self._grid.remove(turbine_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._grid = None
+
+
+spatial_index = SpatialIndex()
+
+
+def _hits(ids: np.ndarray, lats: np.ndarray, lons: np.ndarray, distances: Optional[np.ndarray] = None) -> List[dict]:
+    dist = distances.tolist() if distances is not None else [None] * ids.size
+    return [
+        {"turbine_id": t, "latitude": la, "longitude": lo, "distance_m": d}
+        for t, la, lo, d in zip(ids.tolist(), lats.tolist(), lons.tolist(), dist)
+    ]
+
+
+def nearest(session: Session, latitude: float, longitude: float, k: int, exclude_id: Optional[int] = None) -> List[dict]:
+    return _hits(*spatial_index.get(session).nearest(latitude, longitude, k, exclude_id))
+
+
+def within_radius(session: Session, latitude: float, longitude: float, radius_m: float) -> List[dict]:
+    return _hits(*spatial_index.get(session).radius(latitude, longitude, radius_m))
+
+
+def within_bbox(session: Session, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> List[dict]:
+    return _hits(*spatial_index.get(session).bbox(min_lon, min_lat, max_lon, max_lat))
@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlmodel import Session, func, insert, select, update
+
+from app.models.telemetry import TelemetrySample
+from app.models.turbine import Turbine
+from app.schemas.telemetry import TelemetryIn, as_utc
+from app.services import entity_cache
+from app.services.output_buffer import output_buffer
+
+# Samples written per executemany/transaction when reading an NDJSON stream.
+BATCH_SIZE = 5_000
+
+
+def ingest_batch(session: Session, samples: Sequence[TelemetryIn]) -> List[int]:
+    """Append samples and refresh current_output_mw in one transaction.
+
+    Returns the ids of the turbines whose current output was updated. A turbine
+    is left alone if the database already holds a newer sample for it, so a
+    late batch of old samples does not roll its output back. The whole batch
+    is rejected with 404 if it references an unknown turbine.
+    """
+    if not samples:
+        return []
+    rows = [s.model_dump() for s in samples]
+    latest: dict[int, dict] = {}
+    for row in rows:
+        prev = latest.get(row["turbine_id"])
+        if prev is None or row["timestamp"] >= prev["timestamp"]:
+            latest[row["turbine_id"]] = row
+
+    known = set(session.exec(select(Turbine.id).where(Turbine.id.in_(latest))).all())
+    missing = latest.keys() - known
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Turbines not found: {sorted(missing)}")
+
+    stored = session.exec(
+        select(TelemetrySample.turbine_id, func.max(TelemetrySample.timestamp))
+        .where(TelemetrySample.turbine_id.in_(latest))
+        .group_by(TelemetrySample.turbine_id)
+    ).all()
+    for turbine_id, timestamp in stored:
+        if as_utc(timestamp) > latest[turbine_id]["timestamp"]:
+            del latest[turbine_id]
+
+    # Before any write: discard() waits for an in-flight flush, which needs the
+    # row locks this transaction would otherwise already hold.
+    if latest:
+        output_buffer.discard(latest)
+    session.exec(insert(TelemetrySample), params=rows)
+    if latest:
+        session.exec(
+            update(Turbine),
+            params=[{"id": tid, "current_output_mw": row["output_mw"]} for tid, row in latest.items()],
+        )
+    session.commit()
+    for turbine_id in latest:
+        entity_cache.invalidate_turbine(turbine_id, components=False)
+    return list(latest)
+
+
+def get_samples(
+    session: Session,
+    turbine_id: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = 1000,
+) -> List[TelemetrySample]:
+    stmt = select(TelemetrySample).where(TelemetrySample.turbine_id == turbine_id)
+    if start is not None:
+        stmt = stmt.where(TelemetrySample.timestamp >= as_utc(start))
+    if end is not None:
+        stmt = stmt.where(TelemetrySample.timestamp < as_utc(end))
+    stmt = stmt.order_by(TelemetrySample.timestamp).limit(limit)
+    return list(session.exec(stmt).all())
@@ -1,17 +1,109 @@
-from typing import List
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
 from app.models.turbine import Turbine
 from app.schemas.turbine import TurbineCreate, TurbineUpdate
+from app.services import drivetrain, entity_cache
+from app.services.spatial import spatial_index
+from app.services.output_buffer import output_buffer
+
+
+# Columns a list query may project with ``fields=``; ``id`` is always returned.
+LIST_FIELDS = tuple(Turbine.model_fields)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
 
 
 def get_turbines(session: Session) -> List[Turbine]:
     return list(session.exec(select(Turbine)).all())
 
 
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Smallest string greater than every string starting with ``prefix`` (None if there is none)."""
+    stripped = prefix.rstrip(chr(0x10FFFF))
+    if not stripped:
+        return None
+    bumped = ord(stripped[-1]) + 1
+    if 0xD800 <= bumped <= 0xDFFF:
+        bumped = 0xE000  # skip the surrogates, which cannot be encoded
+    return stripped[:-1] + chr(bumped)
+
+
+def list_turbines(
+    session: Session,
+    *,
+    after_id: Optional[int] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    fields: Optional[Sequence[str]] = None,
+    name_prefix: Optional[str] = None,
+    min_capacity_mw: Optional[float] = None,
+    max_capacity_mw: Optional[float] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    """One page of turbines ordered by id, as dicts of the selected columns.
+
+    Keyset pagination: pass the returned cursor back as ``after_id`` to get the
+    next page (``None`` on the last page). ``name_prefix`` is case-sensitive:
+    a range on the indexed name narrows the scan and an exact comparison of
+    the leading characters decides, since non-binary collations (e.g. en_US
+    ignoring punctuation) order names differently. ``bbox`` is
+    ``(min_lon, min_lat, max_lon, max_lat)``. Only the requested columns are
+    selected.
+    """
+    unknown = set(fields or ()) - set(LIST_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown fields: {sorted(unknown)}")
+    names = ["id", *(f for f in LIST_FIELDS if f != "id" and (fields is None or f in fields))]
+
+    stmt = select(*(getattr(Turbine, f) for f in names)).order_by(Turbine.id).limit(limit + 1)
+    if after_id is not None:
+        stmt = stmt.where(Turbine.id > after_id)
+    if name_prefix:
+        stmt = stmt.where(Turbine.name >= name_prefix, func.substr(Turbine.name, 1, len(name_prefix)) == name_prefix)
+        upper = _prefix_upper_bound(name_prefix)
+        if upper is not None:
+            stmt = stmt.where(Turbine.name < upper)
+    if min_capacity_mw is not None:
+        stmt = stmt.where(Turbine.capacity_mw >= min_capacity_mw)
+    if max_capacity_mw is not None:
+        stmt = stmt.where(Turbine.capacity_mw <= max_capacity_mw)
+    if bbox is not None:
+        min_lon, min_lat, max_lon, max_lat = bbox
+        stmt = stmt.where(
+            Turbine.longitude.between(min_lon, max_lon),
+            Turbine.latitude.between(min_lat, max_lat),
+        )
+
+    rows = [dict(row) for row in session.connection().execute(stmt).mappings()]
+    if len(rows) > limit:
+        return rows[:limit], rows[limit - 1]["id"]
+    return rows, None
+
+
+def get_turbines_by_ids(
+    session: Session, turbine_ids: Iterable[int], include_all: bool = False
+) -> List[Turbine]:
+    """The listed turbines (or every turbine with ``include_all``); 404 if any listed id is unknown."""
+    ids = set(turbine_ids)
+    stmt = select(Turbine) if include_all else select(Turbine).where(Turbine.id.in_(ids))
+    turbines = list(session.exec(stmt).all())
+    missing = ids - {t.id for t in turbines}
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Turbines not found: {sorted(missing)}")
+    return turbines
+
+
 def get_turbine(session: Session, turbine_id: int) -> Turbine:
+    """Read-only turbine, served from the entity cache when possible."""
+    turbine = entity_cache.get_or_load(Turbine, turbine_id, lambda: session.get(Turbine, turbine_id))
+    if not turbine:
+        raise HTTPException(status_code=404, detail="Turbine not found")
+    return turbine
+
+
+def _get_turbine_for_update(session: Session, turbine_id: int) -> Turbine:
     turbine = session.get(Turbine, turbine_id)
     if not turbine:
         raise HTTPException(status_code=404, detail="Turbine not found")
@@ -23,20 +115,34 @@ def create_turbine(session: Session, data: TurbineCreate) -> Turbine:
     session.add(turbine)
     session.commit()
     session.refresh(turbine)
+    # SQLite may reuse the id of a deleted turbine.
+    entity_cache.invalidate_turbine(turbine.id)
+    drivetrain.invalidate(turbine.id)
+    spatial_index.upsert(turbine)
     return turbine
 
 
 def update_turbine(session: Session, turbine_id: int, data: TurbineUpdate) -> Turbine:
-    turbine = get_turbine(session, turbine_id)
+    turbine = _get_turbine_for_update(session, turbine_id)
     update_data = data.model_dump(exclude_unset=True)
+    if "current_output_mw" in update_data:
+        output_buffer.discard([turbine_id])
     turbine.sqlmodel_update(update_data)
     session.add(turbine)
     session.commit()
     session.refresh(turbine)
+    entity_cache.invalidate_turbine(turbine_id, components=False)
+    drivetrain.invalidate(turbine_id)
+    if "latitude" in update_data or "longitude" in update_data:
+        spatial_index.upsert(turbine)
     return turbine
 
 
 def delete_turbine(session: Session, turbine_id: int) -> None:
-    turbine = get_turbine(session, turbine_id)
+    turbine = _get_turbine_for_update(session, turbine_id)
+    output_buffer.discard([turbine_id])
     session.delete(turbine)
     session.commit()
+    entity_cache.invalidate_turbine(turbine_id)
+    drivetrain.invalidate(turbine_id)
+    spatial_index.remove(turbine_id)
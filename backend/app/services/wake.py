@@ -0,0 +1,260 @@
+"""Farm-level Jensen wake model.
+
+Positions are projected to a local east/north plane, candidate turbine pairs
+are found once (within a distance cutoff, in row blocks so the full N×N matrix
+never has to be held in memory) and then reused for any wind direction.
+Deficits follow the same top-hat formula as ``components.wake_deficit`` and
+are superposed per downstream turbine. Ct and Cp are the stored constants, or
+the BEM operating curves (``services/bem.py``) when those are passed in.
+"""
+import math
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+from sqlmodel import Session, select
+
+from app.models.turbine import Turbine
+from app.models.wake_model import WakeModel
+from app.services import bem, physics
+
+EARTH_RADIUS_M = 6_371_008.8
+SUPERPOSITION_RULES = ("rss", "linear", "max")
+# Jensen deficit at 50 D is ~2 % for Ct = 0.8, k = 0.04; pairs further apart are ignored.
+DEFAULT_CUTOFF_DIAMETERS = 50.0
+# Upper bound on the temporary pairwise block (elements), ~32 MB of float64.
+MAX_BLOCK_ELEMENTS = 4_000_000
+
+
+class PairGeometry(NamedTuple):
+    src: np.ndarray   # index of the (potentially) wake-casting turbine
+    dst: np.ndarray   # index of the turbine that may sit in its wake
+    dx_m: np.ndarray  # east offset dst − src
+    dy_m: np.ndarray  # north offset dst − src
+    n: int
+
+
+def project_positions(latitude: ArrayLike, longitude: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """Equirectangular projection to metres east/north of the farm centroid."""
+    lat = np.radians(np.asarray(latitude, dtype=np.float64))
+    lon = np.radians(np.asarray(longitude, dtype=np.float64))
+    if lat.size == 0:
+        return lat, lon
+    lat0 = lat.mean()
+    x = (lon - lon.mean()) * math.cos(lat0) * EARTH_RADIUS_M
+    y = (lat - lat0) * EARTH_RADIUS_M
+    return x, y
+
+
+def pair_geometry(x_m: ArrayLike, y_m: ArrayLike, max_distance_m: float) -> PairGeometry:
+    """All ordered pairs (src, dst), src ≠ dst, closer than ``max_distance_m``."""
+    x = np.asarray(x_m, dtype=np.float64)
+    y = np.asarray(y_m, dtype=np.float64)
+    n = x.size
+    block = max(1, MAX_BLOCK_ELEMENTS // max(n, 1))
+    cutoff2 = max_distance_m ** 2
+    parts = []
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        dx = x[None, :] - x[start:stop, None]
+        dy = y[None, :] - y[start:stop, None]
+        near = dx * dx + dy * dy <= cutoff2
+        near[np.arange(stop - start), np.arange(start, stop)] = False
+        rows, cols = np.nonzero(near)
+        parts.append((rows + start, cols, dx[rows, cols], dy[rows, cols]))
+    if not parts:
+        empty_i, empty_f = np.empty(0, dtype=np.intp), np.empty(0)
+        return PairGeometry(empty_i, empty_i, empty_f, empty_f, n)
+    src, dst, dx, dy = (np.concatenate(p) for p in zip(*parts))
+    return PairGeometry(src, dst, dx, dy, n)
+
+
+def pair_deficits(
+    geometry: PairGeometry,
+    wind_direction_deg: float,
+    rotor_diameter_m: np.ndarray,
+    thrust_coefficient: np.ndarray,
+    wake_decay_constant: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Jensen deficits for the pairs whose dst lies inside src's wake.
+
+    ``wind_direction_deg`` is the meteorological direction the wind blows
+    *from* (0 = north, 90 = east). Returns ``(src, dst, deficit)``.
+
+    ``wake_decay_constant`` is (n,) or, for one k per sample, broadcastable to
+    (m, n). The pairs are then those inside the widest of the sample wakes and
+    ``deficit`` is (m, pairs), zero where a sample's own wake misses dst.
+    """
+    theta = math.radians(wind_direction_deg)
+    # Unit vector the wind travels along, and its left-hand normal.
+    ux, uy = -math.sin(theta), -math.cos(theta)
+    downstream = geometry.dx_m * ux + geometry.dy_m * uy
+    crosswind = np.abs(geometry.dx_m * uy - geometry.dy_m * ux)
+
+    k = np.broadcast_to(wake_decay_constant, np.broadcast_shapes(np.shape(wake_decay_constant), (geometry.n,)))
+    D = rotor_diameter_m[geometry.src]
+    k_widest = k if k.ndim == 1 else k.max(axis=0)
+    wake_radius = D / 2 + k_widest[geometry.src] * downstream
+    waked = (downstream > 0) & (crosswind < wake_radius)
+
+    src, dst = geometry.src[waked], geometry.dst[waked]
+    D, k, x = D[waked], k[..., src], downstream[waked]
+    Ct = thrust_coefficient[src]
+    deficit = (1 - np.sqrt(1 - Ct)) * (D / (D + 2 * k * x)) ** 2
+    if k.ndim > 1:
+        deficit = np.where(crosswind[waked] < D / 2 + k * x, deficit, 0.0)
+    return src, dst, deficit
+
+
+def combine_deficits(dst: np.ndarray, deficit: np.ndarray, n: int, rule: str = "rss") -> np.ndarray:
+    """Superpose per-pair deficits onto each downstream turbine, clipped to [0, 1]."""
+    if rule == "rss":
+        combined = np.sqrt(np.bincount(dst, weights=deficit * deficit, minlength=n))
+    elif rule == "linear":
+        combined = np.bincount(dst, weights=deficit, minlength=n)
+    elif rule == "max":
+        combined = np.zeros(n)
+        np.maximum.at(combined, dst, deficit)
+    else:
+        raise ValueError(f"Unknown superposition rule {rule!r}; expected one of {SUPERPOSITION_RULES}")
+    return np.clip(combined, 0.0, 1.0)
+
+
+def wake_params(wakes: Sequence[Optional[WakeModel]]) -> dict[str, np.ndarray]:
+    """Ct and k per turbine; turbines without a WakeModel row use the model defaults."""
+    out = {}
+    for f in ("thrust_coefficient", "wake_decay_constant"):
+        default = WakeModel.model_fields[f].default
+        out[f] = np.array([getattr(w, f) if w is not None else default for w in wakes], dtype=np.float64)
+    return out
+
+
+def solve(
+    wind_speed_mps: float,
+    wind_direction_deg: float,
+    geometry: PairGeometry,
+    params: physics.PhysicsParams,
+    wakes: dict[str, np.ndarray],
+    superposition: str = "rss",
+    aero: Optional[bem.AeroCurves] = None,
+) -> dict[str, np.ndarray]:
+    """Effective wind speed and power at every turbine for one free-stream state.
+
+    Deficits are taken relative to the free stream and only turbines that are
+    operating at that speed cast a wake. With ``aero``, Ct comes from each
+    turbine's curve at the free-stream speed and Cp at its effective speed.
+    """
+    if aero is not None:
+        wakes = {**wakes, "thrust_coefficient": bem.thrust_coefficient(aero, wind_speed_mps)}
+    src, dst, deficit = pair_deficits(
+        geometry,
+        wind_direction_deg,
+        np.asarray(params["rotor_diameter_m"], dtype=np.float64),
+        wakes["thrust_coefficient"],
+        wakes["wake_decay_constant"],
+    )
+    operating = (wind_speed_mps >= params["cut_in_wind_speed_mps"]) & (
+        wind_speed_mps < params["cut_out_wind_speed_mps"]
+    )
+    keep = np.broadcast_to(operating, (geometry.n,))[src]
+    combined = combine_deficits(dst[keep], deficit[keep], geometry.n, superposition)
+    effective = wind_speed_mps * (1 - combined)
+    return {
+        "deficit": combined,
+        "effective_wind_speed_mps": effective,
+        "power_mw": physics.power_batch(effective, bem.at_speed(params, aero, effective)),
+        "freestream_power_mw": np.broadcast_to(
+            physics.power_batch(wind_speed_mps, bem.at_speed(params, aero, wind_speed_mps)), (geometry.n,)
+        ),
+        "src": src[keep],
+        "dst": dst[keep],
+    }
+
+
+# --- Farm ---
+
+def get_farm(session: Session) -> Tuple[List[Turbine], List[Optional[WakeModel]]]:
+    """Every turbine with its WakeModel (or None) from one outer-joined SELECT."""
+    rows = session.exec(
+        select(Turbine, WakeModel)
+        .outerjoin(WakeModel, WakeModel.turbine_id == Turbine.id)
+        .order_by(Turbine.id, WakeModel.id)
+    ).all()
+    turbines, wakes, seen = [], [], set()
+    for turbine, wake in rows:
+        if turbine.id in seen:
+            continue
+        seen.add(turbine.id)
+        turbines.append(turbine)
+        wakes.append(wake)
+    return turbines, wakes
+
+
+def farm_geometry(turbines: Sequence[Turbine], max_distance_m: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, PairGeometry]:
+    x, y = project_positions([t.latitude for t in turbines], [t.longitude for t in turbines])
+    if max_distance_m is None:
+        max_d = max((t.rotor_diameter_m for t in turbines), default=0.0)
+        max_distance_m = DEFAULT_CUTOFF_DIAMETERS * max_d
+    return x, y, pair_geometry(x, y, max_distance_m)
+
+
+def farm_wake(
+    turbines: Sequence[Turbine],
+    wakes: Sequence[Optional[WakeModel]],
+    wind_speed_mps: float,
+    wind_direction_deg: float,
+    superposition: str = "rss",
+    max_distance_m: Optional[float] = None,
+    surfaces: Optional[Sequence[bem.Surface]] = None,
+    fine_pitch_deg: Optional[Sequence[float]] = None,
+) -> dict:
+    """Wake-adjusted state of the farm returned by :func:`get_farm`.
+
+    ``surfaces`` (one per turbine, from ``bem.fleet_surfaces``) switches Cp and
+    Ct from the stored constants to the BEM operating curves, run no lower than
+    ``fine_pitch_deg`` (from ``bem.fleet_fine_pitch``).
+    """
+    x, y, geometry = farm_geometry(turbines, max_distance_m)
+    result = solve(
+        wind_speed_mps,
+        wind_direction_deg,
+        geometry,
+        physics.turbine_params(turbines),
+        wake_params(wakes),
+        superposition,
+        bem.fleet_curves(turbines, surfaces, fine_pitch_deg) if surfaces is not None else None,
+    )
+
+    ids = np.array([t.id for t in turbines], dtype=np.int64)
+    upstream: List[List[int]] = [[] for _ in turbines]
+    for s, d in zip(ids[result["src"]].tolist(), result["dst"].tolist()):
+        upstream[d].append(s)
+
+    total = float(result["power_mw"].sum())
+    total_free = float(result["freestream_power_mw"].sum())
+    columns = {
+        "x_m": x.tolist(),
+        "y_m": y.tolist(),
+        "effective_wind_speed_mps": result["effective_wind_speed_mps"].tolist(),
+        "speed_deficit_fraction": result["deficit"].tolist(),
+        "power_mw": result["power_mw"].tolist(),
+        "freestream_power_mw": result["freestream_power_mw"].tolist(),
+    }
+    return {
+        "wind_speed_mps": wind_speed_mps,
+        "wind_direction_deg": wind_direction_deg,
+        "superposition": superposition,
+        "aero": "bem" if surfaces is not None else "constant",
+        "total_power_mw": total,
+        "total_freestream_power_mw": total_free,
+        "wake_loss_fraction": 1 - total / total_free if total_free > 0 else 0.0,
+        "turbines": [
+            {
+                "turbine_id": t.id,
+                "name": t.name,
+                **{k: col[i] for k, col in columns.items()},
+                "upstream_turbine_ids": sorted(upstream[i]),
+            }
+            for i, t in enumerate(turbines)
+        ],
+    }
@@ -0,0 +1,61 @@
+"""Benchmark suite: ``python -m benchmarks [micro|http|all]`` from ``backend/``.
+
+Writes a JSON report (environment + per-benchmark throughput and p50/p95/p99
+latency) and, given ``--compare``, lists benchmarks whose p50 regressed
+against an earlier report::
+
+    python -m benchmarks all --output before.json
+    git checkout <branch>
+    python -m benchmarks all --output after.json --compare before.json --fail-on-regression
+
+The single-topic ``benchmarks/bench_*.py`` scripts remain for ad-hoc studies.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+# Before anything imports app.database.
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from benchmarks import harness  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("layer", nargs="?", choices=("micro", "http", "all"), default="all")
+    parser.add_argument("--output", "-o", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="Earlier JSON report to compare p50 latencies against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed p50 slow-down as a fraction")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds per benchmark")
+    parser.add_argument("--sizes", help="Comma-separated fleet sizes for the HTTP layer")
+    parser.add_argument("--only", default="", help="Run only benchmarks whose name contains this")
+    args = parser.parse_args()
+
+    results = {}
+    if args.layer in ("micro", "all"):
+        from benchmarks import suite_micro
+
+        results.update(suite_micro.run(args.min_time, args.only))
+    if args.layer in ("http", "all"):
+        from benchmarks import suite_http
+
+        sizes = tuple(int(s) for s in args.sizes.split(",")) if args.sizes else suite_http.FLEET_SIZES
+        results.update(suite_http.run(args.min_time, args.only, sizes))
+
+    harness.print_table(results)
+    report = harness.write_report(results, args.output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = harness.compare(json.load(f), report, args.threshold)
+        for line in regressions:
+            print("REGRESSION " + line, file=sys.stderr)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""AEP sweep (36 sectors × 30 speed bins) over a synthetic 300-turbine farm,
+in-process vs on the process pool.
+
+Run from ``backend/``::
+
+    PROCESS_POOL_WORKERS=8 python -m benchmarks.bench_aep [n_turbines]
+"""
+import sys
+import time
+
+import numpy as np
+
+from app.config import PROCESS_POOL_WORKERS
+from app.services import aep, wake
+from app.services.pool import get_process_pool, shutdown_process_pool
+
+
+def _farm(n: int):
+    rng = np.random.default_rng(0)
+    side = int(np.ceil(np.sqrt(n)))
+    gx, gy = np.meshgrid(np.arange(side), np.arange(side))
+    x = (gx.ravel()[:n] * 7 * 112.0) + rng.normal(0, 50, n)
+    y = (gy.ravel()[:n] * 5 * 112.0) + rng.normal(0, 50, n)
+    params = {
+        "capacity_mw": np.full(n, 2.0),
+        "rotor_diameter_m": np.full(n, 112.0),
+        "cut_in_wind_speed_mps": np.full(n, 3.0),
+        "cut_out_wind_speed_mps": np.full(n, 25.0),
+        "power_coefficient": np.full(n, 0.40),
+        "tip_speed_ratio": np.full(n, 8.0),
+        "air_density_kg_m3": np.full(n, 1.225),
+    }
+    wakes = {"thrust_coefficient": np.full(n, 0.8), "wake_decay_constant": np.full(n, 0.04)}
+    return wake.pair_geometry(x, y, 50 * 112.0), params, wakes
+
+
+def main(n: int = 300) -> None:
+    directions = np.arange(0.0, 360.0, 10.0)
+    rose = aep.wind_rose_from_weibull(directions, np.ones(36), np.full(36, 8.0), np.full(36, 2.0))
+
+    start = time.perf_counter()
+    geometry, params, wakes = _farm(n)
+    t_geom = time.perf_counter() - start
+
+    start = time.perf_counter()
+    serial = aep.compute_aep(rose, geometry, params, wakes, workers=1)
+    t_serial = time.perf_counter() - start
+
+    get_process_pool().submit(int).result()  # exclude worker spawn from the timing
+    start = time.perf_counter()
+    pooled = aep.compute_aep(rose, geometry, params, wakes)
+    t_pool = time.perf_counter() - start
+    shutdown_process_pool()
+
+    assert np.allclose(serial["net_mwh"], pooled["net_mwh"])
+    print(f"turbines / pairs:   {n} / {geometry.src.size:,}")
+    print(f"pair geometry:      {t_geom * 1e3:8.1f} ms")
+    print(f"in-process:         {t_serial * 1e3:8.1f} ms")
+    print(f"pool ({PROCESS_POOL_WORKERS} workers):   {t_pool * 1e3:8.1f} ms")
+    print(f"net AEP:            {serial['net_mwh'].sum():,.0f} MWh")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
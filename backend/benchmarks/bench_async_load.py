@@ -0,0 +1,123 @@
+"""Throughput and tail latency of the sync vs async database modes under load.
+
+Starts the API under uvicorn once per mode (DB_ASYNC=0/1) against the same
+temporary SQLite database, then drives it with N concurrent HTTP clients for a
+fixed duration. The entity cache is disabled so every request hits the database.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_async_load [--clients 200] [--duration 10]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import numpy as np
+
+SERVER = """
+import uvicorn
+from app.main import app
+uvicorn.run(app, host="127.0.0.1", port={port}, log_level="warning")
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _wait_ready(base: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{base}/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def _load(base: str, clients: int, duration: float) -> dict:
+    paths = ["/api/turbines/{id}", "/api/turbines/{id}/gearbox", "/api/turbines/{id}/tower", "/api/parameters/"]
+    latencies: list[float] = []
+    errors = 0
+    stop_at = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=30.0) as client:
+        async def worker(seed: int) -> None:
+            nonlocal errors
+            i = seed
+            while time.monotonic() < stop_at:
+                path = paths[i % len(paths)].format(id=i % 5 + 1)
+                i += 1
+                start = time.perf_counter()
+                try:
+                    r = await client.get(path)
+                    ok = r.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append(time.perf_counter() - start)
+                errors += not ok
+
+        start = time.monotonic()
+        await asyncio.gather(*(worker(i) for i in range(clients)))
+        elapsed = time.monotonic() - start
+
+    lat = np.array(latencies) * 1e3
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(lat, 50)),
+        "p95_ms": float(np.percentile(lat, 95)),
+        "p99_ms": float(np.percentile(lat, 99)),
+    }
+
+
+def run_mode(db_async: bool, database_url: str, clients: int, duration: float) -> dict:
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DB_ASYNC": "1" if db_async else "0",
+        "ENTITY_CACHE_ENABLED": "0",
+    }
+    proc = subprocess.Popen([sys.executable, "-c", SERVER.format(port=port)], env=env)
+    try:
+        base = f"http://127.0.0.1:{port}"
+        asyncio.run(_wait_ready(base))
+        return asyncio.run(_load(base, clients, duration))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+    print(f"{'mode':<6} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for db_async in (False, True):
+        r = run_mode(db_async, database_url, args.clients, args.duration)
+        mode = "async" if db_async else "sync"
+        print(
+            f"{mode:<6} {r['requests']:>9} {r['errors']:>7} {r['rps']:>8.0f} "
+            f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
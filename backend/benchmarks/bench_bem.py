@@ -0,0 +1,61 @@
+"""BEM surface build time, and the cost of BEM Cp/Ct in a fleet wake solve.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_bem [n_turbines] [n_designs]
+"""
+import sys
+import time
+
+import numpy as np
+
+from app.models.blade import Blade
+from app.models.turbine import Turbine
+from app.services import bem, physics, wake
+
+
+def _fleet(n: int) -> list[Turbine]:
+    rng = np.random.default_rng(0)
+    return [
+        Turbine(
+            id=i + 1, name=f"T-{i + 1}", latitude=55 + rng.uniform(0, 0.2), longitude=8 + rng.uniform(0, 0.3),
+            capacity_mw=3 + i % 3, rotor_diameter_m=112 + 7 * (i % 3), hub_height_m=90,
+            cut_in_wind_speed_mps=3, cut_out_wind_speed_mps=25, rated_wind_speed_mps=12,
+            power_coefficient=0.45, tip_speed_ratio=8, air_density_kg_m3=1.225,
+        )
+        for i in range(n)
+    ]
+
+
+def main(n: int = 10_000, designs: int = 5) -> None:
+    grid = bem.TSR_GRID.size * bem.PITCH_GRID_DEG.size
+    print(f"surface: {bem.TSR_GRID.size} λ × {bem.PITCH_GRID_DEG.size} β × {bem.STATIONS} stations ({grid * bem.STATIONS:,} elements)")
+    for family in bem.AIRFOILS:
+        blade = Blade(turbine_id=0, airfoil_family=family)
+        start = time.perf_counter()
+        surface = bem.solve_surface(blade)
+        elapsed = time.perf_counter() - start
+        print(f"  {family:<14} {elapsed * 1000:7.1f} ms  Cp max {surface.cp.max():.3f}")
+
+    # A fleet sharing a few blade designs: one surface per design, one curve per (design, rated speed).
+    turbines = _fleet(n)
+    unique = [bem.solve_surface(Blade(turbine_id=0, total_twist_deg=11 + d)) for d in range(designs)]
+    surfaces = [unique[i % designs] for i in range(n)]
+    start = time.perf_counter()
+    curves = bem.fleet_curves(turbines, surfaces)
+    print(f"{n} turbines, {designs} designs: fleet_curves {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    _, _, geometry = wake.farm_geometry(turbines)
+    params = physics.turbine_params(turbines)
+    wakes = wake.wake_params([None] * n)
+    for label, aero in (("constant Cp/Ct", None), ("BEM Cp/Ct", curves)):
+        start = time.perf_counter()
+        runs = 10
+        for v in np.linspace(5, 15, runs):
+            result = wake.solve(v, 270.0, geometry, params, wakes, "rss", aero)
+        per_solve = (time.perf_counter() - start) / runs
+        print(f"  wake.solve, {label:<15} {per_solve * 1000:7.1f} ms  farm power at 15 m/s {result['power_mw'].sum():.0f} MW")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
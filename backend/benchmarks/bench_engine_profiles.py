@@ -0,0 +1,126 @@
+"""Read and write throughput of the SQLite engine profiles in ``config.ENGINE_PROFILES``.
+
+Each profile gets a fresh database file and runs:
+
+* single-row commits (one INSERT per transaction — dominated by fsync),
+* batched commits (1 000-row executemany per transaction),
+* primary-key reads,
+* a mixed phase: reader threads plus one committing writer for a fixed time.
+
+``debug`` logs every statement; its output goes to /dev/null so the number
+shows the logging overhead rather than terminal speed.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_engine_profiles [rows]
+"""
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel
+
+from app import database
+from app.config import ENGINE_PROFILES
+from app.models import TelemetrySample
+
+MIXED_READERS = 4
+MIXED_SECONDS = 3.0
+BATCH = 1_000
+
+
+def _row(i: int) -> dict:
+    return {
+        "turbine_id": i % 50 + 1,
+        "timestamp": datetime.fromtimestamp(1_767_225_600 + i, tz=timezone.utc),
+        "output_mw": 1.5,
+        "wind_speed_mps": 9.2,
+    }
+
+
+def _silence(*loggers: logging.Logger) -> None:
+    devnull = logging.StreamHandler(open(os.devnull, "w"))
+    for log in loggers:
+        log.handlers = [devnull]
+
+
+def run_profile(name: str, rows: int) -> dict:
+    url = "sqlite:///" + os.path.join(tempfile.mkdtemp(), f"{name}.db")
+    engine = database.make_engine(url, ENGINE_PROFILES[name])
+    _silence(logging.getLogger("sqlalchemy.engine.Engine"), database.logger)
+    SQLModel.metadata.create_all(engine, tables=[TelemetrySample.__table__])
+    result = {}
+
+    single = min(rows, 2_000)
+    start = time.perf_counter()
+    with Session(engine) as session:
+        for i in range(single):
+            session.exec(insert(TelemetrySample).values(**_row(i)))
+            session.commit()
+    result["single_commit_rows_s"] = single / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with Session(engine) as session:
+        for lo in range(single, single + rows, BATCH):
+            session.exec(insert(TelemetrySample), params=[_row(i) for i in range(lo, min(lo + BATCH, single + rows))])
+            session.commit()
+    result["batched_rows_s"] = rows / (time.perf_counter() - start)
+
+    total = single + rows
+    start = time.perf_counter()
+    with Session(engine) as session:
+        for i in range(rows):
+            session.get(TelemetrySample, i % total + 1)
+            session.expunge_all()
+    result["pk_reads_s"] = rows / (time.perf_counter() - start)
+
+    stop = time.monotonic() + MIXED_SECONDS
+    reads, writes = [0] * MIXED_READERS, [0]
+
+    def reader(slot: int) -> None:
+        with Session(engine) as session:
+            i = slot
+            while time.monotonic() < stop:
+                session.get(TelemetrySample, i % total + 1)
+                session.expunge_all()
+                session.rollback()
+                reads[slot] += 1
+                i += 7919
+
+    def writer() -> None:
+        with Session(engine) as session:
+            i = total
+            while time.monotonic() < stop:
+                session.exec(insert(TelemetrySample).values(**_row(i)))
+                session.commit()
+                writes[0] += 1
+                i += 1
+
+    threads = [threading.Thread(target=reader, args=(k,)) for k in range(MIXED_READERS)]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    result["mixed_reads_s"] = sum(reads) / MIXED_SECONDS
+    result["mixed_writes_s"] = writes[0] / MIXED_SECONDS
+
+    engine.dispose()
+    return result
+
+
+def main(rows: int = 20_000) -> None:
+    columns = ("single_commit_rows_s", "batched_rows_s", "pk_reads_s", "mixed_reads_s", "mixed_writes_s")
+    print(f"{'profile':<8}" + "".join(f"{c:>22}" for c in columns))
+    for name in ENGINE_PROFILES:
+        r = run_profile(name, rows)
+        print(f"{name:<8}" + "".join(f"{r[c]:>22,.0f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
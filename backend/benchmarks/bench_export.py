@@ -0,0 +1,51 @@
+"""Throughput and peak Python memory of the streaming exports.
+
+The generators behind the export endpoints are drained directly (the test
+client buffers whole responses, which would hide the streaming). Peak memory
+(tracemalloc) should stay roughly constant as the fleet grows.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_export [size ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from app.database import create_db_and_tables  # noqa: E402
+from app.services import export  # noqa: E402
+from benchmarks.harness import grow_to  # noqa: E402
+
+CASES = {
+    "turbines ndjson": lambda: export.ndjson(export.turbine_rows(components=False)),
+    "turbines+comp ndjson": lambda: export.ndjson(export.turbine_rows(components=True)),
+    "turbines+physics csv": lambda: export.csv_text(
+        export.turbine_rows(False, 10.0), export.turbine_columns(False, 10.0)
+    ),
+    "sweep ndjson": lambda: export.ndjson(export.sweep_rows(0.0, 30.0, 1.0)),
+}
+
+
+def main(sizes: list[int]) -> None:
+    create_db_and_tables()
+    print(f"{'turbines':>8}  {'case':<22} {'s':>7} {'MB out':>8} {'peak MB':>8}")
+    for size in sizes:
+        grow_to(size)
+        for case, body in CASES.items():
+            start = time.perf_counter()
+            nbytes = sum(len(chunk) for chunk in body())
+            elapsed = time.perf_counter() - start
+            # Second, traced pass: tracemalloc slows everything down several-fold.
+            tracemalloc.start()
+            sum(len(chunk) for chunk in body())
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{size:>8}  {case:<22} {elapsed:>7.2f} {nbytes / 1e6:>8.1f} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 50_000])
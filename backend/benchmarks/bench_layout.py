@@ -0,0 +1,49 @@
+"""Layout search quality and speed: random search vs the genetic algorithm, both refined.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_layout [n_turbines] [generations]
+"""
+import sys
+import time
+
+import numpy as np
+
+from app.models.turbine import Turbine
+from app.services import aep, layout
+
+SITE_LAT = [55.0, 55.0, 55.03, 55.03]
+SITE_LON = [8.0, 8.06, 8.06, 8.0]
+POPULATION = 32
+
+
+def main(n: int = 25, generations: int = 40) -> None:
+    template = Turbine(name="", latitude=0.0, longitude=0.0, capacity_mw=3.0, rotor_diameter_m=112.0)
+    site = layout.make_site(SITE_LAT, SITE_LON, 4 * template.rotor_diameter_m)
+    # Prevailing south-westerlies.
+    rose = aep.wind_rose_from_weibull(
+        list(range(0, 360, 30)), [3, 3, 3, 3, 5, 10, 15, 20, 15, 10, 7, 6], [8.5] * 12, [2.1] * 12
+    )
+    problem = layout.make_problem(site, rose, template, n)
+    baseline = problem.evaluate([layout.random_layout(np.random.default_rng(0), site, n) for _ in range(POPULATION)])
+    print(f"{n} turbines, {rose.frequencies.size} wind-rose bins, mean random layout {baseline.mean():,.0f} MWh")
+    print(f"{'algorithm':>10} {'evaluations':>12} {'s':>8} {'ms/eval':>8} {'net MWh':>12} {'vs random':>10}")
+    for algorithm in ("random", "genetic"):
+        count = [0]
+
+        def progress(phase: str, evaluations: int, best: float) -> None:
+            count[0] = evaluations
+
+        rng = np.random.default_rng(0)
+        start = time.perf_counter()
+        xy, score = layout.search(problem, rng, algorithm, POPULATION, generations, progress)
+        xy, score = layout.refine(problem, rng, xy, score, 2, progress, count[0])
+        elapsed = time.perf_counter() - start
+        print(
+            f"{algorithm:>10} {count[0]:>12} {elapsed:>8.2f} {elapsed / count[0] * 1000:>8.2f} "
+            f"{score:>12,.0f} {score / baseline.mean() - 1:>+10.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,48 @@
+"""Monte Carlo AEP throughput on a 12-sector Weibull rose, single worker vs the pool.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_montecarlo [n_turbines] [samples]
+"""
+import sys
+import time
+
+import numpy as np
+
+from app.config import PROCESS_POOL_WORKERS
+from app.models.turbine import Turbine
+from app.services import aep, montecarlo, physics, wake
+
+
+def _fleet(n: int) -> list[Turbine]:
+    rng = np.random.default_rng(0)
+    return [
+        Turbine(
+            id=i + 1, name=f"T-{i + 1}", latitude=55 + rng.uniform(0, 0.05), longitude=8 + rng.uniform(0, 0.08),
+            capacity_mw=3 + i % 3, rotor_diameter_m=112 + 7 * (i % 3), hub_height_m=90,
+            cut_in_wind_speed_mps=3, cut_out_wind_speed_mps=25, rated_wind_speed_mps=12,
+            power_coefficient=0.45, tip_speed_ratio=8, air_density_kg_m3=1.225,
+        )
+        for i in range(n)
+    ]
+
+
+def main(n: int = 100, samples: int = 10_000) -> None:
+    turbines = _fleet(n)
+    rose = aep.wind_rose_from_weibull(list(range(0, 360, 30)), [1 / 12] * 12, [8.5] * 12, [2.1] * 12)
+    _, _, geometry = wake.farm_geometry(turbines)
+    params = physics.turbine_params(turbines)
+    wakes = wake.wake_params([None] * n)
+    u = montecarlo.Uncertainty()
+    print(f"{n} turbines, {samples:,} samples, {rose.frequencies.size} wind-rose bins")
+    print(f"{'workers':>8} {'s':>8} {'samples/s':>10} {'P50 MWh':>12} {'P90 MWh':>12}")
+    for workers in sorted({1, PROCESS_POOL_WORKERS}):
+        start = time.perf_counter()
+        energy = montecarlo.simulate(rose, geometry, params, wakes, u, samples, seed=0, workers=workers)["energy_mwh"]
+        elapsed = time.perf_counter() - start
+        p50, p90 = montecarlo.exceedance(energy, 0.5), montecarlo.exceedance(energy, 0.9)
+        print(f"{workers:>8} {elapsed:>8.2f} {samples / elapsed:>10.0f} {p50:>12.0f} {p90:>12.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,68 @@
+"""Scalar vs batch physics at 10^6 wind-speed samples.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_physics_batch [n_samples]
+"""
+import sys
+import time
+
+import numpy as np
+
+from app.models.turbine import Turbine
+from app.services import physics
+
+
+def _turbine() -> Turbine:
+    return Turbine(
+        name="bench", latitude=0.0, longitude=0.0, capacity_mw=2.0,
+        rotor_diameter_m=112.0, cut_in_wind_speed_mps=3.0, cut_out_wind_speed_mps=25.0,
+        power_coefficient=0.40, tip_speed_ratio=8.0, air_density_kg_m3=1.18,
+    )
+
+
+def _scalar_loop(speeds: list[float], turbine: Turbine) -> list[float]:
+    """The pre-batch implementation: one ``math`` evaluation per sample."""
+    import math
+
+    out = []
+    A = math.pi * (turbine.rotor_diameter_m / 2) ** 2
+    for v in speeds:
+        if v < turbine.cut_in_wind_speed_mps or v >= turbine.cut_out_wind_speed_mps:
+            out.append(0.0)
+            continue
+        p = 0.5 * turbine.air_density_kg_m3 * A * v ** 3 * turbine.power_coefficient / 1_000_000
+        out.append(min(p, turbine.capacity_mw))
+    return out
+
+
+def main(n: int = 1_000_000) -> None:
+    turbine = _turbine()
+    rng = np.random.default_rng(0)
+    speeds = rng.weibull(2.0, n) * 9.0
+
+    start = time.perf_counter()
+    _scalar_loop(speeds.tolist(), turbine)
+    t_loop = time.perf_counter() - start
+
+    # The public scalar wrappers go through numpy per call; time a slice and scale.
+    sample = speeds[: min(n, 20_000)].tolist()
+    start = time.perf_counter()
+    for v in sample:
+        physics.actual_power_mw(v, turbine)
+    t_wrapper = (time.perf_counter() - start) * n / len(sample)
+
+    params = physics.turbine_params(turbine)
+    start = time.perf_counter()
+    physics.compute_batch(speeds, params)
+    t_batch = time.perf_counter() - start
+
+    print(f"samples:                    {n:>12,}")
+    print(f"python loop (power only):   {t_loop * 1e3:>10.1f} ms")
+    print(f"scalar wrapper (est.):      {t_wrapper * 1e3:>10.1f} ms")
+    print(f"compute_batch (all fields): {t_batch * 1e3:>10.1f} ms")
+    print(f"speedup vs python loop:     {t_loop / t_batch:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,63 @@
+"""Pitch simulation throughput: one batched fleet run vs one run per turbine.
+
+Ten minutes of IEC-style turbulence at 20 Hz with an extreme operating gust.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_pitch [max_turbines]
+"""
+import sys
+import time
+
+from app.models.turbine import Turbine
+from app.services import pitch
+
+DURATION_S = 600.0
+DT_S = 0.05
+
+
+def _fleet(n: int) -> list[Turbine]:
+    return [
+        Turbine(
+            id=i + 1, name=f"T-{i + 1}", latitude=0, longitude=0, capacity_mw=2 + i % 3,
+            rotor_diameter_m=100 + 10 * (i % 4), hub_height_m=90, cut_in_wind_speed_mps=3,
+            cut_out_wind_speed_mps=25, rated_wind_speed_mps=12, power_coefficient=0.42,
+            tip_speed_ratio=8, air_density_kg_m3=1.225,
+        )
+        for i in range(n)
+    ]
+
+
+def _run(turbines: list[Turbine]) -> dict:
+    n = len(turbines)
+    return pitch.simulate(
+        turbines, [None] * n, [None] * n, 15.0, 0.16, DURATION_S, DT_S, seed=0,
+        gust=pitch.Gust(12.0, DURATION_S / 2),
+    )
+
+
+def main(max_turbines: int = 1_000) -> None:
+    steps = int(DURATION_S / DT_S)
+    print(f"{DURATION_S:.0f} s at {1 / DT_S:.0f} Hz ({steps:,} steps)")
+    print(f"{'turbines':>9} {'batched s':>10} {'M turbine-steps/s':>18} {'per-turbine s':>14} {'max overspeed':>14}")
+    n = 1
+    while n <= max_turbines:
+        turbines = _fleet(n)
+        start = time.perf_counter()
+        result = _run(turbines)
+        batched = time.perf_counter() - start
+
+        # One simulation per turbine, timed on a sample and extrapolated.
+        sample = turbines[: min(n, 3)]
+        start = time.perf_counter()
+        for t in sample:
+            _run([t])
+        per_turbine = (time.perf_counter() - start) / len(sample) * n
+
+        overspeed = max(r["max_overspeed_fraction"] for r in result["turbines"])
+        print(f"{n:>9} {batched:>10.2f} {n * steps / batched / 1e6:>18.2f} {per_turbine:>14.1f} {overspeed:>13.1%}")
+        n *= 10
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
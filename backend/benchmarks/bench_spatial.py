@@ -0,0 +1,71 @@
+"""Grid index vs brute-force haversine for nearest / radius / bbox queries.
+
+Uses a synthetic fleet: a few dense farms plus turbines scattered over Europe.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_spatial [n_turbines]
+"""
+import sys
+import time
+
+import numpy as np
+
+from app.services.spatial import GridIndex, haversine_m
+
+QUERIES = 2_000
+
+
+def _fleet(n: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    lat = rng.uniform(35, 60, n)
+    lon = rng.uniform(-10, 30, n)
+    farms = n // 5
+    centres = rng.integers(0, n, 20)
+    lat[:farms] = lat[centres].repeat(farms // 20 + 1)[:farms] + rng.normal(0, 0.1, farms)
+    lon[:farms] = lon[centres].repeat(farms // 20 + 1)[:farms] + rng.normal(0, 0.1, farms)
+    return lat, lon
+
+
+def _per_query_us(fn, points) -> float:
+    start = time.perf_counter()
+    for la, lo in points:
+        fn(la, lo)
+    return (time.perf_counter() - start) / len(points) * 1e6
+
+
+def main(n: int = 100_000) -> None:
+    rng = np.random.default_rng(0)
+    lat, lon = _fleet(n, rng)
+    ids = np.arange(1, n + 1)
+    start = time.perf_counter()
+    grid = GridIndex.build(ids, lat, lon)
+    print(f"{n} turbines, index built in {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    # Half the queries at turbines (dense areas), half anywhere.
+    at = rng.integers(0, n, QUERIES // 2)
+    points = list(zip(np.r_[lat[at], rng.uniform(35, 60, QUERIES // 2)], np.r_[lon[at], rng.uniform(-10, 30, QUERIES // 2)]))
+
+    def brute_nearest(la, lo):
+        d = haversine_m(la, lo, lat, lon)
+        return ids[np.argpartition(d, 10)[:10]]
+
+    def brute_radius(la, lo):
+        return ids[haversine_m(la, lo, lat, lon) <= 5_000]
+
+    def brute_bbox(la, lo):
+        return ids[(lat >= la - 0.05) & (lat <= la + 0.05) & (lon >= lo - 0.1) & (lon <= lo + 0.1)]
+
+    cases = [
+        ("nearest k=10", lambda la, lo: grid.nearest(la, lo, 10), brute_nearest),
+        ("radius 5 km", lambda la, lo: grid.radius(la, lo, 5_000), brute_radius),
+        ("bbox 0.1x0.2 deg", lambda la, lo: grid.bbox(lo - 0.1, la - 0.05, lo + 0.1, la + 0.05), brute_bbox),
+    ]
+    print(f"{'query':<18} {'grid us':>9} {'brute us':>9} {'speed-up':>9}")
+    for name, fast, slow in cases:
+        g = _per_query_us(fast, points)
+        b = _per_query_us(slow, points[:200])
+        print(f"{name:<18} {g:>9.1f} {b:>9.1f} {b / g:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
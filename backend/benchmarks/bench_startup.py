@@ -0,0 +1,69 @@
+"""Startup time: ``import app.main`` and the lifespan (schema check + seeding).
+
+Each measurement runs in a fresh interpreter against the same database, so
+the first boot seeds an empty database and the following ones take the
+version-marker fast path. With ``--max-import-ms`` / ``--max-lifespan-ms`` the
+script exits non-zero when the warm boot exceeds the budget, for use in CI.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_startup [--boots 5] [--max-lifespan-ms 500]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROBE = """
+import asyncio, json, time
+start = time.perf_counter()
+from app.main import app, lifespan
+imported = time.perf_counter()
+
+async def boot():
+    async with lifespan(app):
+        return time.perf_counter()
+
+ready = asyncio.run(boot())
+print(json.dumps({"import_ms": (imported - start) * 1e3, "lifespan_ms": (ready - imported) * 1e3}))
+"""
+
+
+def boot(database_url: str) -> dict:
+    env = {**os.environ, "DATABASE_URL": database_url}
+    out = subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boots", type=int, default=5)
+    parser.add_argument("--database-url", default=None, help="Defaults to a fresh SQLite file")
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-lifespan-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+    cold = boot(url)
+    warm = [boot(url) for _ in range(args.boots)]
+    warm_import = statistics.median(w["import_ms"] for w in warm)
+    warm_lifespan = statistics.median(w["lifespan_ms"] for w in warm)
+
+    print(f"{'boot':<16} {'import ms':>10} {'lifespan ms':>12}")
+    print(f"{'cold (seeding)':<16} {cold['import_ms']:>10.1f} {cold['lifespan_ms']:>12.1f}")
+    print(f"{'warm (median)':<16} {warm_import:>10.1f} {warm_lifespan:>12.1f}")
+
+    failed = []
+    if args.max_import_ms is not None and warm_import > args.max_import_ms:
+        failed.append(f"import {warm_import:.1f} ms > {args.max_import_ms} ms")
+    if args.max_lifespan_ms is not None and warm_lifespan > args.max_lifespan_ms:
+        failed.append(f"lifespan {warm_lifespan:.1f} ms > {args.max_lifespan_ms} ms")
+    if failed:
+        sys.exit("startup budget exceeded: " + "; ".join(failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Telemetry ingestion throughput through the HTTP endpoint (NDJSON stream).
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_telemetry [n_samples]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+
+def _ndjson(n: int, turbine_ids: list[int]) -> bytes:
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    lines = []
+    for i in range(n):
+        lines.append(json.dumps({
+            "turbine_id": turbine_ids[i % len(turbine_ids)],
+            "timestamp": (t0 + timedelta(seconds=i // len(turbine_ids))).isoformat(),
+            "output_mw": 1.5,
+            "wind_speed_mps": 9.2,
+        }))
+    return ("\n".join(lines) + "\n").encode()
+
+
+def main(n: int = 100_000) -> None:
+    with TestClient(app) as client:
+        ids = [t["id"] for t in client.get("/api/turbines/", params={"fields": "name", "limit": 1000}).json()]
+        body = _ndjson(n, ids)
+        start = time.perf_counter()
+        r = client.post("/api/telemetry/", content=body, headers={"content-type": "application/x-ndjson"})
+        elapsed = time.perf_counter() - start
+    r.raise_for_status()
+    print(f"samples:    {r.json()['accepted']:,} in {r.json()['batches']} batches")
+    print(f"elapsed:    {elapsed:.2f} s")
+    print(f"throughput: {n / elapsed:,.0f} samples/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
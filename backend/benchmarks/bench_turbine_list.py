@@ -0,0 +1,51 @@
+"""Latency and payload size of GET /api/turbines/ as the table grows.
+
+For each table size the first page, a page deep into the table (via its
+cursor), a filtered page and a two-column projection are timed.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_turbine_list [size ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from benchmarks.harness import grow_to  # noqa: E402
+
+REPEAT = 20
+
+
+def _time(client: TestClient, params: dict) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        r = client.get("/api/turbines/", params=params)
+    return (time.perf_counter() - start) / REPEAT * 1e3, len(r.content)
+
+
+def main(sizes: list[int]) -> None:
+    cases = {
+        "first page": {"limit": 100},
+        "deep page": {"cursor": None},
+        "filtered": {"min_capacity_mw": 8, "bbox": "7.0,54.0,7.01,55.0"},
+        "projected": {"fields": "name,capacity_mw", "limit": 1000},
+    }
+    with TestClient(app) as client:
+        print(f"{'rows':>8}  {'case':<11} {'ms':>8} {'bytes':>9}")
+        for size in sizes:
+            grow_to(size)
+            for case, params in cases.items():
+                if "cursor" in params:
+                    params = {"cursor": size * 9 // 10}
+                ms, nbytes = _time(client, params)
+                print(f"{size:>8}  {case:<11} {ms:>8.2f} {nbytes:>9}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,93 @@
+"""Yaw simulation throughput: a synthetic 1 Hz wind-direction year for a fleet.
+
+Also times a per-sample Python loop of the same controller on one day and
+extrapolates it, for comparison.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_yaw [n_turbines] [days]
+"""
+import math
+import sys
+import time
+
+import numpy as np
+
+from app.models.turbine import Turbine
+from app.models.yaw_system import YawSystem
+from app.services import yaw
+
+
+def _series(samples: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    # Slow random walk in mean direction plus 3° turbulence; Weibull(k=2) speeds.
+    direction = (200 + np.cumsum(rng.normal(0, 0.15, samples)) + rng.normal(0, 3, samples)) % 360
+    speed = rng.weibull(2.0, samples) * 9.0
+    return direction, speed
+
+
+def _fleet(n: int) -> list[Turbine]:
+    return [
+        Turbine(
+            id=i + 1, name=f"T-{i + 1}", latitude=0, longitude=0, capacity_mw=3 + i % 3,
+            rotor_diameter_m=100 + 10 * (i % 4), hub_height_m=90, cut_in_wind_speed_mps=3,
+            cut_out_wind_speed_mps=25, rated_wind_speed_mps=12, power_coefficient=0.45,
+            tip_speed_ratio=7, air_density_kg_m3=1.225,
+        )
+        for i in range(n)
+    ]
+
+
+def _python_loop(direction: np.ndarray, threshold: float, step: float, width: int) -> float:
+    """Per-sample reference controller; returns the summed cos² loss factor."""
+    unwrapped, filtered = (a.tolist() for a in yaw.DirectionFilter(width)(direction))
+    h, sign, lost = filtered[0], 0, 0.0
+    for k in range(direction.size):
+        if sign == 0 and abs(filtered[k] - h) > threshold:
+            sign = 1 if filtered[k] > h else -1
+        if sign != 0 and sign * (filtered[k] - h) <= 0:
+            sign = 0
+        c = math.cos(math.radians(unwrapped[k] - h))
+        lost += 1 - (c * c if c > 0 else 0.0)
+        if sign != 0:
+            h += sign * step
+    return lost
+
+
+def main(n: int = 100, days: int = 365) -> None:
+    rng = np.random.default_rng(0)
+    turbines = _fleet(n)
+    samples = days * 86_400
+    direction, speed = _series(samples, rng)
+
+    cases = [
+        ("default controller", [None] * n),
+        ("10 distinct controllers", [
+            YawSystem(turbine_id=t.id, activation_threshold_deg=3 + i % 10, yaw_rate_deg_per_s=0.3 + 0.1 * (i % 5))
+            for i, t in enumerate(turbines)
+        ]),
+    ]
+    print(f"{n} turbines, {days} days at 1 Hz ({samples:,} samples)")
+    for label, yaws in cases:
+        start = time.perf_counter()
+        sim = yaw.YawSimulation(turbines, yaws)
+        for s in range(0, samples, yaw.CHUNK_SAMPLES):
+            sim.feed(direction[s:s + yaw.CHUNK_SAMPLES], speed[s:s + yaw.CHUNK_SAMPLES])
+        result = sim.result()
+        elapsed = time.perf_counter() - start
+        row = result["turbines"][0]
+        print(
+            f"  {label:<24} {elapsed:6.2f} s  {samples / elapsed / 1e6:5.1f} M samples/s  "
+            f"loss {result['yaw_loss_fraction']:.3%}  T-1: {row['yaw_events']} events, "
+            f"{row['yawing_time_s'] / 3600:.1f} h yawing"
+        )
+
+    day = direction[:86_400]
+    start = time.perf_counter()
+    _python_loop(day, 5.0, 0.5, 60)
+    per_day = time.perf_counter() - start
+    print(f"  per-sample Python loop   {per_day * days:6.1f} s  (one controller, no power integration, extrapolated from one day)")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,127 @@
+"""Timing, reporting, comparison and fixture helpers for the benchmark suite."""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+import numpy as np
+
+
+def measure(
+    fn: Callable[[], object],
+    *,
+    min_time_s: float = 1.0,
+    max_iterations: int = 100_000,
+    warmup: int = 10,
+    items: int = 1,
+) -> dict:
+    """Call ``fn`` repeatedly and summarise per-call latency.
+
+    Runs at least ``min_time_s`` (but no more than ``max_iterations`` calls).
+    ``items`` is the number of elements one call processes (e.g. the batch
+    size), so ``items_per_s`` is comparable between scalar and batch variants.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    deadline = time.perf_counter() + min_time_s
+    while len(samples) < max_iterations and (len(samples) < 5 or time.perf_counter() < deadline):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    us = np.asarray(samples, dtype=np.float64) / 1e3
+    p50, p95, p99 = np.percentile(us, [50, 95, 99])
+    mean = float(us.mean())
+    return {
+        "iterations": len(samples),
+        "items_per_call": items,
+        "ops_per_s": 1e6 / mean,
+        "items_per_s": items * 1e6 / mean,
+        "mean_us": mean,
+        "p50_us": float(p50),
+        "p95_us": float(p95),
+        "p99_us": float(p99),
+    }
+
+
+def grow_to(size: int) -> None:
+    """Bulk-insert synthetic turbines (no components) until the table holds ``size`` rows.
+
+    The app is imported here rather than at module level so callers can point
+    DATABASE_URL at a temporary database before the engine is created.
+    """
+    from sqlalchemy import func, insert
+    from sqlmodel import Session, select
+
+    from app.database import engine
+    from app.models import Turbine
+
+    with Session(engine) as session:
+        have = session.exec(select(func.count()).select_from(Turbine)).one()
+        rows = [
+            {
+                "name": f"B-{i:06d}",
+                "latitude": 54.0 + (i % 1000) * 0.001,
+                "longitude": 7.0 + (i // 1000) * 0.001,
+                "capacity_mw": 2.0 + i % 7,
+            }
+            for i in range(have, size)
+        ]
+        if rows:
+            session.exec(insert(Turbine), params=rows)
+            session.commit()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def environment() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_report(results: dict, path: Optional[str]) -> dict:
+    report = {"environment": environment(), "results": results}
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if path:
+        with open(path, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+
+def print_table(results: dict) -> None:
+    width = max((len(k) for k in results), default=10)
+    print(f"{'benchmark':<{width}} {'ops/s':>12} {'p50 us':>10} {'p95 us':>10} {'p99 us':>10}", file=sys.stderr)
+    for name, r in results.items():
+        print(
+            f"{name:<{width}} {r['ops_per_s']:>12,.0f} {r['p50_us']:>10.1f} {r['p95_us']:>10.1f} {r['p99_us']:>10.1f}",
+            file=sys.stderr,
+        )
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> list[str]:
+    """Benchmarks whose p50 latency grew by more than ``threshold`` (a fraction) over the baseline."""
+    regressions = []
+    old, new = baseline["results"], current["results"]
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name]["p50_us"], new[name]["p50_us"]
+        if before > 0 and after > before * (1 + threshold):
+            regressions.append(f"{name}: p50 {before:.1f} -> {after:.1f} us (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
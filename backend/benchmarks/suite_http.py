@@ -0,0 +1,80 @@
+"""In-process HTTP benchmarks against the FastAPI app at several fleet sizes.
+
+Requests go through ``TestClient`` (full routing, validation and
+serialisation, no network). Turbines plus all seven components are
+bulk-inserted into a temporary SQLite database, growing it to each fleet size
+in turn. Per-turbine routes cycle through random ids, so with the entity
+cache on the hit ratio falls as the fleet grows.
+"""
+import itertools
+import os
+import tempfile
+from typing import Callable
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app import seed  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmarks.harness import grow_to, measure  # noqa: E402
+
+FLEET_SIZES = (100, 1_000, 10_000)
+
+# name -> (path template, query params); "{id}" is replaced per request.
+ROUTES = {
+    "GET /api/turbines/": ("/api/turbines/", {}),
+    "GET /api/turbines/?fields": ("/api/turbines/", {"fields": "name,capacity_mw", "limit": 1000}),
+    "GET /api/turbines/{id}": ("/api/turbines/{id}", {}),
+    "GET /api/turbines/{id}/physics": ("/api/turbines/{id}/physics", {"wind_speed": 10}),
+    "GET /api/turbines/physics": ("/api/turbines/physics", {"wind_speed": 10}),
+    "GET /api/turbines/{id}/full": ("/api/turbines/{id}/full", {}),
+    "GET /api/turbines/{id}/gearbox": ("/api/turbines/{id}/gearbox", {}),
+    "GET /api/turbines/{id}/generator": ("/api/turbines/{id}/generator", {}),
+    "GET /api/turbines/{id}/blade": ("/api/turbines/{id}/blade", {}),
+    "GET /api/turbines/{id}/pitch-system": ("/api/turbines/{id}/pitch-system", {}),
+    "GET /api/turbines/{id}/yaw-system": ("/api/turbines/{id}/yaw-system", {}),
+    "GET /api/turbines/{id}/tower": ("/api/turbines/{id}/tower", {}),
+    "GET /api/turbines/{id}/wake-model": ("/api/turbines/{id}/wake-model", {}),
+    "GET /api/turbines/{id}/yaw-system/power-loss": ("/api/turbines/{id}/yaw-system/power-loss", {"yaw_error_deg": 7.5}),
+    "GET /api/turbines/{id}/tower/frequency-check": ("/api/turbines/{id}/tower/frequency-check", {"wind_speed": 10}),
+    "GET /api/turbines/{id}/wake-model/deficit": ("/api/turbines/{id}/wake-model/deficit", {"distance_m": 500, "wind_speed": 10}),
+}
+
+
+def _grow_fleet(size: int) -> None:
+    grow_to(size)
+    with Session(engine) as session:
+        seed.seed_components(session)
+        session.commit()
+
+
+def _request(client: TestClient, path: str, params: dict, ids) -> Callable[[], httpx.Response]:
+    if "{id}" not in path:
+        def call():
+            r = client.get(path, params=params)
+            r.raise_for_status()
+            return r
+    else:
+        def call():
+            r = client.get(path.format(id=next(ids)), params=params)
+            r.raise_for_status()
+            return r
+    return call
+
+
+def run(min_time_s: float = 1.0, only: str = "", sizes=FLEET_SIZES) -> dict:
+    results = {}
+    with TestClient(app) as client:
+        for size in sizes:
+            _grow_fleet(size)
+            ids = itertools.cycle(np.random.default_rng(size).integers(1, size + 1, 10_000).tolist())
+            for name, (path, params) in ROUTES.items():
+                key = f"http[{size}].{name}"
+                if only in key:
+                    results[key] = measure(_request(client, path, params, ids), min_time_s=min_time_s, warmup=3)
+    return results
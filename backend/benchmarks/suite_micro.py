@@ -0,0 +1,45 @@
+"""Micro-benchmarks for the physics kernels, scalar and batch."""
+import numpy as np
+
+from app.models.tower import Tower
+from app.models.turbine import Turbine
+from app.models.wake_model import WakeModel
+from app.services import bem, components, physics
+from benchmarks.harness import measure
+
+BATCH_SIZES = (1_000, 100_000)
+
+
+def cases() -> dict:
+    turbine = Turbine(name="bench", latitude=0.0, longitude=0.0, capacity_mw=2.0)
+    tower = Tower(turbine_id=1)
+    wake = WakeModel(turbine_id=1)
+    params = physics.turbine_params(turbine)
+    rng = np.random.default_rng(0)
+
+    out = {
+        "physics.compute": (lambda: physics.compute(10.0, turbine), 1),
+        "physics.actual_power_mw": (lambda: physics.actual_power_mw(10.0, turbine), 1),
+        "components.wake_deficit": (lambda: components.wake_deficit(wake, 500.0, 10.0, 112.0), 1),
+        "components.tower_frequency_check": (lambda: components.tower_frequency_check(tower, 112.0, 8.0, 10.0), 1),
+        "components.yaw_power_loss": (lambda: components.yaw_power_loss(7.5), 1),
+    }
+    surface = bem.solve_surface(None)
+    out["bem.solve_surface"] = (lambda: bem.solve_surface(None), 1)
+    for n in BATCH_SIZES:
+        speeds = rng.uniform(0, 30, n)
+        fleet = physics.turbine_params([turbine] * n)
+        out[f"physics.power_batch[{n}]"] = (lambda s=speeds: physics.power_batch(s, params), n)
+        out[f"physics.compute_batch[{n}]"] = (lambda s=speeds: physics.compute_batch(s, params), n)
+        out[f"physics.compute_batch.fleet[{n}]"] = (lambda s=speeds, f=fleet: physics.compute_batch(s, f), n)
+        curves = bem.fleet_curves([turbine] * n, [surface] * n)
+        out[f"bem.power_coefficient[{n}]"] = (lambda s=speeds, c=curves: bem.power_coefficient(c, s), n)
+    return out
+
+
+def run(min_time_s: float = 1.0, only: str = "") -> dict:
+    return {
+        f"micro.{name}": measure(fn, min_time_s=min_time_s, items=items)
+        for name, (fn, items) in cases().items()
+        if only in name
+    }
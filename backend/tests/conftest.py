@@ -0,0 +1,27 @@
+import os
+import tempfile
+
+# Point the app at a throwaway database before anything imports app.config.
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["DB_SQLITE_BUSY_TIMEOUT_MS"] = "2000"
+
+import pytest  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app.database import create_db_and_tables, engine  # noqa: E402
+from app.models.turbine import Turbine  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _tables():
+    create_db_and_tables()
+
+
+@pytest.fixture
+def turbine() -> Turbine:
+    with Session(engine) as session:
+        turbine = Turbine(name="T-test", latitude=55.0, longitude=8.0, capacity_mw=3.0)
+        session.add(turbine)
+        session.commit()
+        session.refresh(turbine)
+        return turbine
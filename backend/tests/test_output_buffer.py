@@ -0,0 +1,57 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlmodel import Session
+
+from app.database import engine
+from app.models.turbine import Turbine
+from app.schemas.telemetry import TelemetryIn
+from app.services import output_buffer as output_buffer_module
+from app.services import telemetry
+from app.services.output_buffer import output_buffer
+
+
+def test_ingest_alongside_in_flight_flush(turbine, monkeypatch):
+    """An ingest must not wait on a flush while holding the row locks that flush needs."""
+    output_buffer.put(turbine.id, 1.0)
+    go = threading.Event()
+    real_session = output_buffer_module.Session
+
+    def gated_session(*args, **kwargs):
+        go.wait(5)
+        return real_session(*args, **kwargs)
+
+    monkeypatch.setattr(output_buffer_module, "Session", gated_session)
+    flush_errors = []
+
+    def flush():
+        try:
+            output_buffer.flush()
+        except Exception as exc:
+            flush_errors.append(exc)
+
+    flusher = threading.Thread(target=flush)
+    flusher.start()  # holds the flush lock, then waits for `go` before writing
+    while not output_buffer._flush_lock.locked():
+        time.sleep(0.001)
+
+    sample = TelemetryIn(turbine_id=turbine.id, timestamp=datetime.now(timezone.utc), output_mw=2.5)
+    ingested = []
+
+    def ingest_batch():
+        with Session(engine) as session:
+            ingested.append(telemetry.ingest_batch(session, [sample]))
+
+    ingest = threading.Thread(target=ingest_batch)
+    ingest.start()
+    time.sleep(0.2)  # let the ingest reach discard()
+    go.set()
+    ingest.join(10)
+    flusher.join(10)
+
+    assert not flush_errors
+    assert ingested == [[turbine.id]]
+    assert output_buffer.get(turbine.id) is None
+    with Session(engine) as session:
+        assert session.get(Turbine, turbine.id).current_output_mw == 2.5
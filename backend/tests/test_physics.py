@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from app.models.turbine import Turbine
+from app.services import physics
+
+
+def _fleet(rng: np.random.Generator, n: int) -> list[Turbine]:
+    return [
+        Turbine(
+            id=i + 1,
+            name=f"T-{i}",
+            latitude=55.0,
+            longitude=8.0,
+            capacity_mw=float(rng.uniform(1.5, 15.0)),
+            rotor_diameter_m=float(rng.uniform(60.0, 240.0)),
+            cut_in_wind_speed_mps=float(rng.uniform(2.0, 4.5)),
+            cut_out_wind_speed_mps=float(rng.uniform(20.0, 30.0)),
+            power_coefficient=float(rng.uniform(0.3, 0.5)),
+            tip_speed_ratio=float(rng.uniform(6.0, 10.0)),
+            air_density_kg_m3=float(rng.uniform(1.1, 1.3)),
+        )
+        for i in range(n)
+    ]
+
+
+def _speeds(rng: np.random.Generator, turbine: Turbine) -> list[float]:
+    cut_in, cut_out = turbine.cut_in_wind_speed_mps, turbine.cut_out_wind_speed_mps
+    edges = [0.0, cut_in, np.nextafter(cut_in, 0.0), cut_out, np.nextafter(cut_out, 0.0)]
+    return [float(v) for v in edges] + rng.uniform(0.0, 35.0, 20).tolist()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compute_matches_batch(seed):
+    """The scalar wrapper and both vectorised paths agree bit for bit, edges included."""
+    rng = np.random.default_rng(seed)
+    fleet = _fleet(rng, 8)
+    params = physics.turbine_params(fleet)
+    for i, turbine in enumerate(fleet):
+        speeds = _speeds(rng, turbine)
+        batch = physics.compute_batch(np.array(speeds), physics.turbine_params(turbine))
+        for j, v in enumerate(speeds):
+            assert physics.compute(v, turbine) == {k: float(col[j]) for k, col in batch.items()}
+        # The same speeds against the whole fleet's parameter columns.
+        grid = physics.compute_batch(np.array(speeds)[:, None], params)
+        assert {k: col[:, i].tolist() for k, col in grid.items()} == {k: col.tolist() for k, col in batch.items()}
+
+    speeds = [_speeds(rng, t)[seed] for t in fleet]
+    rows = physics.compute_fleet(fleet, speeds)["turbines"]
+    for turbine, v, row in zip(fleet, speeds, rows):
+        assert {k: row[k] for k in physics.compute(v, turbine)} == physics.compute(v, turbine)
+
+
+def test_cut_in_and_cut_out_edges():
+    turbine = _fleet(np.random.default_rng(0), 1)[0]
+    cut_in, cut_out = turbine.cut_in_wind_speed_mps, turbine.cut_out_wind_speed_mps
+    assert physics.compute(np.nextafter(cut_in, 0.0), turbine)["power_mw"] == 0.0
+    assert physics.compute(cut_in, turbine)["power_mw"] > 0.0
+    assert physics.compute(np.nextafter(cut_out, 0.0), turbine)["power_mw"] > 0.0
+    assert physics.compute(cut_out, turbine)["power_mw"] == 0.0